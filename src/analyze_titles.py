@@ -6,6 +6,8 @@ import re
 from typing import List, Tuple, Optional, Dict, Set
 import logging
 
+from html_parser import css_select, make_soup
+
 class JobPostingSelectorAnalyzer:
     """채용공고 선택자 분석기 (공유 캐시 기능 추가)"""
     
@@ -215,7 +217,7 @@ class JobPostingSelectorAnalyzer:
     def _validate_selector(self, soup: BeautifulSoup, selector: str) -> Optional[List[str]]:
         """기존 선택자의 유효성을 검사합니다."""
         try:
-            elements = soup.select(selector)
+            elements = css_select(soup, selector)
             if not elements:
                 return None
             
@@ -299,7 +301,7 @@ class JobPostingSelectorAnalyzer:
             full_selector = f"{container_selector} {pattern}"
             try:
                 # 선택자 검증
-                elements = soup.select(full_selector)
+                elements = css_select(soup, full_selector)
                 titles = [elem.get_text(strip=True) for elem in elements]
                 # 채용공고만 필터링
                 valid_titles = [t for t in titles if self._is_potential_job_posting(t) and len(t) > 10]
@@ -465,7 +467,7 @@ class JobPostingSelectorAnalyzer:
         
         final_selector_candidates = Counter()
         try:
-            for element in soup.select(f"{container_tag}{container_classes} > {best_child_selector}"):
+            for element in css_select(soup, f"{container_tag}{container_classes} > {best_child_selector}"):
                 for p_elem in element.find_all(['p', 'strong', 'h2', 'h3', 'h4', 'div']):
                      if p_elem.get('class'):
                          cls = '.' + '.'.join(p_elem.get('class'))
@@ -481,7 +483,7 @@ class JobPostingSelectorAnalyzer:
             for selector, count in final_selector_candidates.most_common():
                 if count < 2: continue
                 try:
-                    texts = [elem.get_text(strip=True) for elem in soup.select(selector)]
+                    texts = [elem.get_text(strip=True) for elem in css_select(soup, selector)]
                     if not texts: continue
                     
                     valid_texts = [t for t in texts if 10 < len(t) < 150]
@@ -567,7 +569,7 @@ class JobPostingSelectorAnalyzer:
         def validate_job_selector(selector, soup):
             """선택자가 실제 채용공고를 가져오는지 검증"""
             try:
-                elements = soup.select(selector)
+                elements = css_select(soup, selector)
                 if not elements:
                     return None, []
 
@@ -657,7 +659,7 @@ class ConfigManager:
             
             try:
                 with open(html_file_path, 'r', encoding='utf-8') as f:
-                    soup = BeautifulSoup(f, 'html.parser')
+                    soup = make_soup(f.read(), os.getenv('HTML_PARSER', 'html.parser'))
                 
                 # 1단계: 이번 실행에서 검증된 공유 캐시 확인
                 is_cached = False
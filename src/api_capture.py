@@ -0,0 +1,205 @@
+import json
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from hydration import resolve_path, walk_lists
+from parse_worker import normalize_titles
+from state_store import JsonStateStore
+
+# 캡처할 최대 JSON 응답 크기
+MAX_CAPTURE_BYTES = 2 * 1024 * 1024
+
+# 직접 호출 시 재사용할 요청 헤더 (쿠키/인증 헤더는 만료되므로 저장하지 않음)
+REPLAY_HEADERS = {'accept', 'content-type', 'x-requested-with'}
+
+# 정적 재시험 결과가 이전 결과와 같다고 볼 최소 일치율
+# (API 결과는 그대로 회사의 공고 목록이 되므로 학습/검증 시 렌더링 결과와 완전히 같아야 함)
+AGREEMENT_THRESHOLD = 0.8
+
+# 연속으로 이 횟수만큼 직접 호출이 실패하면 엔드포인트를 버림
+MAX_CONSECUTIVE_FAILURES = 3
+
+
+def title_agreement(a: Set[str], b: Set[str]) -> float:
+    """두 제목 집합의 자카드 유사도"""
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def find_matching_path(payload: Any, titles: Set[str]) -> Optional[str]:
+    """JSON 안에서 값 목록이 렌더링으로 얻은 제목 목록과 완전히 같은 경로를 찾습니다 (제목 정리 규칙은 선택자 경로와 같음)."""
+    for list_path, items in walk_lists(payload):
+        candidates = {}
+        if any(isinstance(item, str) for item in items):
+            candidates['.'.join(list_path + ('*',))] = items
+        keys = {key for item in items[:20] if isinstance(item, dict) for key, value in item.items() if isinstance(value, str)}
+        for key in keys:
+            candidates['.'.join(list_path + ('*', key))] = [item.get(key) for item in items if isinstance(item, dict)]
+        for path, values in candidates.items():
+            if set(normalize_titles(values)) == titles:
+                return path
+    return None
+
+
+class ApiEndpointCapture:
+    """렌더링 중 XHR/fetch JSON 응답을 기록하고, 채용공고 목록을 담은 엔드포인트를 URL별로 학습합니다.
+
+    학습한 엔드포인트(data/api_endpoints.json)는 다음 실행부터 HTTP로 직접 호출하여 브라우저를 생략하며,
+    호출이 실패하거나 주기적 검증에서 렌더링 결과와 다르면 렌더링으로 되돌아갑니다.
+    """
+
+    def __init__(self, path: str, verify_days: float = 3):
+        self.store = JsonStateStore(path)
+        self.verify_days = verify_days
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._captured: Dict[str, List[Tuple[Dict[str, Any], Any]]] = {}  # URL별 이번 렌더링의 JSON 응답
+        self._pending_verification: Dict[str, List[str]] = {}  # URL별 검증 대기 중인 API 결과
+
+    # ---- 렌더링 중 캡처 ----
+
+    @staticmethod
+    def _is_candidate(response) -> bool:
+        try:
+            if response.request.resource_type not in ('xhr', 'fetch') or response.status != 200:
+                return False
+            return 'json' in (response.headers.get('content-type') or '')
+        except Exception:
+            return False
+
+    @staticmethod
+    def _request_info(response) -> Dict[str, Any]:
+        request = response.request
+        return {
+            'method': request.method,
+            'url': request.url,
+            'post_data': request.post_data,
+            'headers': {name: value for name, value in request.headers.items() if name.lower() in REPLAY_HEADERS},
+        }
+
+    def attach(self, page) -> list:
+        """페이지에 응답 리스너를 설치하고, 후보 응답이 쌓일 리스트를 반환합니다."""
+        responses = []
+        page.on('response', lambda response: responses.append(response) if self._is_candidate(response) else None)
+        return responses
+
+    def record(self, url: str, responses: list):
+        """sync Playwright 응답들의 본문을 읽어 저장합니다 (페이지를 닫기 전에 호출)."""
+        captured = []
+        for response in responses:
+            try:
+                captured.append((self._request_info(response), self._parse(response.body())))
+            except Exception:
+                continue
+        self._store_captured(url, captured)
+
+    async def record_async(self, url: str, responses: list):
+        """async Playwright 버전의 record()"""
+        captured = []
+        for response in responses:
+            try:
+                captured.append((self._request_info(response), self._parse(await response.body())))
+            except Exception:
+                continue
+        self._store_captured(url, captured)
+
+    @staticmethod
+    def _parse(body: bytes) -> Any:
+        if len(body) > MAX_CAPTURE_BYTES:
+            raise ValueError('응답이 너무 큼')
+        return json.loads(body)
+
+    def _store_captured(self, url: str, captured: list):
+        with self._lock:
+            self._captured[url] = captured
+
+    # ---- 학습 및 검증 ----
+
+    def learn(self, url: str, job_titles: List[str]):
+        """렌더링으로 얻은 제목과 캡처한 응답을 비교하여 엔드포인트를 학습하거나 검증합니다."""
+        with self._lock:
+            captured = self._captured.pop(url, [])
+            pending = self._pending_verification.pop(url, None)
+        titles = set(job_titles)
+        if not titles:
+            return
+
+        entry = self.store.get(url)
+        if entry and pending is not None:
+            if set(pending) == titles:
+                self.store.update(url, verified_at=time.time(), failures=0)
+            else:
+                agreement = title_agreement(set(pending), titles)
+                self.logger.warning(f"  - API 결과가 렌더링 결과와 다름 (일치율 {agreement:.0%}), 엔드포인트 폐기: {entry['endpoint']['url']}")
+                self.store.delete(url)
+                entry = None
+
+        if entry:
+            return
+        for request_info, payload in captured:
+            path = find_matching_path(payload, titles)
+            if path:
+                self.store.set(url, {
+                    'endpoint': request_info,
+                    'path': path,
+                    'verified_at': time.time(),
+                    'failures': 0,
+                })
+                self.logger.info(f"  - 채용공고 API 발견: {request_info['method']} {request_info['url']} -> {path}")
+                return
+
+    # ---- 직접 호출 ----
+
+    def has_endpoint(self, url: str) -> bool:
+        return bool(self.store.get(url))
+
+    def needs_verification(self, url: str) -> bool:
+        entry = self.store.get(url) or {}
+        return time.time() - entry.get('verified_at', 0) > self.verify_days * 86400
+
+    def fetch_titles(self, url: str, session_pool, rate_limiter=None, timeout: int = 20) -> Optional[List[str]]:
+        """저장된 엔드포인트를 직접 호출하여 제목 목록을 반환합니다. 실패하면 None을 반환합니다."""
+        entry = self.store.get(url)
+        if not entry:
+            return None
+        endpoint = entry['endpoint']
+        titles = None
+        try:
+            if rate_limiter:
+                rate_limiter.acquire(endpoint['url'])
+            headers = dict(endpoint.get('headers') or {})
+            headers['Referer'] = url
+            response, text = session_pool.fetch_text(
+                endpoint['url'], method=endpoint['method'], data=endpoint.get('post_data'), headers=headers, timeout=timeout
+            )
+            response.raise_for_status()
+            values = resolve_path(json.loads(text), entry['path'])
+            titles = sorted(normalize_titles(values)) or None
+        except Exception as e:
+            self.logger.warning(f"  - 채용공고 API 직접 호출 실패: {endpoint['url']} - {type(e).__name__}: {e}")
+
+        if titles is None:
+            failures = entry.get('failures', 0) + 1
+            if failures >= MAX_CONSECUTIVE_FAILURES:
+                self.logger.warning(f"  - 채용공고 API {failures}회 연속 실패, 엔드포인트 폐기: {endpoint['url']}")
+                self.store.delete(url)
+            else:
+                self.store.update(url, failures=failures)
+        elif entry.get('failures'):
+            self.store.update(url, failures=0)
+        return titles
+
+    def expect_verification(self, url: str, api_titles: List[str]):
+        """이번 실행에서 렌더링 결과와 비교할 API 결과를 등록합니다."""
+        with self._lock:
+            self._pending_verification[url] = api_titles
+
+    def finish_batch(self):
+        """렌더링되지 않은 URL의 캡처 데이터를 버리고 상태를 저장합니다."""
+        with self._lock:
+            self._captured.clear()
+            self._pending_verification.clear()
+        self.store.save()
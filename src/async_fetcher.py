@@ -0,0 +1,136 @@
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Optional
+
+import aiohttp
+
+from http_session import ResponseBodyLimiter, decode_body
+from url_rewrite import UrlRewriter
+
+
+def run_coroutine(coro):
+    """코루틴을 실행합니다. 이미 실행 중인 이벤트 루프가 있으면 별도 스레드에서 실행합니다."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    box = {}
+
+    def target():
+        box['result'] = asyncio.run(coro)
+
+    thread = threading.Thread(target=target)
+    thread.start()
+    thread.join()
+    return box['result']
+
+
+@dataclass
+class FetchResult:
+    """정적 페이지 수집 결과"""
+    url: str
+    html: Optional[str] = None
+    status: Optional[int] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+    error: Optional[str] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.html is not None
+
+
+class AsyncFetchEngine:
+    """aiohttp 기반 정적 페이지 비동기 수집기 (전역/호스트별 동시 연결 수 제한)"""
+
+    def __init__(self, max_concurrency: int = 200, per_host_concurrency: int = 4, timeout: int = 20, verify_ssl: bool = False, rate_limiter=None,
+                 body_limiter: Optional[ResponseBodyLimiter] = None, url_rewriter: Optional[UrlRewriter] = None, latency=None):
+        self.max_concurrency = max_concurrency
+        self.per_host_concurrency = per_host_concurrency
+        self.timeout = timeout
+        self.verify_ssl = verify_ssl
+        self.rate_limiter = rate_limiter  # HostRateLimiter (선택)
+        self.body_limiter = body_limiter or ResponseBodyLimiter()
+        self.url_rewriter = url_rewriter or UrlRewriter()
+        self.latency = latency  # HostLatencyTracker (선택, 없으면 모든 요청에 timeout 사용)
+        self.logger = logging.getLogger(__name__)
+
+    def fetch_all(self, urls: Iterable[str], headers_for: Optional[Callable[[str], Dict[str, str]]] = None) -> Dict[str, FetchResult]:
+        """URL 목록을 동시에 수집하여 URL별 결과를 반환합니다."""
+        urls = list(dict.fromkeys(urls))  # 순서를 유지하며 중복 제거
+        if not urls:
+            return {}
+
+        start = time.time()
+        results = run_coroutine(self._fetch_all(urls, headers_for))
+        success = sum(1 for r in results.values() if r.ok)
+        self.logger.info(f"비동기 정적 수집 완료: 성공 {success}개, 실패 {len(results) - success}개 ({time.time() - start:.1f}초)")
+        return results
+
+    async def _fetch_all(self, urls, headers_for) -> Dict[str, FetchResult]:
+        connector = aiohttp.TCPConnector(
+            limit=self.max_concurrency,
+            limit_per_host=self.per_host_concurrency,
+            ssl=None if self.verify_ssl else False,
+            ttl_dns_cache=300,
+        )
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        # 연결 풀 외에 대기 중인 태스크 수도 제한하여 메모리 사용량을 억제
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        budgets = {url: self.latency.timeout_for(url, 'static') if self.latency else self.timeout for url in urls}
+
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            tasks = [self._fetch_one(session, semaphore, url, headers_for(url) if headers_for else {}, budgets[url]) for url in urls]
+            results = {result.url: result for result in await asyncio.gather(*tasks)}
+
+            # 평소보다 짧은 제한 시간을 넘긴 요청은 다른 요청이 끝난 뒤 전체 제한 시간으로 한 번 더 시도
+            retry_urls = [url for url, result in results.items() if result.error == 'timeout' and budgets[url] < self.timeout]
+            if retry_urls:
+                self.logger.info(f"적응형 제한 시간 초과 {len(retry_urls)}개, 전체 제한 시간({self.timeout}초)으로 재시도")
+                tasks = [self._fetch_one(session, semaphore, url, headers_for(url) if headers_for else {}, self.timeout) for url in retry_urls]
+                for result in await asyncio.gather(*tasks):
+                    results[result.url] = result
+                    self.latency.note_budget_timeout()
+        return results
+
+    async def _fetch_one(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, url: str, headers: Dict[str, str],
+                         timeout: Optional[float] = None) -> FetchResult:
+        # 속도 제한 대기는 동시성 슬롯을 잡기 전에 수행하여 다른 호스트 요청을 막지 않음
+        if self.rate_limiter:
+            await self.rate_limiter.acquire_async(url)
+
+        async with semaphore:
+            start = time.time()
+            try:
+                request_timeout = aiohttp.ClientTimeout(total=timeout) if timeout else None
+                async with session.get(self.url_rewriter(url), headers=headers, allow_redirects=True, timeout=request_timeout) as response:
+                    response_headers = dict(response.headers)
+                    if response.status == 304:
+                        return FetchResult(url, status=response.status, headers=response_headers, elapsed=time.time() - start)
+                    if response.status >= 400:
+                        self.logger.error(f"크롤링용 HTML 가져오기 실패 (HTTP {response.status}): {url}")
+                        return FetchResult(url, status=response.status, headers=response_headers, error=f"HTTP {response.status}", elapsed=time.time() - start)
+
+                    # 본문은 청크 단위로 최대 크기까지만 읽음
+                    body = await self.body_limiter.collect_async(response.content.iter_chunked(self.body_limiter.chunk_size), url)
+                    html = decode_body(body, response.headers.get('Content-Type'))
+                    elapsed = time.time() - start
+                    if self.latency:
+                        self.latency.record(url, elapsed, 'static')
+                    return FetchResult(url, html=html, status=response.status, headers=response_headers, elapsed=elapsed)
+
+            except asyncio.TimeoutError:
+                # 적응형 제한 시간 초과는 뒤에서 다시 시도하므로 경고로만 남김
+                log = self.logger.warning if timeout and timeout < self.timeout else self.logger.error
+                log(f"크롤링용 HTML 가져오기 실패 (타임아웃 {timeout or self.timeout}초): {url}")
+                return FetchResult(url, error='timeout', elapsed=time.time() - start)
+            except aiohttp.ClientConnectorError as e:
+                self.logger.error(f"크롤링용 HTML 가져오기 실패 (연결 오류): {url} - {str(e)}")
+                return FetchResult(url, error=f"연결 오류: {e}", elapsed=time.time() - start)
+            except Exception as e:
+                self.logger.error(f"크롤링용 HTML 가져오기 실패 (기타 오류): {url} - {type(e).__name__}: {str(e)}")
+                return FetchResult(url, error=f"{type(e).__name__}: {e}", elapsed=time.time() - start)
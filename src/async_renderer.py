@@ -0,0 +1,124 @@
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional, Tuple
+
+from playwright.async_api import async_playwright
+
+from async_fetcher import FetchResult, run_coroutine
+from browser_pool import PLAYWRIGHT_LAUNCH_ARGS
+from url_rewrite import UrlRewriter
+
+
+class AsyncRenderEngine:
+    """async Playwright 기반 동시 렌더링 엔진
+
+    하나의 이벤트 루프에서 소수의 브라우저가 여러 개의 격리된 BrowserContext/Page를 동시에 처리합니다.
+    동시에 열리는 페이지 수는 page_concurrency로 제한됩니다.
+    """
+
+    def __init__(self, browsers: int = 1, page_concurrency: int = 8, goto_timeout_ms: int = 20000, max_retries: int = 2,
+                 render_profiles=None, readiness=None, rate_limiter=None, launch_args=None, url_rewriter: Optional[UrlRewriter] = None,
+                 api_capture=None, latency=None):
+        self.browsers = max(1, browsers)
+        self.page_concurrency = max(1, page_concurrency)
+        self.goto_timeout_ms = goto_timeout_ms
+        self.max_retries = max_retries
+        self.render_profiles = render_profiles  # RenderProfileRegistry (선택)
+        self.readiness = readiness  # RenderReadinessDetector (선택)
+        self.rate_limiter = rate_limiter  # HostRateLimiter (선택)
+        self.launch_args = launch_args or PLAYWRIGHT_LAUNCH_ARGS
+        self.url_rewriter = url_rewriter or UrlRewriter()
+        self.api_capture = api_capture  # ApiEndpointCapture (선택)
+        self.latency = latency  # HostLatencyTracker (선택, 없으면 모든 페이지에 goto_timeout_ms 사용)
+        self.logger = logging.getLogger(__name__)
+
+    def render_all(self, jobs: List[Tuple[str, Optional[str], Optional[str]]]) -> Dict[str, FetchResult]:
+        """(url, selector, render_profile) 목록을 동시에 렌더링하여 URL별 결과를 반환합니다."""
+        unique_jobs = list({url: (url, selector, profile) for url, selector, profile in jobs}.values())
+        if not unique_jobs:
+            return {}
+
+        start = time.time()
+        results = run_coroutine(self._render_all(unique_jobs))
+        success = sum(1 for r in results.values() if r.ok)
+        self.logger.info(f"비동기 렌더링 완료: 성공 {success}개, 실패 {len(results) - success}개 "
+                         f"({time.time() - start:.1f}초, 브라우저 {self.browsers}개, 동시 페이지 {self.page_concurrency}개)")
+        return results
+
+    async def _render_all(self, jobs) -> Dict[str, FetchResult]:
+        semaphore = asyncio.Semaphore(self.page_concurrency)
+        async with async_playwright() as playwright:
+            browsers = []
+            try:
+                for _ in range(self.browsers):
+                    browsers.append(await playwright.chromium.launch(headless=True, args=self.launch_args))
+                self.logger.info(f"Playwright 브라우저 {len(browsers)}개 실행 성공 (비동기)")
+
+                tasks = [
+                    self._render_one(browsers[i % len(browsers)], semaphore, url, selector, profile)
+                    for i, (url, selector, profile) in enumerate(jobs)
+                ]
+                # 작업 하나의 예외가 배치 전체를 실패로 만들지 않도록 URL별로 결과를 받음
+                outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+                rendered = [
+                    outcome if isinstance(outcome, FetchResult)
+                    else FetchResult(url, error=f"{type(outcome).__name__}: {outcome}")
+                    for (url, _, _), outcome in zip(jobs, outcomes)
+                ]
+            except Exception as e:
+                self.logger.error(f"Playwright 브라우저 실행 실패: {e}")
+                return {url: FetchResult(url, error=f"브라우저 실행 실패: {e}") for url, _, _ in jobs}
+            finally:
+                for browser in browsers:
+                    try:
+                        await browser.close()
+                    except Exception:
+                        pass
+        return {result.url: result for result in rendered}
+
+    async def _render_one(self, browser, semaphore: asyncio.Semaphore, url: str, selector: Optional[str], profile: Optional[str]) -> FetchResult:
+        start = time.time()
+        goto_timeout_ms = self.goto_timeout_ms
+        if self.latency:
+            goto_timeout_ms = min(self.goto_timeout_ms, int(self.latency.timeout_for(url, 'render') * 1000))
+
+        for attempt in range(self.max_retries):
+            if self.rate_limiter:
+                await self.rate_limiter.acquire_async(url)
+
+            # 재시도 전에 슬롯을 반납하여 멈춘 페이지가 다른 페이지의 렌더링을 막지 않게 함
+            async with semaphore:
+                context = None
+                try:
+                    context = await browser.new_context()
+                    if self.render_profiles:
+                        await self.render_profiles.resolve(profile).apply_async(context)
+                    page = await context.new_page()
+                    responses = self.api_capture.attach(page) if self.api_capture else None
+                    goto_start = time.time()
+                    await page.goto(self.url_rewriter(url), timeout=goto_timeout_ms)
+                    if self.latency:
+                        self.latency.record(url, time.time() - goto_start, 'render')
+                    if self.readiness:
+                        await self.readiness.wait_async(page, url, selector)
+                    html = await page.content()
+                    if responses is not None:
+                        await self.api_capture.record_async(url, responses)
+                    return FetchResult(url, html=html, status=200, elapsed=time.time() - start)
+
+                except Exception as e:
+                    if "timeout" in str(e).lower() and attempt < self.max_retries - 1:
+                        self.logger.warning(f"페이지 로드 타임아웃 ({attempt + 1}/{self.max_retries}, {goto_timeout_ms / 1000:.1f}초): {url} - 재시도 중...")
+                        if goto_timeout_ms < self.goto_timeout_ms:
+                            self.latency.note_budget_timeout()
+                        goto_timeout_ms = self.goto_timeout_ms
+                        continue
+                    self.logger.error(f"크롤링용 HTML 가져오기 실패 (렌더링 오류): {url} - {type(e).__name__}: {str(e)}")
+                    return FetchResult(url, error=f"{type(e).__name__}: {e}", elapsed=time.time() - start)
+                finally:
+                    if context is not None:
+                        try:
+                            await context.close()
+                        except Exception:
+                            pass
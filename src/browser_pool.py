@@ -0,0 +1,261 @@
+import concurrent.futures
+import logging
+import queue
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from playwright.sync_api import sync_playwright
+
+try:
+    import psutil
+except ImportError:  # psutil이 없으면 페이지 수 기준으로만 재시작
+    psutil = None
+
+PLAYWRIGHT_LAUNCH_ARGS = [
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-web-security",
+    "--disable-features=VizDisplayCompositor",
+    "--ignore-certificate-errors",
+    "--ignore-ssl-errors",
+    "--ignore-certificate-errors-spki-list"
+]
+
+# 렌더링 제한 시간에 더하는 여유 (브라우저 실행, 컨텍스트 생성/정리)
+JOB_TIMEOUT_MARGIN_SECONDS = 30
+
+
+def memory_bounded_size(requested: int, per_browser_mb: int, usable_ratio: float = 0.7) -> int:
+    """사용 가능한 메모리로 동시에 띄울 수 있는 브라우저 수까지 요청한 수를 줄입니다 (최소 1)."""
+    if psutil is None:
+        return max(1, requested)
+    available_mb = psutil.virtual_memory().available / (1024 * 1024)
+    return max(1, min(requested, int(available_mb * usable_ratio // max(1, per_browser_mb))))
+
+
+class _BrowserSlot:
+    """전용 스레드 하나가 소유하는 Playwright 인스턴스와 브라우저"""
+
+    def __init__(self, playwright, browser, driver_pids):
+        self.playwright = playwright
+        self.browser = browser
+        self.driver_pids = driver_pids
+        self.pages_served = 0
+        self.killed = False  # 시간 초과로 강제 종료됨
+
+
+class _Job:
+    """브라우저 스레드에 맡긴 작업 하나"""
+
+    def __init__(self, fn: Callable[[Any], Any]):
+        self.fn = fn
+        self.future = concurrent.futures.Future()
+        self.started = threading.Event()
+        self.slot: Optional[_BrowserSlot] = None
+
+
+class PlaywrightBrowserPool:
+    """재사용 가능한 Playwright 브라우저 풀
+
+    sync Playwright 객체는 생성한 스레드에서만 사용할 수 있으므로 브라우저마다 전용 스레드를 두고,
+    워커 스레드는 run()으로 작업을 맡긴 뒤 결과를 돌려받습니다. 작업마다 새 BrowserContext를 대여하고
+    반납하며, 브라우저는 처리한 페이지 수나 메모리 사용량이 한도를 넘으면 재시작됩니다.
+    제한 시간 안에 끝나지 않은 작업은 브라우저를 강제 종료하여 스레드가 새 브라우저로 다음 작업을 받게 합니다.
+    """
+
+    def __init__(self, size: int = 2, max_pages_per_browser: int = 50, max_memory_mb: int = 1024, launch_args=None):
+        self.size = max(1, size)
+        self.max_pages_per_browser = max_pages_per_browser
+        self.max_memory_mb = max_memory_mb
+        self.launch_args = launch_args or PLAYWRIGHT_LAUNCH_ARGS
+        self.logger = logging.getLogger(__name__)
+
+        self._jobs = queue.Queue()
+        self._threads = []
+        self._lock = threading.Lock()
+        self._launch_lock = threading.Lock()  # 드라이버 프로세스 식별을 위해 실행은 순차적으로
+        self._stats = {'launches': 0, 'recycles': 0, 'pages': 0, 'timeouts': 0}
+
+    def run(self, fn: Callable[[Any], Any], timeout: Optional[float] = None) -> Any:
+        """브라우저 스레드에서 fn(context)를 실행하고 결과를 반환합니다.
+
+        timeout(초)은 브라우저 스레드가 작업을 꺼낸 시점부터 계산합니다 (대기열 대기 제외).
+        넘으면 작업 중인 브라우저를 강제 종료하고 TimeoutError를 발생시킵니다.
+        """
+        self._ensure_started()
+        job = _Job(fn)
+        self._jobs.put(job)
+        if timeout is None:
+            return job.future.result()
+
+        job.started.wait()
+        done, _ = concurrent.futures.wait([job.future], timeout)
+        if not done:
+            self._abort(job, timeout)
+            raise TimeoutError(f"브라우저 작업이 {timeout:.0f}초 안에 끝나지 않음")
+        return job.future.result()
+
+    def close(self):
+        """모든 브라우저 스레드를 종료합니다."""
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._jobs.put(None)
+        for thread in threads:
+            thread.join()
+        if threads:
+            self.logger.info(f"브라우저 풀 종료 (실행 {self._stats['launches']}회, 재시작 {self._stats['recycles']}회, "
+                             f"시간 초과 {self._stats['timeouts']}회, 페이지 {self._stats['pages']}개)")
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._threads:
+                return
+            for i in range(self.size):
+                thread = threading.Thread(target=self._worker, name=f"browser-pool-{i}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def _worker(self):
+        slot = None
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+
+            if not job.future.set_running_or_notify_cancel():
+                continue
+            job.started.set()
+
+            try:
+                if slot is None:
+                    slot = self._launch()
+                job.slot = slot
+                context = slot.browser.new_context()
+                try:
+                    result = job.fn(context)
+                finally:
+                    context.close()
+                job.future.set_result(result)
+            except Exception as e:
+                job.future.set_exception(e)
+                if slot is not None and not slot.killed and not slot.browser.is_connected():
+                    self.logger.warning("브라우저 연결이 끊어져 재시작합니다.")
+                    self._shutdown(slot)
+                    slot = None
+
+            if slot is not None and slot.killed:
+                # 시간 초과로 종료시킨 브라우저는 재사용하지 않음 (작업이 늦게 끝났더라도)
+                self._shutdown(slot)
+                slot = None
+
+            if slot is not None:
+                slot.pages_served += 1
+                with self._lock:
+                    self._stats['pages'] += 1
+                if self._should_recycle(slot):
+                    self._shutdown(slot)
+                    slot = None
+                    with self._lock:
+                        self._stats['recycles'] += 1
+
+        if slot is not None:
+            self._shutdown(slot)
+
+    def _launch(self) -> _BrowserSlot:
+        with self._launch_lock:
+            before = self._child_pids()
+            playwright = sync_playwright().start()
+            try:
+                browser = playwright.chromium.launch(headless=True, args=self.launch_args)
+            except Exception as e:
+                playwright.stop()
+                self.logger.error(f"Playwright 브라우저 실행 실패: {e}")
+                raise
+            driver_pids = self._child_pids() - before
+
+        with self._lock:
+            self._stats['launches'] += 1
+        self.logger.info("Playwright 브라우저 실행 성공")
+        return _BrowserSlot(playwright, browser, driver_pids)
+
+    def _abort(self, job: _Job, timeout: float):
+        with self._lock:
+            self._stats['timeouts'] += 1
+        slot = job.slot
+        if slot is None or job.future.done():
+            self.logger.warning(f"브라우저 작업 시간 초과 ({timeout:.0f}초), 브라우저 실행 중이라 종료하지 않음")
+            return
+        self.logger.warning(f"브라우저 작업 시간 초과 ({timeout:.0f}초), 브라우저를 강제 종료하고 재시작합니다.")
+        self._kill(slot)
+
+    def _kill(self, slot: _BrowserSlot):
+        """멈춘 브라우저의 드라이버 프로세스 트리를 종료합니다.
+
+        브라우저 스레드는 sync Playwright 호출에 묶여 있으므로 다른 스레드에서 browser.close()를 부를 수 없습니다.
+        드라이버가 종료되면 멈춘 호출이 예외로 끝나고 스레드가 브라우저를 재시작합니다.
+        """
+        slot.killed = True
+        if psutil is None:
+            self.logger.warning("psutil이 없어 멈춘 브라우저를 종료할 수 없습니다.")
+            return
+        for pid in slot.driver_pids:
+            try:
+                process = psutil.Process(pid)
+                processes = process.children(recursive=True) + [process]
+            except psutil.Error:
+                continue
+            for proc in processes:
+                try:
+                    proc.kill()
+                except psutil.Error:
+                    continue
+
+    def _shutdown(self, slot: _BrowserSlot):
+        try:
+            slot.browser.close()
+        except Exception:
+            pass
+        try:
+            slot.playwright.stop()
+        except Exception:
+            pass
+
+    def _should_recycle(self, slot: _BrowserSlot) -> bool:
+        if slot.pages_served >= self.max_pages_per_browser:
+            self.logger.info(f"브라우저 재시작: {slot.pages_served}개 페이지 처리")
+            return True
+
+        memory_mb = self._memory_mb(slot)
+        if memory_mb > self.max_memory_mb:
+            self.logger.info(f"브라우저 재시작: 메모리 {memory_mb:.0f}MB 사용")
+            return True
+        return False
+
+    def _memory_mb(self, slot: _BrowserSlot) -> float:
+        """드라이버와 그 하위 Chromium 프로세스들의 RSS 합계 (MB)"""
+        if psutil is None:
+            return 0.0
+
+        total = 0
+        for pid in slot.driver_pids:
+            try:
+                process = psutil.Process(pid)
+                for proc in [process] + process.children(recursive=True):
+                    total += proc.memory_info().rss
+            except psutil.Error:
+                continue
+        return total / (1024 * 1024)
+
+    def _child_pids(self) -> set:
+        if psutil is None:
+            return set()
+        try:
+            return {child.pid for child in psutil.Process().children()}
+        except psutil.Error:
+            return set()
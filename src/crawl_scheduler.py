@@ -0,0 +1,139 @@
+import heapq
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from state_store import JsonStateStore
+
+# 기록이 없는 URL의 수집 비용 기본값 (초)
+DEFAULT_FETCH_SECONDS = {'static': 1.5, 'render': 12.0}
+
+# HTML 1MB당 파싱/선택자 평가 비용 (초)
+PARSE_SECONDS_PER_MB = 0.8
+
+# 기록이 없는 URL의 페이지 크기 기본값 (바이트)
+DEFAULT_PAGE_BYTES = 150 * 1024
+
+# 실제 소요 시간을 반영하는 지수 이동 평균 가중치
+EWMA_ALPHA = 0.3
+
+
+def estimate_makespan(costs: Sequence[float], workers: int) -> float:
+    """작업을 주어진 순서대로 먼저 비는 작업자에게 배정할 때의 총 소요 시간"""
+    finish = [0.0] * max(1, workers)
+    for cost in costs:
+        heapq.heapreplace(finish, finish[0] + cost)
+    return max(finish)
+
+
+class CrawlScheduler:
+    """URL별 예상 처리 비용을 기록으로부터 추정하고, 오래 걸릴 작업부터 배정하는 순서를 정합니다.
+
+    비용은 이전 실행의 실제 처리 시간(지수 이동 평균)을 우선 사용하고, 기록이 없으면
+    렌더링 여부, 호스트 응답 시간, 렌더링 준비 시간, 페이지 크기로 추정합니다.
+    정적/렌더링 작업은 작업자 수가 따로 정해진 별도 레인에서 각각 긴 작업 우선(LPT)으로 처리됩니다.
+    기록은 data/crawl_costs.json에 저장됩니다.
+    """
+
+    def __init__(self, path: str, host_latency=None, readiness_recorder=None, enabled: bool = True):
+        self.store = JsonStateStore(path)
+        self.host_latency = host_latency  # HostLatencyTracker (선택)
+        self.readiness_recorder = readiness_recorder  # ReadinessRecorder (선택)
+        self.enabled = enabled
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+
+    def estimate(self, url: str, lane: str, html: Optional[str] = None) -> float:
+        """URL 하나의 작업자 처리 시간을 추정합니다. html이 있으면 이미 수집된 페이지로 보고 파싱 비용만 계산합니다."""
+        entry = self.store.get(url) or {}
+        if html is not None:
+            return entry.get('parse_seconds') or self._parse_seconds(len(html))
+
+        if entry.get(f'{lane}_seconds'):
+            return entry[f'{lane}_seconds']
+        fetch = DEFAULT_FETCH_SECONDS[lane]
+        typical = self.host_latency.typical(url, lane) if self.host_latency else None
+        if typical is not None:
+            fetch = typical
+        if lane == 'render' and self.readiness_recorder:
+            fetch += (self.readiness_recorder.store.get(url) or {}).get('ready_seconds', 0)
+        return fetch + self._parse_seconds(entry.get('bytes', DEFAULT_PAGE_BYTES))
+
+    @staticmethod
+    def _parse_seconds(size: int) -> float:
+        return 0.05 + size / (1024 * 1024) * PARSE_SECONDS_PER_MB
+
+    def run(self, jobs: List[Tuple[Any, str, float]], fn: Callable[[Any], Any], lane_workers: Dict[str, int]) -> List[Any]:
+        """(작업, 레인, 예상 비용) 목록을 레인별 작업자로 처리하고 결과 목록을 반환합니다.
+
+        레인마다 독립된 작업자 수(lane_workers)와 대기열을 가지므로 느린 렌더링이 정적 작업을 막지 않습니다.
+        활성화 상태에서는 레인마다 예상 비용이 큰 작업부터, 비활성화 상태에서는 주어진 순서대로 처리합니다.
+        """
+        lanes: Dict[str, List[Tuple[Any, float]]] = {}
+        for job, lane, cost in jobs:
+            lanes.setdefault(lane, []).append((job, cost))
+        if not lanes:
+            return []
+        if self.enabled:
+            for items in lanes.values():
+                items.sort(key=lambda item: item[1], reverse=True)
+        self._log_plan(lanes, lane_workers)
+
+        lock = threading.Lock()
+        queues = {lane: iter(items) for lane, items in lanes.items()}
+        results: List[Any] = []
+        errors: List[BaseException] = []
+
+        def worker(lane: str):
+            while True:
+                with lock:
+                    if errors:
+                        return
+                    item = next(queues[lane], None)
+                if item is None:
+                    return
+                try:
+                    result = fn(item[0])
+                except BaseException as e:
+                    with lock:
+                        errors.append(e)
+                    return
+                with lock:
+                    results.append(result)
+
+        threads = []
+        for lane, items in lanes.items():
+            for i in range(max(1, min(lane_workers.get(lane, 1), len(items)))):
+                threads.append(threading.Thread(target=worker, args=(lane,), name=f"crawl-{lane}-{i}", daemon=True))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
+        return results
+
+    def _log_plan(self, lanes: Dict[str, List[Tuple[Any, float]]], lane_workers: Dict[str, int]):
+        for lane, items in sorted(lanes.items()):
+            costs = [cost for _, cost in items]
+            workers = lane_workers.get(lane, 1)
+            planned = estimate_makespan(sorted(costs, reverse=True) if self.enabled else costs, workers)
+            self.logger.info(f"{lane} 레인: {len(items)}개 URL, 예상 작업량 {sum(costs):.0f}초, 작업자 {workers}개, "
+                             f"예상 소요 {planned:.0f}초 (시트 순서 {estimate_makespan(costs, workers):.0f}초)")
+
+    def record(self, url: str, lane: str, seconds: float, prefetched: bool):
+        """작업자 처리 시간을 기록합니다 (선수집된 페이지는 파싱 비용, 아니면 레인별 수집+파싱 비용)."""
+        key = 'parse_seconds' if prefetched else f'{lane}_seconds'
+        with self._lock:
+            entry = self.store.get(url) or {}
+            previous = entry.get(key)
+            value = seconds if previous is None else previous + EWMA_ALPHA * (seconds - previous)
+            self.store.update(url, **{key: round(value, 3)})
+
+    def note_size(self, url: str, size: int):
+        with self._lock:
+            if (self.store.get(url) or {}).get('bytes') != size:
+                self.store.update(url, bytes=size)
+
+    def save(self):
+        self.store.save()
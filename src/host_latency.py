@@ -0,0 +1,97 @@
+import logging
+import math
+import threading
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+from state_store import JsonStateStore
+
+# 호스트별로 보관할 최근 응답 시간 수
+SAMPLE_WINDOW = 50
+
+# 이 수보다 기록이 적은 호스트는 전체 제한 시간을 사용
+MIN_SAMPLES = 5
+
+# 종류별 최소 제한 시간 (초) - 평소 빠른 호스트라도 이보다 짧게 끊지 않음
+MIN_TIMEOUT_SECONDS = {'static': 3.0, 'render': 8.0}
+
+
+def percentile(values: List[float], q: float) -> float:
+    """정렬하지 않은 값 목록의 q 분위수 (최근접 순위 방식)"""
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(q * len(ordered)) - 1))
+    return ordered[rank]
+
+
+class HostLatencyTracker:
+    """호스트별 응답 시간 기록으로 요청마다 제한 시간을 정합니다.
+
+    제한 시간 = 최근 응답 시간의 q 분위수 x multiplier (종류별 최소값 ~ ceiling 사이로 제한).
+    평소 빠른 호스트에서 연결이 멈추면 빨리 포기하고, 기록이 부족한 호스트는 ceiling을 사용합니다.
+    정적 수집(static)과 렌더링(render)은 따로 기록하며, data/host_latency.json에 저장됩니다.
+    """
+
+    def __init__(self, path: str, ceiling: float = 20.0, quantile: float = 0.95, multiplier: float = 3.0, enabled: bool = True):
+        self.store = JsonStateStore(path)
+        self.ceiling = ceiling
+        self.quantile = quantile
+        self.multiplier = multiplier
+        self.enabled = enabled
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._budget_timeouts = 0  # 이번 실행에서 적응형 제한 시간을 넘긴 요청 수
+
+    @staticmethod
+    def _host(url: str) -> str:
+        return urlparse(url).netloc.lower()
+
+    def record(self, url: str, seconds: float, kind: str = 'static'):
+        """성공한 요청의 응답 시간을 기록합니다."""
+        host = self._host(url)
+        with self._lock:
+            entry = dict(self.store.get(host) or {})
+            samples = list(entry.get(kind) or [])
+            samples.append(round(seconds, 3))
+            entry[kind] = samples[-SAMPLE_WINDOW:]
+            self.store.set(host, entry)
+
+    def timeout_for(self, url: str, kind: str = 'static') -> float:
+        """요청에 사용할 제한 시간(초)을 반환합니다."""
+        if not self.enabled:
+            return self.ceiling
+        samples = (self.store.get(self._host(url)) or {}).get(kind) or []
+        if len(samples) < MIN_SAMPLES:
+            return self.ceiling
+        budget = percentile(samples, self.quantile) * self.multiplier
+        return round(min(self.ceiling, max(MIN_TIMEOUT_SECONDS.get(kind, 3.0), budget)), 1)
+
+    def typical(self, url: str, kind: str = 'static') -> Optional[float]:
+        """호스트의 평소 응답 시간(중앙값)을 반환합니다. 기록이 없으면 None을 반환합니다."""
+        samples = (self.store.get(self._host(url)) or {}).get(kind) or []
+        return percentile(samples, 0.5) if samples else None
+
+    def is_reduced(self, timeout: float) -> bool:
+        """전체 제한 시간보다 짧은 적응형 제한 시간인지 확인합니다 (초과 시 전체 제한 시간으로 재시도할 대상)."""
+        return timeout < self.ceiling
+
+    def note_budget_timeout(self):
+        with self._lock:
+            self._budget_timeouts += 1
+
+    def log_summary(self):
+        if not self.enabled:
+            return
+        budgets: Dict[str, List[float]] = {'static': [], 'render': []}
+        for host, entry in self.store.items():
+            for kind in budgets:
+                if len(entry.get(kind) or []) >= MIN_SAMPLES:
+                    budgets[kind].append(self.timeout_for(f"//{host}", kind))
+        for kind, values in budgets.items():
+            if values:
+                self.logger.info(f"적응형 제한 시간 ({kind}): 호스트 {len(values)}개, 중앙값 {percentile(values, 0.5):.1f}초, "
+                                 f"최대 {max(values):.1f}초 (상한 {self.ceiling:.0f}초)")
+        if self._budget_timeouts:
+            self.logger.info(f"  - 적응형 제한 시간 초과 후 전체 제한 시간으로 재시도: {self._budget_timeouts}회")
+
+    def save(self):
+        self.store.save()
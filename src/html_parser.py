@@ -0,0 +1,311 @@
+import argparse
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401
+except ImportError:  # lxml이 없으면 html.parser로 대체
+    lxml = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # selectolax가 없으면 선택자 평가도 BeautifulSoup으로
+    LexborHTMLParser = None
+
+# 지원하는 파서 백엔드 (html.parser: 순수 파이썬 기준 구현, lxml: C 파서로 만든 soup, selectolax: soup 없이 선택자 평가)
+BACKENDS = ('html.parser', 'lxml', 'selectolax')
+
+# BeautifulSoup의 get_text()가 제외하는 요소 (selectolax 텍스트를 같은 규칙으로 맞추기 위해 제거)
+_NON_TEXT_TAGS = ['script', 'style', 'template']
+
+# 대상 파싱을 적용할 수 있는 선택자의 첫 단순 선택자 (태그, id, 클래스 조합만)
+_ROOT_COMPOUND_RE = re.compile(r'^([a-zA-Z][\w-]*)?((?:[.#][\w-]+)*)$')
+
+# 하위 트리 파싱 결과가 전체 파싱과 달라지는 요소 (내용 텍스트가 get_text에서 제외됨)
+_TEMPLATE_RE = re.compile(r'<template[\s>]', re.IGNORECASE)
+
+# 닫는 태그가 없는 요소
+_VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'}
+
+
+class SelectorCache:
+    """선택자 문자열별로 컴파일된 soupsieve 선택자를 보관하는 프로세스 전역 LRU 캐시
+
+    soupsieve 내부 캐시(500개)는 선택자 탐색 후보 문자열에 밀려 기존 선택자 수백 개가 매 회사마다 다시
+    컴파일되므로, 크기를 따로 정한 캐시에 보관합니다. 컴파일에 실패한 선택자는 보관하지 않고(매 호출마다 새 오류 발생),
+    selectolax가 해석하지 못한 선택자는 기억해 바로 BeautifulSoup으로 평가합니다.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._entries: 'OrderedDict[str, object]' = OrderedDict()
+        self._lexbor_unsupported: 'OrderedDict[str, bool]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.failures = 0
+
+    def compile(self, selector: str):
+        """컴파일된 선택자를 반환합니다. 컴파일에 실패하면 캐시에 남기지 않고 오류를 그대로 발생시킵니다."""
+        with self._lock:
+            entry = self._entries.get(selector)
+            if entry is not None:
+                self._entries.move_to_end(selector)
+                self.hits += 1
+                return entry
+        try:
+            entry = soupsieve.compile(selector)
+        except Exception:  # SelectorSyntaxError, 잘못된 타입 등
+            with self._lock:
+                self.failures += 1
+                self._entries.pop(selector, None)
+            raise
+        with self._lock:
+            self.misses += 1
+            self._remember(self._entries, selector, entry)
+        return entry
+
+    def lexbor_supported(self, selector: str) -> bool:
+        with self._lock:
+            return selector not in self._lexbor_unsupported
+
+    def mark_lexbor_unsupported(self, selector: str):
+        with self._lock:
+            self._remember(self._lexbor_unsupported, selector, True)
+
+    def _remember(self, entries: OrderedDict, key: str, value):
+        entries[key] = value
+        entries.move_to_end(key)
+        while len(entries) > self.maxsize:
+            entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'size': len(self._entries), 'hits': self.hits, 'misses': self.misses, 'failures': self.failures}
+
+    def log_summary(self):
+        stats = self.stats()
+        if stats['misses'] or stats['failures']:
+            logging.getLogger(__name__).info(f"선택자 캐시: {stats['size']}개 (적중 {stats['hits']}회, 컴파일 {stats['misses']}회, "
+                                             f"컴파일 실패 {stats['failures']}회)")
+
+
+SELECTOR_CACHE = SelectorCache(int(os.getenv('SELECTOR_CACHE_SIZE', '4096')))
+
+
+def css_select(tag, selector: str) -> list:
+    """tag.select(selector)와 같지만 컴파일된 선택자를 재사용합니다."""
+    return SELECTOR_CACHE.compile(selector).select(tag)
+
+
+def css_select_one(tag, selector: str):
+    """tag.select_one(selector)와 같지만 컴파일된 선택자를 재사용합니다."""
+    return SELECTOR_CACHE.compile(selector).select_one(tag)
+
+
+def resolve_backend(name: Optional[str]) -> str:
+    """요청한 백엔드를 설치된 라이브러리 기준으로 사용할 수 있는 백엔드로 바꿉니다."""
+    name = (name or 'html.parser').lower()
+    if name == 'selectolax' and LexborHTMLParser is None:
+        name = 'lxml'
+    if name == 'lxml' and lxml is None:
+        name = 'html.parser'
+    return name if name in BACKENDS else 'html.parser'
+
+
+def make_soup(html, backend: Optional[str] = None, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """백엔드에 맞는 트리 빌더로 BeautifulSoup 객체를 만듭니다 (selectolax는 soup이 필요한 곳에서 lxml 사용)."""
+    features = 'html.parser' if resolve_backend(backend) == 'html.parser' else 'lxml'
+    try:
+        return BeautifulSoup(html, features, parse_only=parse_only)
+    except Exception:
+        if features == 'html.parser':
+            raise
+        return BeautifulSoup(html, 'html.parser', parse_only=parse_only)
+
+
+def _root_compound(selector: str) -> Optional[Tuple[Optional[str], Optional[str], Optional[str]]]:
+    """선택자의 첫 단순 선택자를 (태그, id, 클래스)로 반환합니다. 하위 트리 파싱을 쓸 수 없으면 None을 반환합니다."""
+    selector = (selector or '').strip()
+    if not selector or any(token in selector for token in (',', '+', '~', ':root', ':scope')):
+        return None
+    match = _ROOT_COMPOUND_RE.match(re.split(r'\s*>\s*|\s+', selector, maxsplit=1)[0])
+    if not match or not any(match.groups()):
+        return None
+
+    tag, rest = match.group(1), match.group(2)
+    if tag and tag.lower() in ('html', 'body'):
+        return None
+    ids = re.findall(r'#([\w-]+)', rest)
+    classes = re.findall(r'\.([\w-]+)', rest)
+    if ids:
+        return tag, ids[0], None
+    return tag, None, classes[0] if classes else None
+
+
+def root_strainer(selector: str) -> Optional[SoupStrainer]:
+    """선택자의 첫 단순 선택자(id, 클래스, 태그)와 일치하는 하위 트리만 만드는 SoupStrainer를 반환합니다.
+
+    하위 트리 밖을 참조할 수 있는 선택자(선택자 목록, 형제 결합자, :root/:scope, 첫 단순 선택자의 속성/가상 클래스)는
+    None을 반환하여 전체 파싱을 사용합니다.
+    """
+    root = _root_compound(selector)
+    if root is None:
+        return None
+    tag, element_id, cls = root
+    if element_id:
+        return SoupStrainer(tag, attrs={'id': element_id})
+    if cls:
+        # 여러 클래스를 가진 요소도 일치하도록 공백 단위로 비교
+        return SoupStrainer(tag, attrs={'class': re.compile(r'(?:^|\s)' + re.escape(cls) + r'(?:\s|$)')})
+    return SoupStrainer(tag)
+
+
+def subtree_parse_safe(html, selector: str) -> bool:
+    """하위 트리만 파싱해도 전체 파싱과 같은 하위 트리가 만들어지는지 HTML을 훑어 확인합니다.
+
+    하위 트리 파싱에는 조상 요소가 없으므로, template 안의 요소(전체 파싱에서는 텍스트가 제외됨)와
+    닫는 태그가 없는 루트 요소(전체 파싱에서는 조상 요소가 닫힐 때 함께 닫힘)는 결과가 달라집니다.
+    루트가 될 수 있는 태그의 여닫는 태그 수가 다르거나 template이 있으면 전체 파싱을 사용합니다.
+    """
+    root = _root_compound(selector)
+    if root is None or not isinstance(html, str) or _TEMPLATE_RE.search(html):
+        return False
+    tag, element_id, cls = root
+    if tag:
+        tags = {tag.lower()}
+    else:
+        # 속성 어딘가에 id/클래스 이름이 들어있는 시작 태그를 모두 루트 후보로 봄 (넓게 잡을수록 보수적)
+        tags = {name.lower() for name in re.findall(r'<([a-zA-Z][\w-]*)\b[^>]*?' + re.escape(element_id or cls), html)}
+    for name in tags - _VOID_TAGS:
+        opened = len(re.findall(r'<' + re.escape(name) + r'[\s/>]', html, re.IGNORECASE))
+        closed = len(re.findall(r'</' + re.escape(name) + r'\s*>', html, re.IGNORECASE))
+        if opened != closed:
+            return False
+    return True
+
+
+class ParsedPage:
+    """페이지 하나를 백엔드에 맞게 한 번만 파싱하고 선택자 평가와 soup 접근을 제공합니다.
+
+    selectolax 백엔드는 선택자 평가를 soup 없이 처리하고, 선택자 탐색처럼 soup이 필요한 경우에만
+    lxml로 soup을 만듭니다. selectolax가 해석하지 못하는 선택자는 soup으로 평가합니다.
+
+    target(알려진 선택자)이 있고 하위 트리 파싱이 전체 파싱과 같은 트리를 만드는 페이지면(subtree_parse_safe)
+    선택자의 첫 단순 선택자와 일치하는 하위 트리만 파싱합니다. 그 결과에서 요소를 찾지 못하면 전체 문서를 파싱해 다시 평가합니다.
+    """
+
+    def __init__(self, html, backend: Optional[str] = None, soup: Optional[BeautifulSoup] = None, target: Optional[str] = None):
+        self.html = html
+        self.backend = resolve_backend(backend)
+        self._soup = soup
+        self._tree = None
+        use_subtree = target and soup is None and self.backend != 'selectolax' and subtree_parse_safe(html, target)
+        self._strainer = root_strainer(target) if use_subtree else None
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        if self._soup is None:
+            if self._strainer is not None:
+                self._soup = make_soup(self.html, self.backend, parse_only=self._strainer)
+            else:
+                self._soup = make_soup(self.html, self.backend)
+        return self._soup
+
+    def select_texts(self, selector: str) -> List[str]:
+        """선택자와 일치하는 요소마다 get_text(strip=True)와 같은 규칙의 텍스트를 반환합니다."""
+        if self.backend == 'selectolax' and self._soup is None and SELECTOR_CACHE.lexbor_supported(selector):
+            try:
+                return [node.text(deep=True, separator='', strip=True) for node in self._lexbor().css(selector)]
+            except Exception:
+                SELECTOR_CACHE.mark_lexbor_unsupported(selector)
+        texts = [elem.get_text(strip=True) for elem in css_select(self.soup, selector)]
+        if not texts and self._strainer is not None:
+            # 대상 파싱 결과에서 찾지 못하면 전체 문서로 다시 평가
+            self._strainer = None
+            self._soup = None
+            texts = [elem.get_text(strip=True) for elem in css_select(self.soup, selector)]
+        return texts
+
+    def _lexbor(self):
+        if self._tree is None:
+            tree = LexborHTMLParser(self.html)
+            tree.strip_tags(_NON_TEXT_TAGS)
+            self._tree = tree
+        return self._tree
+
+
+def benchmark(pages: List[Dict], backends: List[str], repeat: int = 3) -> List[Dict]:
+    """기록된 페이지(html, selector, job_titles)로 백엔드별 파싱+선택자 평가 시간과 결과 일치 여부를 측정합니다."""
+    from parse_worker import select_job_titles, try_existing_selectors
+
+    existing = sorted({page['selector'] for page in pages if page['selector']})
+    reference = {i: set(select_job_titles(ParsedPage(page['html'], 'html.parser'), page['selector']) or [])
+                 for i, page in enumerate(pages)}
+    results = []
+    for backend in backends:
+        used = resolve_backend(backend)
+        select_seconds = existing_seconds = 0.0
+        same, same_recorded = 0, 0
+        for i, page in enumerate(pages):
+            for _ in range(repeat):
+                start = time.perf_counter()
+                titles = select_job_titles(ParsedPage(page['html'], used), page['selector'])
+                select_seconds += time.perf_counter() - start
+            same += set(titles or []) == reference[i]
+            same_recorded += set(titles or []) == set(page['job_titles'])
+
+            start = time.perf_counter()
+            try_existing_selectors(ParsedPage(page['html'], used), existing, lambda title: True)
+            existing_seconds += time.perf_counter() - start
+        results.append({
+            'backend': used,
+            'pages': len(pages),
+            'select_ms': round(select_seconds / repeat / max(1, len(pages)) * 1000, 2),
+            'existing_ms': round(existing_seconds / max(1, len(pages)) * 1000, 2),
+            'same_as_html_parser': same,
+            'same_as_recorded': same_recorded,
+        })
+    return results
+
+
+def main():
+    from snapshot_store import SnapshotStore
+
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parser = argparse.ArgumentParser(description='기록된 스냅샷으로 HTML 파서 백엔드 속도와 결과 일치 여부 비교')
+    parser.add_argument('--root', default=os.path.join(base_dir, 'data', 'snapshots'), help='스냅샷 저장소 경로')
+    parser.add_argument('--run', default=None, help='실행 ID (기본값: 가장 최근 실행)')
+    parser.add_argument('--backends', default=','.join(BACKENDS))
+    parser.add_argument('--repeat', type=int, default=3, help='페이지별 반복 횟수')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    store = SnapshotStore(args.root)
+    manifest = store.load_manifest(args.run)
+    if not manifest:
+        raise SystemExit(f"비교할 매니페스트가 없습니다: {args.root} (run={args.run})")
+
+    pages = []
+    for entry in manifest['entries'].values():
+        html = store.get(entry['hash']) if entry.get('hash') and entry.get('selector') else None
+        if html:
+            pages.append({'html': html, 'selector': entry['selector'], 'job_titles': entry.get('job_titles') or []})
+
+    results = benchmark(pages, args.backends.split(','), args.repeat)
+    print(f"{'백엔드':>12} {'페이지':>6} {'선택자(ms)':>12} {'기존 선택자(ms)':>16} {'html.parser와 동일':>18} {'기록과 동일':>10}")
+    for r in results:
+        print(f"{r['backend']:>12} {r['pages']:>6} {r['select_ms']:>12} {r['existing_ms']:>16} "
+              f"{r['same_as_html_parser']:>18} {r['same_as_recorded']:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+import hashlib
+import re
+import threading
+import time
+from typing import Dict, List, Optional
+
+from state_store import JsonStateStore
+
+# 서버가 304 Not Modified를 반환했음을 나타내는 표식 (HTML 대신 반환)
+NOT_MODIFIED = object()
+
+# 요청마다 값이 바뀌어 내용 비교를 방해하는 토큰들
+VOLATILE_PATTERNS = [
+    re.compile(r'<script\b[^>]*>.*?</script>', re.IGNORECASE | re.DOTALL),  # 인라인 스크립트 (빌드 ID, 타임스탬프 등)
+    re.compile(r'<!--.*?-->', re.DOTALL),
+    re.compile(r'\snonce="[^"]*"', re.IGNORECASE),
+    re.compile(r'<meta[^>]+name="(?:csrf-token|csrf-param|_csrf)"[^>]*>', re.IGNORECASE),
+    re.compile(r'<input[^>]+name="(?:_csrf|csrf_token|csrfmiddlewaretoken|authenticity_token|__RequestVerificationToken)"[^>]*>', re.IGNORECASE),
+    re.compile(r'<input[^>]+name="(?:__VIEWSTATE|__EVENTVALIDATION|__VIEWSTATEGENERATOR)"[^>]*>', re.IGNORECASE),
+]
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def content_fingerprint(html: str, strip_volatile: bool = True) -> str:
+    """HTML 본문의 SHA-256 지문을 계산합니다 (선택적으로 휘발성 토큰 제거 후)."""
+    if strip_volatile:
+        for pattern in VOLATILE_PATTERNS:
+            html = pattern.sub('', html)
+        html = WHITESPACE_PATTERN.sub(' ', html)
+    return hashlib.sha256(html.encode('utf-8', errors='replace')).hexdigest()
+
+
+class HttpValidatorCache:
+    """URL별 ETag/Last-Modified와 마지막 추출 결과를 보관하는 조건부 요청 캐시
+
+    크롤링(crawl)과 Selenium 필요성 판별(probe)은 같은 URL이라도 저장하는 결과가 다르므로
+    범위(scope)를 나누어 검증자와 결과가 항상 같은 응답에서 나오도록 유지합니다.
+    """
+
+    def __init__(self, path: str):
+        self.store = JsonStateStore(path)
+        self._pending = {}  # 파싱이 끝나기 전까지 보류 중인 응답 검증자
+        self._lock = threading.Lock()
+
+    def lookup(self, url: str, scope: str = 'crawl') -> Optional[Dict]:
+        return (self.store.get(url) or {}).get(scope)
+
+    def conditional_headers(self, url: str, selector: Optional[str] = None, scope: str = 'crawl') -> Dict[str, str]:
+        """재사용 가능한 결과가 있을 때만 If-None-Match/If-Modified-Since 헤더를 만듭니다."""
+        entry = self.lookup(url, scope)
+        if not entry:
+            return {}
+        if scope == 'crawl':
+            if not entry.get('job_titles'):
+                return {}
+            # 선택자가 바뀌었으면 이전 결과를 재사용할 수 없음
+            if selector and selector.strip() and selector.strip() != entry.get('selector'):
+                return {}
+
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def remember(self, url: str, response_headers):
+        """응답의 검증자를 결과가 확정될 때까지 보류합니다."""
+        validators = self._extract_validators(response_headers)
+        with self._lock:
+            self._pending[url] = validators
+
+    def discard(self, url: str):
+        """보류 중인 검증자를 버립니다 (다른 방식으로 다시 수집할 때)."""
+        with self._lock:
+            self._pending.pop(url, None)
+
+    def matches_content(self, url: str, content_hash: str, selector: Optional[str] = None) -> bool:
+        """이전 실행과 본문 지문이 같고 결과를 재사용할 수 있는지 확인합니다."""
+        entry = self.lookup(url)
+        if not entry or not entry.get('job_titles') or entry.get('content_hash') != content_hash:
+            return False
+        return not (selector and selector.strip() and selector.strip() != entry.get('selector'))
+
+    def commit(self, url: str, selector: str, job_titles: List[str], content_hash: Optional[str] = None):
+        """크롤링 결과가 확정되면 보류 중인 검증자와 본문 지문을 함께 저장합니다."""
+        with self._lock:
+            validators = self._pending.pop(url, {})
+        self._update_scope(url, 'crawl', selector=selector, job_titles=list(job_titles), content_hash=content_hash, **validators)
+
+    def store_probe(self, url: str, response_headers, selenium_required: bool):
+        """Selenium 필요성 판별 결과를 응답 검증자와 함께 저장합니다."""
+        validators = self._extract_validators(response_headers)
+        self._update_scope(url, 'probe', selenium_required=bool(selenium_required), **validators)
+
+    def save(self) -> bool:
+        return self.store.save()
+
+    def _update_scope(self, url: str, scope: str, **fields):
+        with self._lock:
+            entry = dict(self.store.get(url) or {})
+            entry[scope] = dict(fields, updated_at=time.strftime('%Y-%m-%d %H:%M:%S'))
+            self.store.set(url, entry)
+
+    def _extract_validators(self, response_headers) -> Dict[str, Optional[str]]:
+        headers = {k.lower(): v for k, v in (response_headers or {}).items()}
+        return {
+            'etag': headers.get('etag'),
+            'last_modified': headers.get('last-modified'),
+        }
@@ -0,0 +1,286 @@
+import codecs
+import logging
+import re
+import threading
+from typing import AsyncIterable, Dict, Iterable, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import MaxRetryError, NameResolutionError, ReadTimeoutError, SSLError
+from urllib3.util.retry import Retry
+
+from url_rewrite import UrlRewriter
+
+
+DEFAULT_MAX_RESPONSE_BYTES = 5 * 1024 * 1024
+BODY_CHUNK_SIZE = 64 * 1024
+
+_HEADER_CHARSET = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.I)
+_META_CHARSET = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?([\w.:-]+)', re.I)
+
+
+def _valid_codec(name: Optional[str]) -> Optional[str]:
+    if not name:
+        return None
+    try:
+        return codecs.lookup(name).name
+    except LookupError:
+        return None
+
+
+def detect_charset(body: bytes, content_type: Optional[str] = None) -> str:
+    """Content-Type 헤더 -> 본문 앞부분의 meta 태그 -> UTF-8 순서로 문자셋을 결정합니다.
+
+    본문 전체에 대한 문자셋 추측(chardet)은 수행하지 않습니다.
+    """
+    if content_type:
+        match = _HEADER_CHARSET.search(content_type)
+        codec = _valid_codec(match.group(1)) if match else None
+        if codec:
+            return codec
+    match = _META_CHARSET.search(body[:4096])
+    codec = _valid_codec(match.group(1).decode('ascii', 'ignore')) if match else None
+    return codec or 'utf-8'
+
+
+def decode_body(body: bytes, content_type: Optional[str] = None) -> str:
+    return body.decode(detect_charset(body, content_type), errors='replace')
+
+
+class ResponseBodyLimiter:
+    """응답 본문을 청크 단위로 읽고, 최대 크기를 넘는 부분은 버리며 잘림 횟수를 기록합니다."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_RESPONSE_BYTES, chunk_size: int = BODY_CHUNK_SIZE):
+        self.max_bytes = max_bytes  # 0 이하이면 제한 없음
+        self.chunk_size = chunk_size
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._responses = 0
+        self._bytes = 0
+        self._truncated: Dict[str, int] = {}
+
+    def collect(self, chunks: Iterable[bytes], url: str) -> bytes:
+        buffer = bytearray()
+        truncated = False
+        for chunk in chunks:
+            truncated = self._append(buffer, chunk)
+            if truncated:
+                break
+        return self._finish(buffer, truncated, url)
+
+    async def collect_async(self, chunks: AsyncIterable[bytes], url: str) -> bytes:
+        buffer = bytearray()
+        truncated = False
+        async for chunk in chunks:
+            truncated = self._append(buffer, chunk)
+            if truncated:
+                break
+        return self._finish(buffer, truncated, url)
+
+    def _append(self, buffer: bytearray, chunk: bytes) -> bool:
+        """청크를 추가하고 최대 크기에 도달했으면 True를 반환합니다."""
+        if self.max_bytes > 0 and len(buffer) + len(chunk) > self.max_bytes:
+            buffer.extend(chunk[:self.max_bytes - len(buffer)])
+            return True
+        buffer.extend(chunk)
+        return False
+
+    def _finish(self, buffer: bytearray, truncated: bool, url: str) -> bytes:
+        with self._lock:
+            self._responses += 1
+            self._bytes += len(buffer)
+            if truncated:
+                self._truncated[url] = len(buffer)
+        if truncated:
+            self.logger.warning(f"응답 본문이 최대 크기({self.max_bytes:,}바이트)를 넘어 잘림: {url}")
+        return bytes(buffer)
+
+    def log_summary(self):
+        with self._lock:
+            responses, total, truncated = self._responses, self._bytes, len(self._truncated)
+        if responses:
+            self.logger.info(f"응답 본문: {responses}개, 평균 {total / responses / 1024:.0f}KB, "
+                             f"최대 크기 초과로 잘림 {truncated}개")
+
+
+class ConnectionStats:
+    """호스트별 연결 풀 적중(재사용)/실패(새 연결) 횟수"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._checkouts: Dict[str, int] = {}
+        self._new_connections: Dict[str, int] = {}
+
+    def record_checkout(self, host: str):
+        with self._lock:
+            self._checkouts[host] = self._checkouts.get(host, 0) + 1
+
+    def record_new_connection(self, host: str):
+        with self._lock:
+            self._new_connections[host] = self._new_connections.get(host, 0) + 1
+
+    def summary(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {
+                host: {'hits': max(0, count - self._new_connections.get(host, 0)), 'misses': self._new_connections.get(host, 0)}
+                for host, count in self._checkouts.items()
+            }
+
+
+def _counting_pool_classes(stats: ConnectionStats):
+    """연결을 꺼낼 때와 새로 만들 때를 기록하는 urllib3 커넥션 풀 클래스를 생성합니다."""
+
+    class CountingHTTPConnectionPool(HTTPConnectionPool):
+        def _get_conn(self, timeout=None):
+            stats.record_checkout(self.host)
+            return super()._get_conn(timeout)
+
+        def _new_conn(self):
+            stats.record_new_connection(self.host)
+            return super()._new_conn()
+
+    class CountingHTTPSConnectionPool(HTTPSConnectionPool):
+        def _get_conn(self, timeout=None):
+            stats.record_checkout(self.host)
+            return super()._get_conn(timeout)
+
+        def _new_conn(self):
+            stats.record_new_connection(self.host)
+            return super()._new_conn()
+
+    return {'http': CountingHTTPConnectionPool, 'https': CountingHTTPSConnectionPool}
+
+
+class _CountingHTTPAdapter(HTTPAdapter):
+    def __init__(self, stats: ConnectionStats, **kwargs):
+        self._pool_classes = _counting_pool_classes(stats)
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = self._pool_classes
+
+
+def is_read_timeout(error: BaseException) -> bool:
+    """응답 대기/본문 읽기 시간 초과인지 확인합니다 (requests가 ConnectionError로 감싼 경우 포함)."""
+    while error is not None:
+        if isinstance(error, (requests.exceptions.ReadTimeout, ReadTimeoutError)):
+            return True
+        if isinstance(error, MaxRetryError) and isinstance(error.reason, ReadTimeoutError):
+            return True
+        nested = error.args[0] if error.args and isinstance(error.args[0], BaseException) else None
+        error = nested or error.__cause__
+    return False
+
+
+class FailFastRetry(Retry):
+    """DNS 조회 실패와 TLS 오류는 재시도해도 결과가 같으므로 바로 실패시키는 재시도 정책
+
+    읽기 시간 초과도 같은 제한 시간으로 다시 기다리지 않고 바로 ReadTimeout으로 올려,
+    호출하는 쪽(적응형 제한 시간)이 더 긴 제한 시간으로 재시도할지 정하게 합니다.
+    """
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        if isinstance(error, (NameResolutionError, SSLError)):
+            raise MaxRetryError(_pool, url, error) from error
+        if isinstance(error, ReadTimeoutError):
+            raise error
+        return super().increment(method=method, url=url, response=response, error=error, _pool=_pool, _stacktrace=_stacktrace)
+
+
+class SessionPool:
+    """스레드별 requests.Session을 제공하는 HTTP 세션 계층
+
+    requests.Session은 스레드 간 공유가 안전하지 않으므로 스레드마다 세션을 만들고,
+    각 세션은 여러 호스트의 keep-alive 연결을 유지하여 TLS 핸드셰이크를 재사용합니다.
+    한 스레드는 요청을 하나씩 보내므로 세션의 호스트별 연결은 하나면 충분합니다 (pool_maxsize=1).
+    """
+
+    def __init__(self, headers: Optional[Dict[str, str]] = None, pool_maxsize: int = 1, pool_connections: int = 100,
+                 retries: int = 3, backoff_factor: float = 1, body_limiter: Optional[ResponseBodyLimiter] = None,
+                 url_rewriter: Optional[UrlRewriter] = None):
+        self.headers = headers or {}
+        self.pool_maxsize = max(1, pool_maxsize)  # 세션(스레드)별 호스트당 유지할 연결 수
+        self.pool_connections = pool_connections  # 세션별로 유지할 호스트 풀 수
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.stats = ConnectionStats()
+        self.body_limiter = body_limiter or ResponseBodyLimiter()
+        self.url_rewriter = url_rewriter or UrlRewriter()
+        self.logger = logging.getLogger(__name__)
+
+        self._local = threading.local()
+        self._sessions = []
+        self._lock = threading.Lock()
+
+    def session(self) -> requests.Session:
+        """현재 스레드 전용 세션을 반환합니다."""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._create_session()
+            self._local.session = session
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        return self.session().request(method, self.url_rewriter(url), **kwargs)
+
+    def fetch_text(self, url: str, method: str = 'GET', **kwargs) -> Tuple[requests.Response, Optional[str]]:
+        """본문을 스트리밍으로 최대 크기까지만 읽어 응답과 디코딩된 본문을 반환합니다.
+
+        304나 오류 응답은 본문을 읽지 않고 None을 반환합니다.
+        """
+        response = self.request(method, url, stream=True, **kwargs)
+        try:
+            if response.status_code == 304 or response.status_code >= 400:
+                return response, None
+            body = self.body_limiter.collect(response.iter_content(self.body_limiter.chunk_size), url)
+            return response, decode_body(body, response.headers.get('Content-Type'))
+        finally:
+            response.close()
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        session.headers.update(self.headers)
+
+        retry_strategy = FailFastRetry(
+            total=self.retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=[429, 500, 502, 503, 504],
+        )
+        adapter = _CountingHTTPAdapter(
+            self.stats,
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=retry_strategy,
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def log_summary(self):
+        summary = self.stats.summary()
+        if not summary:
+            return
+        hits = sum(s['hits'] for s in summary.values())
+        misses = sum(s['misses'] for s in summary.values())
+        total = hits + misses
+        self.logger.info(f"HTTP 연결 풀: 연결 사용 {total}회, 재사용 {hits}회, 새 연결 {misses}회 (재사용률 {hits / total:.1%})")
+
+        # 여러 회사가 공유하는 호스트에서 절약한 핸드셰이크
+        top_hosts = sorted(summary.items(), key=lambda x: x[1]['hits'], reverse=True)[:5]
+        for host, s in top_hosts:
+            if s['hits'] > 0:
+                self.logger.info(f"  - {host}: 재사용 {s['hits']}회, 새 연결 {s['misses']}회")
+
+    def close(self):
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+        self._local = threading.local()
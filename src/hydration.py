@@ -0,0 +1,242 @@
+import json
+import logging
+import re
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from analyze_titles import JobPostingSelectorAnalyzer
+from html_parser import make_soup
+from parse_worker import normalize_titles
+from state_store import JsonStateStore
+
+# window.XXX = {...} 형태로 상태를 심어두는 프레임워크 전역 변수
+WINDOW_STATE_NAMES = ['__INITIAL_STATE__', '__PRELOADED_STATE__', '__APOLLO_STATE__', '__NUXT__', '__APP_STATE__']
+_WINDOW_STATE_RE = re.compile(r'window\.(' + '|'.join(WINDOW_STATE_NAMES) + r')\s*=\s*')
+
+# 자동 탐색 시 우선하는 제목 키
+TITLE_KEYS = {'title', 'jobtitle', 'job_title', 'name', 'positionname', 'position_name', 'postingtitle',
+              'recruittitle', 'recruit_title', 'subject', 'announcementtitle', 'opening_title'}
+
+# 자동 탐색에서 방문할 최대 노드 수 (거대한 페이로드 보호)
+MAX_DISCOVERY_NODES = 200000
+
+# 추출 실패한 URL은 이 기간 동안 다시 시도하지 않고 바로 렌더링
+RETRY_AFTER_FAILURE_DAYS = 7
+
+
+def _unflatten_devalue(values: List[Any]) -> Any:
+    """Nuxt 3 __NUXT_DATA__ (devalue 형식: 인덱스로 서로를 참조하는 평탄한 배열)를 원래 구조로 복원합니다."""
+    cache: Dict[int, Any] = {}
+
+    def hydrate(index):
+        if not isinstance(index, int) or index < 0 or index >= len(values):
+            return None
+        if index in cache:
+            return cache[index]
+        value = values[index]
+        if isinstance(value, list):
+            if value and isinstance(value[0], str):
+                tag = value[0]
+                if tag in ('Reactive', 'ShallowReactive', 'Ref', 'ShallowRef', 'NuxtError', 'EmptyShallowRef'):
+                    result = hydrate(value[1]) if len(value) > 1 else None
+                elif tag == 'Set':
+                    result = [hydrate(i) for i in value[1:]]
+                elif tag == 'Map':
+                    result = {str(hydrate(k)): hydrate(v) for k, v in zip(value[1::2], value[2::2])}
+                else:
+                    result = value[1] if len(value) > 1 else None  # Date, RegExp 등
+                cache[index] = result
+            else:
+                result = []
+                cache[index] = result
+                result.extend(hydrate(i) for i in value)
+        elif isinstance(value, dict):
+            result = {}
+            cache[index] = result
+            for key, i in value.items():
+                result[key] = hydrate(i)
+        else:
+            result = value
+            cache[index] = result
+        return result
+
+    return hydrate(0)
+
+
+def extract_payloads(html: str) -> Dict[str, Any]:
+    """정적 HTML에서 하이드레이션 JSON을 출처별로 추출합니다."""
+    payloads: Dict[str, Any] = {}
+    soup = make_soup(html)
+
+    next_data = soup.find('script', id='__NEXT_DATA__')
+    if next_data and next_data.string:
+        try:
+            payloads['__NEXT_DATA__'] = json.loads(next_data.string)
+        except ValueError:
+            pass
+
+    nuxt_data = soup.find('script', id='__NUXT_DATA__')
+    if nuxt_data and nuxt_data.string:
+        try:
+            raw = json.loads(nuxt_data.string)
+            payloads['__NUXT_DATA__'] = _unflatten_devalue(raw) if isinstance(raw, list) else raw
+        except (ValueError, RecursionError):
+            pass
+
+    ld_items = []
+    for script in soup.find_all('script', type='application/ld+json'):
+        try:
+            ld_items.append(json.loads(script.string or ''))
+        except ValueError:
+            continue
+    if ld_items:
+        payloads['ld+json'] = ld_items
+
+    decoder = json.JSONDecoder()
+    for script in soup.find_all('script'):
+        text = script.string or ''
+        for match in _WINDOW_STATE_RE.finditer(text):
+            try:
+                payloads[f"window.{match.group(1)}"], _ = decoder.raw_decode(text, match.end())
+            except ValueError:
+                continue  # JSON이 아닌 자바스크립트 표현식
+    return payloads
+
+
+def resolve_path(data: Any, path: str) -> List[Any]:
+    """점(.)으로 구분된 경로로 값을 찾습니다. '*'는 리스트의 모든 항목 또는 dict의 모든 값입니다."""
+    nodes = [data]
+    for part in path.split('.') if path else []:
+        next_nodes = []
+        for node in nodes:
+            if part == '*':
+                if isinstance(node, list):
+                    next_nodes.extend(node)
+                elif isinstance(node, dict):
+                    next_nodes.extend(node.values())
+            elif isinstance(node, dict) and part in node:
+                next_nodes.append(node[part])
+            elif isinstance(node, list) and part.isdigit() and int(part) < len(node):
+                next_nodes.append(node[int(part)])
+        nodes = next_nodes
+    return nodes
+
+
+def walk_lists(data: Any, path: Tuple[str, ...] = ()) -> Iterator[Tuple[Tuple[str, ...], list]]:
+    """JSON 안의 모든 리스트와 그 경로를 순회합니다 (너비 우선, 방문 노드 수 제한)."""
+    queue = deque([(path, data)])
+    visited = 0
+    while queue and visited < MAX_DISCOVERY_NODES:
+        current_path, node = queue.popleft()
+        visited += 1
+        if isinstance(node, dict):
+            queue.extend((current_path + (str(key),), value) for key, value in node.items() if isinstance(value, (dict, list)))
+        elif isinstance(node, list):
+            yield current_path, node
+            queue.extend((current_path + (str(i),), value) for i, value in enumerate(node[:50]) if isinstance(value, (dict, list)))
+
+
+def discover_title_path(payload: Any, title_filter: Callable[[str], bool]) -> Optional[Tuple[str, List[str]]]:
+    """객체 리스트 중 채용공고 제목처럼 보이는 문자열 필드를 찾아 (경로, 제목 목록)을 반환합니다."""
+    best = None
+    best_score = 0.0
+    for list_path, items in walk_lists(payload):
+        objects = [item for item in items if isinstance(item, dict)]
+        if len(objects) < 2:
+            continue
+        keys = {key for obj in objects[:20] for key, value in obj.items() if isinstance(value, str)}
+        for key in keys:
+            values = [obj[key].strip() for obj in objects if isinstance(obj.get(key), str) and obj[key].strip()]
+            titles = [value for value in values if title_filter(value)]
+            if len(titles) < 2 or len(titles) < len(objects) * 0.6:
+                continue
+            score = len(titles) * (2 if key.lower() in TITLE_KEYS else 1)
+            if score > best_score:
+                best_score = score
+                best = ('.'.join(list_path + ('*', key)), titles)
+    return best
+
+
+class HydrationExtractor:
+    """Next.js/Nuxt 등의 임베디드 하이드레이션 JSON에서 채용공고 제목을 추출합니다.
+
+    URL별 (출처, JSON 경로)는 data/hydration_paths.json에 저장되며, 직접 수정하여 경로를 지정할 수도 있습니다.
+    ({"disabled": true}로 두면 해당 URL은 항상 렌더링합니다. 추출이 실패하면 경로는 남기고 failed_at만 기록합니다.)
+    저장된 경로가 없으면 자동 탐색하고, 찾은 경로는 이번 실행의 렌더링 결과와 공고 목록이 완전히 같을 때만 저장하여
+    다음 실행부터 재사용합니다 (경로가 바뀌어도 알림 대상 공고 목록이 달라지지 않도록).
+    """
+
+    def __init__(self, path: str, title_filter: Optional[Callable[[str], bool]] = None):
+        self.store = JsonStateStore(path)
+        if title_filter is None:
+            title_filter = JobPostingSelectorAnalyzer()._is_potential_job_posting
+        self.title_filter = title_filter
+        self.logger = logging.getLogger(__name__)
+        self._candidates: Dict[str, Tuple[str, str, List[str]]] = {}  # URL별 렌더링 결과와 비교할 (출처, 경로, 제목)
+        self._lock = threading.Lock()
+
+    def should_try(self, url: str) -> bool:
+        """최근에 추출이 실패한 URL은 바로 렌더링하도록 건너뜁니다."""
+        entry = self.store.get(url) or {}
+        if entry.get('disabled'):
+            return False
+        failed_at = entry.get('failed_at')
+        return not failed_at or time.time() - failed_at > RETRY_AFTER_FAILURE_DAYS * 86400
+
+    def extract(self, url: str, html: str) -> Optional[List[str]]:
+        """채용공고 제목 목록을 반환합니다. 추출할 수 없으면 None을 반환합니다."""
+        payloads = extract_payloads(html)
+        entry = self.store.get(url) or {}
+
+        if payloads and entry.get('path') and entry.get('source') in payloads:
+            values = resolve_path(payloads[entry['source']], entry['path'])
+            titles = normalize_titles(values)
+            if titles:
+                if entry.get('failed_at'):
+                    self.store.update(url, failed_at=None)
+                return titles
+            self.logger.info(f"  - 저장된 JSON 경로로 공고를 찾지 못함, 다시 탐색: {url} ({entry['source']}: {entry['path']})")
+
+        for source, payload in payloads.items():
+            found = discover_title_path(payload, self.title_filter)
+            if found:
+                path, _ = found
+                # 선택자 경로와 같은 규칙으로 정리한 경로의 모든 값 (렌더링 결과와 완전히 같아야 저장)
+                titles = normalize_titles(resolve_path(payload, path))
+                if titles:
+                    # 이번에는 렌더링하고, 렌더링 결과와 일치하면 경로를 저장 (settle_candidate)
+                    with self._lock:
+                        self._candidates[url] = (source, path, titles)
+                    self.logger.info(f"  - 하이드레이션 JSON 경로 후보 발견, 렌더링 결과로 검증: {source} -> {path}")
+                    return None
+
+        self.store.update(url, failed_at=time.time())
+        return None
+
+    def candidate_titles(self, url: str) -> Optional[List[str]]:
+        """검증 대기 중인 경로 후보의 제목 목록 (없으면 None)"""
+        with self._lock:
+            candidate = self._candidates.get(url)
+        return candidate[2] if candidate else None
+
+    def settle_candidate(self, url: str, accepted: bool):
+        """렌더링 결과와 비교한 경로 후보를 저장하거나 버립니다 (기존 항목의 다른 필드는 유지)."""
+        with self._lock:
+            candidate = self._candidates.pop(url, None)
+        if candidate is None:
+            return
+        source, path, _ = candidate
+        if accepted:
+            self.store.update(url, source=source, path=path, failed_at=None, updated_at=time.strftime('%Y-%m-%d %H:%M:%S'))
+            self.logger.info(f"  - 하이드레이션 JSON 경로 검증 성공, 저장: {source} -> {path}")
+        else:
+            self.store.update(url, failed_at=time.time())
+            self.logger.warning(f"  - 하이드레이션 JSON 경로가 렌더링 결과와 다름, 폐기: {source} -> {path}")
+
+    def finish_batch(self):
+        """렌더링되지 않은 URL의 경로 후보를 버리고 상태를 저장합니다."""
+        with self._lock:
+            self._candidates.clear()
+        self.store.save()
@@ -4,15 +4,33 @@ import pandas as pd
 import requests
 import re
 from bs4 import BeautifulSoup
-from playwright.sync_api import sync_playwright
 from datetime import datetime
 import pytz
+import threading
 import logging
 from typing import Dict, List, Set, Tuple, Optional
 from dotenv import load_dotenv
 from google_sheet_utils import GoogleSheetManager
 from analyze_titles import JobPostingSelectorAnalyzer
 from utils import stabilize_selector, SeleniumRequirementChecker
+from async_renderer import AsyncRenderEngine
+from browser_pool import JOB_TIMEOUT_MARGIN_SECONDS, PlaywrightBrowserPool, memory_bounded_size
+from crawl_scheduler import CrawlScheduler
+from host_latency import HostLatencyTracker
+from http_cache import HttpValidatorCache, NOT_MODIFIED, content_fingerprint
+from rate_limiter import HostRateLimiter
+from http_session import ResponseBodyLimiter, SessionPool, is_read_timeout
+from html_parser import SELECTOR_CACHE, ParsedPage, css_select, make_soup
+from hydration import HydrationExtractor
+from parse_worker import ParseWorkerPool, default_processes, extract_jobs, select_job_titles, try_existing_selectors
+from api_capture import AGREEMENT_THRESHOLD, ApiEndpointCapture, title_agreement
+from async_fetcher import AsyncFetchEngine, FetchResult
+from render_mode import RenderModeManager
+from render_profile import RenderProfileRegistry
+from render_readiness import RenderReadinessDetector, ReadinessRecorder
+from snapshot_store import SnapshotStore
+from url_health import UrlHealthTracker, classify_failure
+from url_rewrite import UrlRewriter
 import concurrent.futures
 
 load_dotenv()
@@ -27,11 +45,137 @@ class JobMonitoringDAG:
         self.webhook_url = os.getenv(webhook_url_env)
         self.company_urls = {}
         self.max_workers = int(os.getenv('MAX_WORKERS', '3'))
+        # URL 처리 레인별 작업자 수 (정적 수집은 I/O 대기 위주라 많이, 렌더링은 브라우저 메모리 한도 안에서)
+        self.static_workers = int(os.getenv('STATIC_WORKERS', str(max(self.max_workers, 16))))
+        browser_memory_mb = int(os.getenv('BROWSER_MAX_MEMORY_MB', '1024'))
+        self.render_workers = memory_bounded_size(int(os.getenv('RENDER_WORKERS', str(self.max_workers))), browser_memory_mb)
         self.foreign_keywords = []  # 외국인 채용공고 키워드
         self.url_groups_for_notification = {}  # URL 그룹 정보 (슬랙 알림용)
 
-        # requests 세션 설정 (쿠키 및 연결 유지)
-        self.session = requests.Session()
+        # 모든 요청(정적/렌더링/판별)이 거치는 전역 + 호스트별 속도 제한
+        self.rate_limiter = HostRateLimiter.from_env(os.environ)
+        # 네트워크 요청 직전 URL 치환 (부하 테스트용 사이트 시뮬레이터 등으로 요청을 돌릴 때 사용)
+        self.url_rewriter = UrlRewriter(os.getenv('CRAWL_URL_REWRITE'))
+        # 정적 응답 본문 최대 크기 (스트리밍으로 읽다가 초과분은 버림)
+        self.body_limiter = ResponseBodyLimiter(max_bytes=int(os.getenv('MAX_RESPONSE_BYTES', str(5 * 1024 * 1024))))
+        # 호스트별 응답 시간 분위수로 정하는 요청 제한 시간 (TIMEOUT_CEILING_SECONDS가 상한)
+        self.host_latency = HostLatencyTracker(
+            os.path.join(self.data_dir, 'host_latency.json'),
+            ceiling=float(os.getenv('TIMEOUT_CEILING_SECONDS', '20')),
+            quantile=float(os.getenv('ADAPTIVE_TIMEOUT_QUANTILE', '0.95')),
+            multiplier=float(os.getenv('ADAPTIVE_TIMEOUT_MULTIPLIER', '3')),
+            enabled=os.getenv('ADAPTIVE_TIMEOUT', 'on').lower() != 'off',
+        )
+
+        # 정적 페이지 수집 엔진 설정 (async: 비동기 선수집, thread: 워커 스레드에서 개별 수집)
+        self.fetch_engine = os.getenv('FETCH_ENGINE', 'async').lower()
+        self.async_fetcher = AsyncFetchEngine(
+            max_concurrency=int(os.getenv('ASYNC_FETCH_CONCURRENCY', '200')),
+            per_host_concurrency=int(os.getenv('ASYNC_FETCH_PER_HOST', '4')),
+            timeout=self.host_latency.ceiling,
+            rate_limiter=self.rate_limiter,
+            body_limiter=self.body_limiter,
+            url_rewriter=self.url_rewriter,
+            latency=self.host_latency,
+        )
+        self.prefetched_pages = {}  # URL별 선수집 결과 (FetchResult)
+        self.probe_pages = {}  # Selenium 필요성 판별 요청에서 받은 URL별 (FetchResult, 파싱된 soup)
+        self.probe_soups = {}  # 크롤링에 재사용할 URL별 (HTML, 파싱된 soup)
+        self._probe_lock = threading.Lock()
+
+        # 조건부 요청 캐시 (ETag/Last-Modified + 이전 추출 결과)
+        self.validator_cache = HttpValidatorCache(os.path.join(self.data_dir, 'http_validator_cache.json'))
+        # 본문 지문 비교 모드 (normalized: 휘발성 토큰 제거 후 비교, strict: 원문 비교, off: 사용 안 함)
+        self.content_hash_mode = os.getenv('CONTENT_HASH_MODE', 'normalized').lower()
+
+        # 렌더링 대상 페이지의 임베디드 하이드레이션 JSON(__NEXT_DATA__ 등)에서 공고를 먼저 추출 (실패 시에만 렌더링)
+        self.hydration_enabled = os.getenv('HYDRATION_EXTRACT', 'on').lower() != 'off'
+        self.hydration = HydrationExtractor(os.path.join(self.data_dir, 'hydration_paths.json'))
+        self.hydrated_results = {}  # URL별 임베디드 JSON 추출 결과 (채용공고 제목 목록)
+
+        # 렌더링 중 채용공고 목록 API(XHR/fetch)를 학습하고, 다음 실행부터 브라우저 없이 직접 호출
+        self.api_replay_enabled = os.getenv('API_REPLAY', 'on').lower() != 'off'
+        self.api_capture = ApiEndpointCapture(
+            os.path.join(self.data_dir, 'api_endpoints.json'),
+            verify_days=float(os.getenv('API_VERIFY_DAYS', '3')),
+        )
+        self.api_results = {}  # URL별 API 직접 호출 결과 (채용공고 제목 목록)
+
+        # URL별 렌더링 방식 학습 (정적 수집 실패 시 렌더링으로 올리고, 렌더링 대상은 주기적으로 정적 재시험 후 내림)
+        self.render_mode_enabled = os.getenv('RENDER_MODE_LEARNING', 'on').lower() != 'off'
+        self.render_modes = RenderModeManager(
+            os.path.join(self.data_dir, 'render_mode_history.json'),
+            demote_after=int(os.getenv('RENDER_MODE_DEMOTE_AFTER', '3')),
+            retest_days=float(os.getenv('RENDER_MODE_RETEST_DAYS', '7')),
+        )
+        self.static_probe_pages = {}  # 렌더링 대상 URL의 정적 HTML (정적 재시험/임베디드 JSON 추출 공용)
+
+        # 실패한 URL(-1/-2)의 실패 종류와 재시도 일정 (일정이 된 URL만 다시 판별 후 수집)
+        self.url_health_enabled = os.getenv('URL_HEALTH', 'on').lower() != 'off'
+        self.url_health = UrlHealthTracker(
+            os.path.join(self.data_dir, 'url_health.json'),
+            max_days=float(os.getenv('URL_REPROBE_MAX_DAYS', '30')),
+        )
+
+        # 수집한 HTML 스냅샷 저장소 (내용 해시 기준 압축 저장 + 실행별 매니페스트)
+        self.snapshot_store = None
+        if os.getenv('SNAPSHOT_STORE', 'on').lower() != 'off':
+            self.snapshot_store = SnapshotStore(
+                os.path.join(self.data_dir, 'snapshots'),
+                keep_runs=int(os.getenv('SNAPSHOT_KEEP_RUNS', '30')),
+                max_age_days=float(os.getenv('SNAPSHOT_MAX_AGE_DAYS', '14')),
+            )
+
+        # Playwright 브라우저 풀 (실행 중 계속 재사용, 첫 렌더링 시 시작)
+        self.browser_pool = PlaywrightBrowserPool(
+            size=int(os.getenv('BROWSER_POOL_SIZE', str(self.render_workers))),
+            max_pages_per_browser=int(os.getenv('BROWSER_MAX_PAGES', '50')),
+            max_memory_mb=browser_memory_mb,
+        )
+        # 렌더링 시 차단할 리소스 프로필 (회사별로 시트의 render_profile 열에서 재정의 가능)
+        self.render_profiles = RenderProfileRegistry(os.getenv('RENDER_PROFILE', 'lite').lower())
+        # 고정 sleep 대신 목록이 안정되는 즉시 반환하는 렌더링 완료 감지
+        self.readiness_recorder = ReadinessRecorder(os.path.join(self.data_dir, 'render_readiness.json'))
+        self.readiness = RenderReadinessDetector(
+            max_wait_ms=int(os.getenv('RENDER_READY_MAX_MS', '20000')),
+            quiet_ms=int(os.getenv('RENDER_READY_QUIET_MS', '500')),
+            network_idle_ms=int(os.getenv('RENDER_READY_NETWORK_IDLE_MS', '2500')),
+            recorder=self.readiness_recorder,
+        )
+
+        # URL별 예상 처리 비용으로 작업 순서 결정 (lpt: 긴 작업 우선, sheet: 시트 순서)
+        self.crawl_scheduler = CrawlScheduler(
+            os.path.join(self.data_dir, 'crawl_costs.json'),
+            host_latency=self.host_latency,
+            readiness_recorder=self.readiness_recorder,
+            enabled=os.getenv('CRAWL_SCHEDULER', 'lpt').lower() != 'sheet',
+        )
+        # HTML 파서 백엔드 (html.parser / lxml / selectolax), 호환성 모드에서는 html.parser 결과와 비교해 다르면 html.parser 결과 사용
+        self.parser_backend = os.getenv('HTML_PARSER', 'html.parser').lower()
+        self.parser_compat = os.getenv('HTML_PARSER_COMPAT', 'off').lower() == 'on'
+        # 선택자가 있는 페이지는 script/style/svg를 제거하고 선택자와 관련된 하위 트리만 파싱 (찾지 못하면 전체 파싱)
+        self.targeted_parse = os.getenv('TARGETED_PARSE', 'on').lower() != 'off'
+        # HTML 파싱/선택자 평가/제목 필터링을 수집 스레드 밖의 프로세스에서 실행 (0이면 작업 스레드에서 처리)
+        self.parse_pool = ParseWorkerPool(int(os.getenv('PARSE_PROCESSES', str(default_processes()))),
+                                          backend=self.parser_backend, compat=self.parser_compat, targeted=self.targeted_parse)
+
+        # 렌더링 방식 (async: 하나의 이벤트 루프에서 다수의 BrowserContext 동시 렌더링, pool: 워커 스레드별 브라우저 풀)
+        self.render_backend = os.getenv('RENDER_BACKEND', 'async').lower()
+        # 비동기 렌더링은 레인 작업자 대신 동시 페이지 수로 병렬도가 정해지므로 같은 메모리 한도를 페이지 단위로 적용
+        self.async_renderer = AsyncRenderEngine(
+            browsers=memory_bounded_size(int(os.getenv('ASYNC_RENDER_BROWSERS', '1')), browser_memory_mb),
+            page_concurrency=memory_bounded_size(int(os.getenv('ASYNC_RENDER_PAGES', '8')),
+                                                 int(os.getenv('ASYNC_RENDER_PAGE_MEMORY_MB', '150'))),
+            goto_timeout_ms=int(self.host_latency.ceiling * 1000),
+            render_profiles=self.render_profiles,
+            readiness=self.readiness,
+            rate_limiter=self.rate_limiter,
+            url_rewriter=self.url_rewriter,
+            api_capture=self.api_capture if self.api_replay_enabled else None,
+            latency=self.host_latency,
+        )
+
+        # requests 세션 설정 (스레드별 세션, 쿠키 및 연결 유지)
         self._setup_session()
         self._setup_logging()
 
@@ -51,20 +195,16 @@ class JobMonitoringDAG:
             'Sec-Fetch-User': '?1',
             'Cache-Control': 'max-age=0'
         }
-        self.session.headers.update(headers)
-
-        # HTTP 어댑터 설정 (연결 풀링, 재시도 등)
-        from requests.adapters import HTTPAdapter
-        from urllib3.util.retry import Retry
 
-        retry_strategy = Retry(
-            total=3,
+        # 연결 풀링, 재시도 설정 (워커 스레드마다 별도 세션, 호스트별 keep-alive 연결 재사용)
+        self.session_pool = SessionPool(
+            headers=headers,
+            pool_connections=int(os.getenv('HTTP_POOL_HOSTS', '100')),
+            retries=3,
             backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
+            body_limiter=self.body_limiter,
+            url_rewriter=self.url_rewriter,
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount('http://', adapter)
-        self.session.mount('https://', adapter)
 
     def _setup_logging(self):
         self.logger = logging.getLogger(__name__)
@@ -78,8 +218,30 @@ class JobMonitoringDAG:
             self.logger.addHandler(handler)
 
     def run(self):
+        if self.snapshot_store:
+            self.snapshot_store.start_run(worksheet=self.worksheet_name)
+        try:
+            self._run_worksheet()
+        finally:
+            if self.snapshot_store:
+                self.snapshot_store.finish_run()
+            self.browser_pool.close()
+            self.parse_pool.close()
+            self.render_profiles.log_summary()
+            self.readiness_recorder.log_summary()
+            self.rate_limiter.log_summary()
+            self.session_pool.log_summary()
+            self.body_limiter.log_summary()
+            self.host_latency.log_summary()
+            SELECTOR_CACHE.log_summary()
+            self._log_url_health()
+            self.session_pool.close()
+
+    def _run_worksheet(self):
         self.sheet_manager = GoogleSheetManager(self.base_dir)
-        self.selenium_checker = SeleniumRequirementChecker()
+        self.selenium_checker = SeleniumRequirementChecker(validator_cache=self.validator_cache, rate_limiter=self.rate_limiter,
+                                                           session_pool=self.session_pool, on_probe=self._remember_probe,
+                                                           parser_backend=self.parser_backend, parser_compat=self.parser_compat)
         self.selector_analyzer = JobPostingSelectorAnalyzer()
 
         self.logger.info(f"🚀 Job Monitoring DAG 시작 - {self.worksheet_name}")
@@ -87,6 +249,8 @@ class JobMonitoringDAG:
         if df_config.empty:
             self.logger.error(f"Google Sheets에서 설정 정보를 가져오지 못했습니다: {self.worksheet_name}")
             return
+        if self.snapshot_store:
+            self.snapshot_store.save_sheet(df_config)
 
         # 키워드 필터링이 필요한 시트 목록
         keyword_sheets = ['5000대_기업', '[등록]채용홈페이지 모음']
@@ -133,10 +297,8 @@ class JobMonitoringDAG:
                 all_warnings.extend(warnings)
                 all_failed_companies.extend(failed_companies)
 
+                # 청크 사이 고정 대기 대신 rate_limiter가 호스트별 요청 간격을 보장
                 self.logger.info(f"--- 청크 처리 종료: {chunk_info} ---")
-                if i < num_chunks - 1:
-                    self.logger.info(f"다음 청크 처리를 위해 2분간 대기합니다.")
-                    time.sleep(120)
 
             if all_warnings or all_failed_companies:
                 self.send_slack_notification({}, all_warnings, all_failed_companies, chunk_info="요약")
@@ -294,7 +456,7 @@ class JobMonitoringDAG:
             return index, None, None, {'company': company_name, 'reason': 'HTML 가져오기 실패', 'url': url, 'selenium_status': -1}
 
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = make_soup(html_content, self.parser_backend)
 
             # 선택자가 없거나 빈 경우 새로 찾기
             if not selector or selector.strip() == '':
@@ -316,7 +478,7 @@ class JobMonitoringDAG:
                 self.logger.info(f"  - 기존 선택자 사용: {selector}")
 
             # 같은 HTML로 공고 수집
-            postings = soup.select(selector)
+            postings = css_select(soup, selector)
             if not postings:
                 return index, selector, None, {'company': company_name, 'reason': f'선택자 \'{selector}\'로 공고를 찾지 못함', 'url': url}
 
@@ -345,8 +507,10 @@ class JobMonitoringDAG:
             df['job_posting_url'].notna() & (df['job_posting_url'].str.strip() != '')
         )
 
+        # 재시도 일정이 된 실패 URL(-1/-2)은 다시 판별하고, 나머지 실패 URL은 이번 실행에서 건너뜀
+        reprobe_mask = self._reprobe_mask(df, valid_companies_mask)
         if valid_companies_mask.any():
-            self._fill_missing_selenium_required(df, valid_companies_mask)
+            self._fill_missing_selenium_required(df, valid_companies_mask, reprobe=reprobe_mask)
 
         # 2. 처리 가능한 회사들 필터링 (HTML 실패(-1), 선택자 실패(-2) 제외)
         companies_to_process = df[
@@ -374,30 +538,77 @@ class JobMonitoringDAG:
         failed_companies = []
         url_results_cache = {}  # URL별 크롤링 결과 캐시
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # URL별로 대표 회사를 선택하여 처리
-            url_args = []
-            for url, company_indices in url_groups.items():
-                # 각 URL 그룹에서 가장 완전한 정보를 가진 회사를 대표로 선택
-                representative_idx = self._select_representative_company(companies_to_process, company_indices)
-                representative_row = companies_to_process.loc[representative_idx]
-                is_shared = len(company_indices) > 1  # 2개 이상 회사가 같은 URL 사용시 공유로 간주
-                url_args.append((representative_idx, representative_row, existing_selectors, url, is_shared))
-
-            # URL별 크롤링 실행
-            results = executor.map(self._process_url_with_companies, url_args)
-
-            for url, result_selector, job_titles, error_info in results:
-                url_results_cache[url] = {
-                    'selector': result_selector,
-                    'job_titles': job_titles,
-                    'error_info': error_info
-                }
+        # URL별로 대표 회사를 선택하여 처리
+        url_args = []
+        for url, company_indices in url_groups.items():
+            # 각 URL 그룹에서 가장 완전한 정보를 가진 회사를 대표로 선택
+            representative_idx = self._select_representative_company(companies_to_process, company_indices)
+            representative_row = companies_to_process.loc[representative_idx]
+            is_shared = len(company_indices) > 1  # 2개 이상 회사가 같은 URL 사용시 공유로 간주
+            url_args.append((representative_idx, representative_row, existing_selectors, url, is_shared))
+
+        # 판별 요청에서 이미 받은 본문은 다시 요청하지 않음
+        self.prefetched_pages = self._take_probe_pages(url_args)
+        # 정적 페이지는 비동기 엔진으로 한번에 선수집 (워커 스레드는 파싱만 수행)
+        self.prefetched_pages.update(self._prefetch_static_pages(url_args))
+        # 재시험 주기가 된 렌더링 대상은 정적 HTML로 먼저 시도 (이전 결과와 같으면 렌더링하지 않음)
+        self.prefetched_pages.update(self._retest_static_mode(url_args))
+        # 렌더링 대상 중 임베디드 JSON으로 공고를 얻은 페이지는 렌더링하지 않음
+        self.hydrated_results = self._extract_hydrated_jobs(url_args)
+        # 학습한 채용공고 API가 있는 페이지도 렌더링하지 않음
+        self.api_results = self._replay_api_endpoints(url_args)
+        # 렌더링이 필요한 페이지도 비동기 렌더링 엔진으로 한번에 선수집
+        self.prefetched_pages.update(self._prerender_pages(url_args))
+
+        # URL별 크롤링 실행 (정적/렌더링 레인이 각자의 작업자로 동시에, 레인마다 예상 처리 시간이 긴 URL부터)
+        results = self.crawl_scheduler.run(
+            self._schedule_url_args(url_args),
+            self._timed_process_url,
+            lane_workers={'static': self.static_workers, 'render': self.render_workers},
+        )
+        # 정적 HTML에서 공고를 찾지 못한 URL은 모아서 렌더링으로 재시도
+        results = self._escalate_static_misses(url_args, results)
+        for url, result_selector, job_titles, error_info in results:
+            url_results_cache[url] = {
+                'selector': result_selector,
+                'job_titles': job_titles,
+                'error_info': error_info
+            }
+
+        self.prefetched_pages = {}
+        self.probe_pages = {}
+        self.probe_soups = {}
+        self.static_probe_pages = {}
+        self.hydrated_results = {}
+        self.api_results = {}
+        self.validator_cache.save()
+        self.hydration.finish_batch()
+        self.api_capture.finish_batch()
+        self.render_modes.save()
+        self.host_latency.save()
+        self.crawl_scheduler.save()
 
         # 6. 결과를 모든 관련 회사에 적용
         for url, company_indices in url_groups.items():
             cached_result = url_results_cache[url]
 
+            if self.snapshot_store:
+                self.snapshot_store.record(
+                    url,
+                    companies=[companies_to_process.loc[idx, '회사_한글_이름'] for idx in company_indices],
+                    selector=cached_result['selector'],
+                    job_titles=cached_result['job_titles'],
+                    error=cached_result['error_info']['reason'] if cached_result['error_info'] else None,
+                )
+
+            selenium_status = (cached_result['error_info'] or {}).get('selenium_status')
+            if self.url_health_enabled and selenium_status in (-1, -2):
+                health = self.url_health.record_failure(url, selenium_status)
+                next_probe = datetime.fromtimestamp(health['next_probe_at']).strftime('%Y-%m-%d %H:%M')
+                self.logger.info(f"  - {url[:50]}... 실패 기록: {health['kind']} (연속 {health['failures']}회), 다음 재시도 {next_probe}")
+            elif self.url_health_enabled and not cached_result['error_info']:
+                self.url_health.record_success(url)
+
             if cached_result['error_info']:
                 # 실패한 경우 모든 관련 회사에 동일한 오류 적용
                 for idx in company_indices:
@@ -414,6 +625,7 @@ class JobMonitoringDAG:
                     self.logger.info(f"  - URL {url[:50]}... 실패 → {len(company_indices)}개 회사에 동일 오류 적용")
             else:
                 # 성공한 경우 모든 관련 회사에 동일한 결과 적용
+                learned_mode = self.render_modes.mode(url) if self.render_mode_enabled else None
                 for idx in company_indices:
                     company_name = companies_to_process.loc[idx, '회사_한글_이름']
 
@@ -421,6 +633,10 @@ class JobMonitoringDAG:
                     if cached_result['selector']:
                         df.loc[idx, 'selector'] = cached_result['selector']
 
+                    # 학습한 렌더링 방식 반영
+                    if learned_mode is not None and df.loc[idx, 'selenium_required'] != learned_mode:
+                        df.loc[idx, 'selenium_required'] = learned_mode
+
                     # 채용공고 결과 적용 (URL 그룹 정보도 함께 저장)
                     current_jobs[company_name] = cached_result['job_titles']
                     self.company_urls[company_name] = url
@@ -428,6 +644,8 @@ class JobMonitoringDAG:
                 if len(company_indices) > 1:
                     self.logger.info(f"  - URL {url[:50]}... 성공 → {len(company_indices)}개 회사에 동일 결과 적용 ({len(cached_result['job_titles'])}개 공고)")
 
+        self.url_health.save()
+
         # 7. URL 그룹 정보 저장 (슬랙 알림용)
         self.url_groups_for_notification = self._prepare_url_groups_for_notification(url_groups, companies_to_process, current_jobs)
 
@@ -541,7 +759,50 @@ class JobMonitoringDAG:
         return company_indices[0]
 
     def _process_url_with_companies(self, args):
-        """URL별로 크롤링을 수행합니다 (기존 _process_company_complete 기반)."""
+        """URL별로 크롤링을 수행합니다."""
+        return self._crawl_url(args)
+
+    def _escalate_static_misses(self, url_args: List[Tuple], results: List[Tuple]) -> List[Tuple]:
+        """정적 HTML에서 공고를 찾지 못한 URL을 렌더링으로 한 번 더 수집합니다.
+
+        정적 레인 작업자 안에서 렌더링하지 않고 모아서 비동기 렌더링 엔진(RENDER_BACKEND=async) 또는 렌더링 레인으로 처리합니다.
+        렌더링으로 공고를 찾은 URL만 결과를 바꾸고 렌더링 방식 전환을 기록합니다.
+        """
+        if not self.render_mode_enabled:
+            return results
+
+        results_by_url = {result[0]: result for result in results}
+        escalations = []
+        for index, row, existing_selectors, url, is_shared in url_args:
+            result = results_by_url.get(url)
+            if result is None or row['selenium_required'] or result[2]:
+                continue
+            error_info = result[3]
+            if error_info and error_info.get('selenium_status') != -2:
+                continue
+            self.logger.info(f"  - {row['회사_한글_이름']} 정적 HTML에서 공고를 찾지 못함, 렌더링으로 재시도")
+            self.prefetched_pages.pop(url, None)
+            self.validator_cache.discard(url)
+            render_row = row.copy()
+            render_row['selenium_required'] = 1
+            escalations.append((index, render_row, existing_selectors, url, is_shared))
+        if not escalations:
+            return results
+
+        self.prefetched_pages.update(self._prerender_pages(escalations))
+        rendered_results = self.crawl_scheduler.run(
+            self._schedule_url_args(escalations),
+            self._timed_process_url,
+            lane_workers={'static': self.static_workers, 'render': self.render_workers},
+        )
+        for rendered in rendered_results:
+            if rendered[2]:
+                self.render_modes.record_escalation(rendered[0])
+                results_by_url[rendered[0]] = rendered
+        return list(results_by_url.values())
+
+    def _crawl_url(self, args):
+        """URL 하나를 시트에 지정된 방식으로 수집하고 파싱합니다 (기존 _process_company_complete 기반)."""
         index, row, existing_selectors, url, is_shared = args
         company_name = row['회사_한글_이름']
         selector = row.get('selector', '')
@@ -551,52 +812,340 @@ class JobMonitoringDAG:
         self.logger.info(f"- {company_name} URL 처리 중... ({url_type})")
         self.company_urls[company_name] = url
 
-        html_content = self.get_html_content_for_crawling(url, use_selenium)
+        for direct_results, source in ((self.hydrated_results, '임베디드 JSON'), (self.api_results, '채용공고 API')):
+            if url in direct_results:
+                self.logger.info(f"  - {company_name} 성공: {source}에서 {len(direct_results[url])}개 채용공고 수집 (렌더링 생략)")
+                return url, None, direct_results[url], None
+
+        html_content = self._get_crawl_html(url, use_selenium, selector, render_profile=row.get('render_profile'))
+
+        if html_content is NOT_MODIFIED:
+            result = self._reuse_cached_result(url, company_name)
+            if result is not None:
+                return result
+            # 조건부 요청 이후 이전 결과가 사라졌으면(렌더링 전환 등) 조건 없이 다시 가져옴
+            html_content = self.get_html_content_for_crawling(url, use_selenium, self._readiness_selector(selector),
+                                                              render_profile=row.get('render_profile'))
 
         if not html_content:
             self.logger.error(f"  - HTML 가져오기 실패: {company_name} (selenium_required를 -1로 설정)")
             return url, None, [], {'company': company_name, 'reason': 'HTML 가져오기 실패', 'url': url, 'selenium_status': -1}
 
+        if self.snapshot_store:
+            self.snapshot_store.stage(url, html_content)
+        self.crawl_scheduler.note_size(url, len(html_content))
+
+        # 본문이 이전 실행과 같으면 파싱/선택자 평가/필터링을 모두 건너뜀
+        content_hash = self._content_hash(html_content)
+        if content_hash and self.validator_cache.matches_content(url, content_hash, selector):
+            result = self._reuse_cached_result(url, company_name, reason='본문 동일')
+            if result is not None:
+                self.validator_cache.commit(url, result[1], result[2], content_hash=content_hash)  # 새 검증자 반영
+                if use_selenium:
+                    self._learn_from_render(url, result[2])
+                return result
+
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            # 판별 요청에서 이미 파싱한 본문이면 그 soup을 그대로 사용
+            probe_html, soup = self.probe_soups.pop(url, (None, None))
+            if probe_html is not html_content:
+                soup = None
 
-            # 선택자가 없거나 빈 경우 새로 찾기
             if not selector or selector.strip() == '':
                 self.logger.info(f"  - {company_name} 선택자 찾기 중...")
-                found_selector = self._try_existing_selectors(soup, existing_selectors, company_name)
-
-                if found_selector:
-                    selector = found_selector
-                    self.logger.info(f"  - 기존 선택자 적용 성공: {selector}")
-                else:
-                    best_selector, _ = self.selector_analyzer.find_best_selector(soup)
-                    if best_selector:
-                        selector = best_selector
-                        self.logger.info(f"  - 새 선택자 찾기 성공: {selector}")
-                    else:
-                        self.logger.warning(f"  - {company_name} 선택자 찾기 실패 (selenium_required를 -2로 설정)")
-                        return url, None, [], {'company': company_name, 'reason': '선택자를 찾을 수 없음', 'url': url, 'selenium_status': -2}
+            extracted = self._extract_jobs(html_content, soup, selector, existing_selectors)
+            if extracted.get('mismatch'):
+                mismatch = extracted['mismatch']
+                self.logger.warning(f"  - {company_name} 파서 호환성 불일치 ({mismatch['backend']}, 선택자 {mismatch['selector']}): "
+                                    f"누락 {mismatch['missing']}, 추가 {mismatch['extra']} - html.parser 결과 사용")
+
+            if extracted['source'] is None:
+                self.logger.warning(f"  - {company_name} 선택자 찾기 실패 (selenium_required를 -2로 설정)")
+                return url, None, [], {'company': company_name, 'reason': '선택자를 찾을 수 없음', 'url': url, 'selenium_status': -2}
+            selector = extracted['selector']
+            if extracted['source'] == 'existing':
+                self._log_selector_match(extracted['match'])
+                self.logger.info(f"  - 기존 선택자 적용 성공: {selector}")
+            elif extracted['source'] == 'new':
+                self.logger.info(f"  - 새 선택자 찾기 성공: {selector}")
             else:
                 self.logger.info(f"  - 기존 선택자 사용: {selector}")
 
             # 채용공고 수집
-            postings = soup.select(selector)
-            if not postings:
+            job_titles = extracted['titles']
+            if job_titles is None:
                 self.logger.warning(f"  - {company_name} 선택자로 요소를 찾을 수 없음: {selector}")
                 return url, selector, [], None
 
-            job_titles = [elem.get_text(strip=True) for elem in postings if elem.get_text(strip=True)]
-            job_titles = [title for title in job_titles if len(title) > 2 and len(title) < 200]
-            job_titles = list(set(job_titles))  # 중복 제거
-
             url_type = "URL 공유" if is_shared else "개별 URL"
             self.logger.info(f"  - {company_name} 성공: {len(job_titles)}개 채용공고 수집 ({url_type})")
+            self.validator_cache.commit(url, selector, job_titles, content_hash=content_hash)
+            if use_selenium:
+                self._learn_from_render(url, job_titles)
             return url, selector, job_titles, None
 
         except Exception as e:
             self.logger.error(f"  - {company_name} 처리 중 오류: {e}")
             return url, None, [], {'company': company_name, 'reason': f'처리 오류: {str(e)}', 'url': url, 'selenium_status': None}
 
+    def _learn_from_render(self, url: str, job_titles: List[str]):
+        """렌더링 결과로 채용공고 API를 학습하고, 새로 찾은 하이드레이션 JSON 경로를 검증합니다."""
+        if self.api_replay_enabled:
+            self.api_capture.learn(url, job_titles)
+        hydrated_titles = self.hydration.candidate_titles(url)
+        if hydrated_titles is not None and job_titles:
+            # 경로가 바뀌어도 보고되는 공고 목록이 같도록 렌더링 결과와 완전히 같을 때만 저장
+            self.hydration.settle_candidate(url, set(hydrated_titles) == set(job_titles))
+
+    def _scheduling_info(self, url: str, row) -> Tuple[str, Optional[str]]:
+        """URL의 레인(static/render)과 이미 확보된 HTML(없으면 None)을 반환합니다."""
+        lane = 'render' if row['selenium_required'] else 'static'
+        if url in self.hydrated_results or url in self.api_results:
+            return lane, ''
+        prefetched = self.prefetched_pages.get(url)
+        if prefetched is not None:
+            return lane, prefetched.html or ''
+        return lane, None
+
+    def _schedule_url_args(self, url_args: List[Tuple]) -> List[Tuple]:
+        """URL별 레인과 예상 처리 비용을 추정합니다."""
+        jobs = []
+        for args in url_args:
+            _, row, _, url, _ = args
+            lane, html = self._scheduling_info(url, row)
+            # 이미 HTML을 확보한 렌더링 대상은 브라우저를 쓰지 않으므로 정적 레인에서 파싱
+            jobs.append((args, lane if html is None else 'static', self.crawl_scheduler.estimate(url, lane, html)))
+        return jobs
+
+    def _timed_process_url(self, args):
+        """URL을 처리하고 실제 처리 시간을 다음 실행의 비용 추정을 위해 기록합니다."""
+        _, row, _, url, _ = args
+        lane, html = self._scheduling_info(url, row)
+        start = time.time()
+        result = self._process_url_with_companies(args)
+        self.crawl_scheduler.record(url, lane, time.time() - start, prefetched=html is not None)
+        return result
+
+    def _extract_jobs(self, html: str, soup: Optional[BeautifulSoup], selector: str, existing_selectors: List[str]) -> Dict:
+        """공고 제목을 추출합니다. 이미 파싱된 soup이 없으면 파싱 프로세스 풀에 맡깁니다."""
+        if soup is None and self.parse_pool.enabled:
+            return self.parse_pool.extract(html, selector, existing_selectors)
+        return extract_jobs(html, selector, existing_selectors, analyzer=self.selector_analyzer, soup=soup,
+                            backend=self.parser_backend, compat=self.parser_compat, targeted=self.targeted_parse)
+
+    def _remember_probe(self, url: str, response, html: str, soup: BeautifulSoup):
+        """Selenium 필요성 판별에 사용한 응답을 같은 실행의 크롤링 단계로 넘깁니다."""
+        result = FetchResult(url=url, html=html, status=response.status_code, headers=dict(response.headers))
+        with self._probe_lock:
+            self.probe_pages[url.strip()] = (result, soup)
+
+    def _take_probe_pages(self, url_args: List[Tuple]) -> Dict:
+        """판별 응답을 정적 수집 대상은 선수집 결과로, 렌더링 대상은 임베디드 JSON 추출용 정적 HTML로 넘깁니다."""
+        with self._probe_lock:
+            probe_pages, self.probe_pages = self.probe_pages, {}
+
+        pages = {}
+        for _, row, _, url, _ in url_args:
+            if url not in probe_pages:
+                continue
+            result, soup = probe_pages[url]
+            if row['selenium_required']:
+                self.static_probe_pages[url] = result.html
+            else:
+                pages[url] = result
+                self.probe_soups[url] = (result.html, soup)
+
+        if probe_pages:
+            self.logger.info(f"판별 요청 응답 재사용: {len(probe_pages)}개 중 {len(pages)}개 정적 수집 생략")
+        return pages
+
+    def _prefetch_static_pages(self, url_args: List[Tuple]) -> Dict:
+        """selenium_required가 0인 URL들을 비동기 엔진으로 미리 수집합니다."""
+        if self.fetch_engine != 'async':
+            return {}
+
+        static_selectors = {
+            url: row.get('selector', '') for _, row, _, url, _ in url_args
+            if not row['selenium_required'] and url not in self.prefetched_pages
+        }
+        if not static_selectors:
+            return {}
+
+        def headers_for(url):
+            headers = self._crawling_headers(url)
+            headers.update(self.validator_cache.conditional_headers(url, static_selectors[url]))
+            return headers
+
+        self.logger.info(f"정적 페이지 {len(static_selectors)}개 비동기 선수집 시작")
+        return self.async_fetcher.fetch_all(static_selectors.keys(), headers_for=headers_for)
+
+    def _retest_static_mode(self, url_args: List[Tuple]) -> Dict:
+        """재시험 주기가 된 렌더링 대상 URL을 정적 HTML로 수집해 이전 결과와 비교합니다.
+
+        이전 실행과 같은 공고를 얻은 URL은 정적 HTML을 선수집 결과로 반환하여 이번 실행의 렌더링을 생략합니다.
+        """
+        if not self.render_mode_enabled:
+            return {}
+
+        for _, row, _, url, _ in url_args:
+            self.render_modes.observe(url, row['selenium_required'])
+
+        targets = {}
+        for _, row, _, url, _ in url_args:
+            selector = (row.get('selector') or '').strip()
+            previous = (self.validator_cache.lookup(url) or {}).get('job_titles')
+            if selector and previous and self.render_modes.due_for_retest(url):
+                targets[url] = (selector, set(previous))
+        if not targets:
+            return {}
+
+        self.static_probe_pages.update(self._fetch_static_html(list(targets)))
+        results = {}
+        demoted = 0
+        for url, (selector, previous) in targets.items():
+            html = self.static_probe_pages.get(url)
+            titles = None
+            if html:
+                try:
+                    titles = select_job_titles(ParsedPage(html, self.parser_backend, target=selector if self.targeted_parse else None), selector)
+                except Exception:
+                    titles = None
+            success = bool(titles) and title_agreement(set(titles), previous) >= AGREEMENT_THRESHOLD
+            demoted += self.render_modes.record_retest(url, success)
+            if success:
+                results[url] = FetchResult(url=url, html=html, status=200)
+
+        self.logger.info(f"정적 재시험: 렌더링 대상 {len(targets)}개 중 {len(results)}개 정적 수집 성공 (정적 전환 {demoted}개)")
+        return results
+
+    def _extract_hydrated_jobs(self, url_args: List[Tuple]) -> Dict[str, List[str]]:
+        """selenium_required가 1인 URL의 정적 응답에서 임베디드 JSON으로 채용공고를 추출합니다."""
+        if not self.hydration_enabled:
+            return {}
+
+        # 채용공고 API를 이미 학습한 URL은 API 직접 호출로 처리
+        targets = [
+            url for _, row, _, url, _ in url_args
+            if row['selenium_required'] and self.hydration.should_try(url) and url not in self.prefetched_pages
+            and not (self.api_replay_enabled and self.api_capture.has_endpoint(url))
+        ]
+        if not targets:
+            return {}
+
+        # 정적 재시험에서 이미 받은 HTML은 다시 요청하지 않음
+        pages = {url: self.static_probe_pages[url] for url in targets if url in self.static_probe_pages}
+        pages.update(self._fetch_static_html([url for url in targets if url not in pages]))
+        results = {}
+        for url, html in pages.items():
+            titles = self.hydration.extract(url, html)
+            if titles:
+                results[url] = titles
+                if self.snapshot_store:
+                    self.snapshot_store.stage(url, html)
+
+        self.logger.info(f"임베디드 JSON 추출: 렌더링 대상 {len(targets)}개 중 {len(results)}개 렌더링 생략")
+        return results
+
+    def _replay_api_endpoints(self, url_args: List[Tuple]) -> Dict[str, List[str]]:
+        """학습한 채용공고 API를 직접 호출합니다. 실패하거나 검증 주기가 된 URL은 렌더링합니다."""
+        if not self.api_replay_enabled:
+            return {}
+
+        targets = [
+            url for _, row, _, url, _ in url_args
+            if row['selenium_required'] and url not in self.hydrated_results and url not in self.prefetched_pages
+            and self.api_capture.has_endpoint(url)
+        ]
+        if not targets:
+            return {}
+
+        def call(url):
+            return url, self.api_capture.fetch_titles(url, self.session_pool, self.rate_limiter)
+
+        results = {}
+        verifying = 0
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for url, titles in executor.map(call, targets):
+                if titles is None:
+                    continue
+                if self.api_capture.needs_verification(url):
+                    # 이번에는 렌더링하고 렌더링 결과와 API 결과를 비교
+                    self.api_capture.expect_verification(url, titles)
+                    verifying += 1
+                    continue
+                results[url] = titles
+
+        self.logger.info(f"채용공고 API 직접 호출: {len(targets)}개 중 {len(results)}개 렌더링 생략 (검증용 렌더링 {verifying}개)")
+        return results
+
+    def _fetch_static_html(self, urls: List[str]) -> Dict[str, str]:
+        """URL들의 정적 HTML을 가져옵니다 (조건부 요청 없이)."""
+        if self.fetch_engine == 'async':
+            fetched = self.async_fetcher.fetch_all(urls, headers_for=self._crawling_headers)
+            return {url: result.html for url, result in fetched.items() if result.ok}
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pages = executor.map(lambda url: (url, self.get_html_content(url, False)), urls)
+            return {url: html for url, html in pages if html}
+
+    def _prerender_pages(self, url_args: List[Tuple]) -> Dict:
+        """selenium_required가 1인 URL들을 비동기 렌더링 엔진으로 미리 렌더링합니다."""
+        if self.render_backend != 'async':
+            return {}
+
+        render_jobs = [
+            (url, self._readiness_selector(row.get('selector')), row.get('render_profile'))
+            for _, row, _, url, _ in url_args
+            if row['selenium_required'] and url not in self.hydrated_results and url not in self.api_results
+            and url not in self.prefetched_pages
+        ]
+        if not render_jobs:
+            return {}
+        if self.crawl_scheduler.enabled:
+            # 오래 걸리는 페이지부터 동시 페이지 슬롯에 배정
+            render_jobs.sort(key=lambda job: self.crawl_scheduler.estimate(job[0], 'render'), reverse=True)
+
+        self.logger.info(f"렌더링 페이지 {len(render_jobs)}개 비동기 렌더링 시작")
+        return self.async_renderer.render_all(render_jobs)
+
+    def _get_crawl_html(self, url: str, use_selenium, selector: Optional[str] = None, render_profile: Optional[str] = None):
+        """선수집된 결과가 있으면 사용하고, 없으면 직접 HTML을 가져옵니다.
+
+        정적 페이지는 조건부 요청을 보내며, 변경이 없으면(304) NOT_MODIFIED를 반환합니다.
+        """
+        prefetched = self.prefetched_pages.get(url)
+        if prefetched is not None:
+            if prefetched.status == 304:
+                return NOT_MODIFIED
+            if prefetched.ok:
+                self.validator_cache.remember(url, prefetched.headers)
+            else:
+                self.url_health.note_failure(url, classify_failure(prefetched.status, prefetched.error), prefetched.error or '')
+            return prefetched.html
+
+        extra_headers = None if use_selenium else self.validator_cache.conditional_headers(url, selector)
+        return self.get_html_content_for_crawling(url, use_selenium, self._readiness_selector(selector),
+                                                  extra_headers=extra_headers, render_profile=render_profile)
+
+    @staticmethod
+    def _readiness_selector(selector) -> Optional[str]:
+        """렌더링 대기에 쓸 시트 선택자 (빈 값/NaN이면 None)"""
+        return selector.strip() if isinstance(selector, str) and selector.strip() else None
+
+    def _reuse_cached_result(self, url: str, company_name: str, reason: str = '304'):
+        """변경이 없는 URL의 이전 선택자와 채용공고를 파싱 없이 그대로 반환합니다. 이전 결과가 없으면 None을 반환합니다."""
+        cached = self.validator_cache.lookup(url)
+        if not cached or cached.get('job_titles') is None:
+            self.logger.warning(f"  - {company_name} 변경 없음 ({reason})이지만 이전 결과가 없음, 다시 수집")
+            return None
+        self.logger.info(f"  - {company_name} 변경 없음 ({reason}): 이전 결과 {len(cached['job_titles'])}개 공고 재사용")
+        return url, cached['selector'], list(cached['job_titles']), None
+
+    def _content_hash(self, html_content: str) -> Optional[str]:
+        if self.content_hash_mode == 'off':
+            return None
+        return content_fingerprint(html_content, strip_volatile=self.content_hash_mode != 'strict')
+
     def _prepare_url_groups_for_notification(self, url_groups: Dict[str, List[int]], companies_df: pd.DataFrame, current_jobs: Dict) -> Dict[str, List[str]]:
         """슬랙 알림용 URL 그룹 정보를 준비합니다."""
         notification_groups = {}
@@ -651,83 +1200,41 @@ class JobMonitoringDAG:
         self.logger.info(f"수집된 선택자 {len(final_selectors)}개 (20자 이상만, 기존: {len(sorted_selectors)}개, 확장: {len(expanded_selectors)}개)")
         return final_selectors
 
-    def _is_specific_enough_selector(self, selector: str) -> bool:
-        """선택자가 충분히 구체적인지 판단합니다."""
-        selector = selector.strip()
-        if not selector:
-            return False
-
-        parts = selector.split()
-
-        if len(parts) == 1:
-            part = parts[0].lower()
-            if '.' in part or '#' in part:
-                return True
-            if '[' in part and ']' in part:
-                if part == 'a[href]' or part.endswith('[href]') :
-                    return False
-                return True
-            if ':' in part:
-                return True
-            return False
-
-        if len(parts) >= 2:
-            return True
-
-        return False
-
     def _try_existing_selectors(self, soup: BeautifulSoup, existing_selectors: List[str], _: str) -> Optional[str]:
         """기존 선택자들을 순서대로 시도해서 유효한 것을 찾습니다."""
-        # 20자 이상의 선택자만 재활용 시도
-        valid_selectors = [s for s in existing_selectors if len(s) >= 20 and self._is_specific_enough_selector(s)]
-
-        for i, selector in enumerate(valid_selectors):
-            # 이미 필터링되었으므로 길이 체크 불필요
-
-            try:
-                elements = soup.select(selector)
-                if not elements:
-                    continue
-
-                titles = [elem.get_text(strip=True) for elem in elements]
-                valid_titles = [title for title in titles if title and len(title) > 3]
-
-                if len(valid_titles) >= 1:
-                    job_related_titles = [title for title in valid_titles
-                                        if self.selector_analyzer._is_potential_job_posting(title)]
-
-                    if len(job_related_titles) >= 1:
-                        quality_score = len(job_related_titles) / len(valid_titles)
-
-                        if len(valid_titles) > 50:
-                            if quality_score < 0.8:
-                                continue
-                        elif len(valid_titles) > 20:
-                            if quality_score < 0.6:
-                                continue
-                        elif len(valid_titles) > 5:
-                            if quality_score < 0.4:
-                                continue
-
-                        category = "기존" if i < 10 else "확장" if i < 50 else "패턴"
-                        self.logger.info(f"  - {category} 선택자 '{selector}' 검증 성공 (채용공고: {len(job_related_titles)}개/{len(valid_titles)}개, 품질: {quality_score:.1%})")
-                        if len(valid_titles) <= 5:
-                            for title in valid_titles[:3]:
-                                self.logger.info(f"    예시: {title[:50]}...")
-                        return selector
-
-            except Exception:
-                continue
-
-        return None
-
-    def _fill_missing_selenium_required(self, df: pd.DataFrame, mask: pd.Series):
-        """selenium_required 값이 없는 회사들을 자동으로 채웁니다. (병렬 처리)"""
+        match = try_existing_selectors(ParsedPage(None, soup=soup), existing_selectors, self.selector_analyzer._is_potential_job_posting)
+        if not match:
+            return None
+        self._log_selector_match(match)
+        return match['selector']
+
+    def _log_selector_match(self, match: Dict):
+        self.logger.info(f"  - {match['category']} 선택자 '{match['selector']}' 검증 성공 "
+                         f"(채용공고: {match['job_count']}개/{match['valid_count']}개, 품질: {match['quality']:.1%})")
+        for title in match['examples']:
+            self.logger.info(f"    예시: {title[:50]}...")
+
+    def _reprobe_mask(self, df: pd.DataFrame, mask: pd.Series) -> pd.Series:
+        """실패 상태(-1/-2) 중 재시도 일정이 된 회사들을 고릅니다."""
+        failed = mask & df['selenium_required'].isin([-1, -2])
+        if not self.url_health_enabled:
+            return failed & (df['selenium_required'] == -2)  # 기존 동작: 선택자 실패는 매번 다시 판별
+
+        due_urls = {url for url in df.loc[failed, 'job_posting_url'].str.strip().unique() if self.url_health.is_due(url)}
+        reprobe = failed & df['job_posting_url'].str.strip().isin(due_urls)
+        if failed.any():
+            self.logger.info(f"실패 상태 회사 {failed.sum()}개 중 {reprobe.sum()}개 재시도 (나머지는 재시도 일정까지 건너뜀)")
+        return reprobe
+
+    def _fill_missing_selenium_required(self, df: pd.DataFrame, mask: pd.Series, reprobe: Optional[pd.Series] = None):
+        """selenium_required 값이 없는 회사들(과 다시 판별할 실패 회사들)을 자동으로 채웁니다. (병렬 처리)"""
         missing_selenium_mask = mask & (
             df['selenium_required'].isna() |
             (df['selenium_required'] == '') |
-            (~df['selenium_required'].isin([0, 1, -1]))
+            (~df['selenium_required'].isin([0, 1, -1, -2]))
         )
+        if reprobe is not None:
+            missing_selenium_mask |= reprobe
         missing_selenium = df[missing_selenium_mask]
 
         if missing_selenium.empty:
@@ -757,6 +1264,14 @@ class JobMonitoringDAG:
 
         self.logger.info(f"{len(missing_selenium)}개 회사의 selenium_required 값 설정 완료.")
     
+    def _log_url_health(self):
+        if not self.url_health_enabled:
+            return
+        counts = self.url_health.summary()
+        if counts:
+            details = ', '.join(f"{kind} {count}개" for kind, count in sorted(counts.items(), key=lambda x: -x[1]))
+            self.logger.info(f"실패 URL 재시도 대기: {sum(counts.values())}개 ({details})")
+
     def _determine_selenium_requirement(self, url: str, _: str) -> int:
         """URL을 기반으로 Selenium 필요 여부를 동적으로 판단합니다."""
 
@@ -781,8 +1296,8 @@ class JobMonitoringDAG:
             return None, {'company': company_name, 'reason': 'HTML 가져오기 실패', 'url': url}
 
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            postings = soup.select(selector)
+            soup = make_soup(html_content, self.parser_backend)
+            postings = css_select(soup, selector)
             if not postings:
                 return None, {'company': company_name, 'reason': f'선택자 \'{selector}\'로 공고를 찾지 못함', 'url': url}
 
@@ -845,34 +1360,19 @@ class JobMonitoringDAG:
         max_retries = 2
         for attempt in range(max_retries):
             try:
+                # 첫 시도는 호스트별 적응형 제한 시간, 재시도는 전체 제한 시간
+                timeout = self.host_latency.timeout_for(url, 'render' if use_selenium else 'static') if attempt == 0 else self.host_latency.ceiling
                 if not use_selenium:
                     # 세션에 이미 헤더가 설정되어 있음
-                    response = self.session.get(url, timeout=20)
+                    self.rate_limiter.acquire(url)
+                    start = time.time()
+                    response, html = self.session_pool.fetch_text(url, timeout=timeout)
                     response.raise_for_status()
-                    return response.text
+                    self.host_latency.record(url, time.time() - start, 'static')
+                    return html
                 else:
-                    playwright, browser = self.create_playwright_browser()
-                    if not playwright or not browser:
-                        raise Exception("Playwright 브라우저를 시작할 수 없습니다.")
-
-                    try:
-                        page = browser.new_page()
-                        page.goto(url, timeout=20000)
-
-                        if selector:
-                            try:
-                                page.wait_for_selector(selector, timeout=20000)
-                                time.sleep(3)
-                            except Exception:
-                                self.logger.warning(f"'{selector}' 요소를 기다리는 데 실패했습니다.")
-                        else:
-                            time.sleep(5)
-
-                        html_content = page.content()
-                        return html_content
-                    finally:
-                        browser.close()
-                        playwright.stop()
+                    return self.browser_pool.run(lambda context: self._render_page(context, url, selector, timeout_ms=int(timeout * 1000)),
+                                                  timeout=self._render_job_timeout(timeout))
 
             except Exception as e:
                 if "timeout" in str(e).lower() and attempt < max_retries - 1:
@@ -883,54 +1383,28 @@ class JobMonitoringDAG:
                     self.logger.error(f"HTML 가져오기 실패: {url}, 오류: {e}")
                     return None
 
-    def get_html_content_for_crawling(self, url, use_selenium, selector=None):
+    def get_html_content_for_crawling(self, url, use_selenium, selector=None, extra_headers=None, render_profile=None):
         """실제 크롤링용 HTML 가져오기 메서드 (Playwright 사용)"""
         try:
             if not use_selenium:
-                # 더 현실적인 브라우저 헤더 사용
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-                    'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
-                    'Accept-Encoding': 'gzip, deflate, br',
-                    'DNT': '1',
-                    'Connection': 'keep-alive',
-                    'Upgrade-Insecure-Requests': '1',
-                    'Sec-Fetch-Dest': 'document',
-                    'Sec-Fetch-Mode': 'navigate',
-                    'Sec-Fetch-Site': 'none',
-                    'Sec-Fetch-User': '?1',
-                    'Cache-Control': 'max-age=0',
-                    'Referer': url  # 리퍼러 추가로 자연스러운 브라우징 시뮬레이션
-                }
-                response = requests.get(url, headers=headers, timeout=20, verify=False)
+                headers = self._crawling_headers(url)
+                if extra_headers:
+                    headers.update(extra_headers)
+                response, html = self._fetch_with_budget(url, headers)
                 response.raise_for_status()
                 self.logger.debug(f"HTTP 요청 성공: {url} (응답 코드: {response.status_code})")
-                return response.text
+                if response.status_code == 304:
+                    return NOT_MODIFIED
+                self.validator_cache.remember(url, response.headers)
+                return html
             else:
-                playwright, browser = self.create_playwright_browser()
-                if not playwright or not browser:
-                    raise Exception("Playwright 브라우저를 시작할 수 없습니다.")
-
                 max_retries = 2
                 for attempt in range(max_retries):
+                    # 첫 시도는 호스트별 적응형 제한 시간, 재시도는 전체 제한 시간
+                    timeout = self.host_latency.timeout_for(url, 'render') if attempt == 0 else self.host_latency.ceiling
                     try:
-                        page = browser.new_page()
-                        page.goto(url, timeout=20000)
-
-                        if selector:
-                            try:
-                                page.wait_for_selector(selector, timeout=20000)
-                                time.sleep(3)
-                            except Exception:
-                                self.logger.warning(f"선택자 '{selector}' 요소를 기다리는 데 실패했습니다.")
-                        else:
-                            time.sleep(5)
-
-                        html_content = page.content()
-                        browser.close()
-                        playwright.stop()
-                        return html_content
+                        return self.browser_pool.run(lambda context: self._render_page(context, url, selector, render_profile, int(timeout * 1000)),
+                                                     timeout=self._render_job_timeout(timeout))
 
                     except Exception as e:
                         if "timeout" in str(e).lower() and attempt < max_retries - 1:
@@ -938,48 +1412,86 @@ class JobMonitoringDAG:
                             time.sleep(5)
                             continue
                         else:
-                            browser.close()
-                            playwright.stop()
                             raise e
 
         except requests.exceptions.Timeout as e:
             self.logger.error(f"크롤링용 HTML 가져오기 실패 (타임아웃): {url} - {str(e)}")
+            self.url_health.note_failure(url, 'timeout', str(e))
+            return None
+        except requests.exceptions.SSLError as e:
+            self.logger.error(f"크롤링용 HTML 가져오기 실패 (SSL 오류): {url} - {str(e)}")
+            self.url_health.note_failure(url, 'tls', str(e))
             return None
         except requests.exceptions.ConnectionError as e:
             self.logger.error(f"크롤링용 HTML 가져오기 실패 (연결 오류): {url} - {str(e)}")
+            self.url_health.note_failure(url, classify_failure(error=e), str(e))
             return None
         except requests.exceptions.HTTPError as e:
             self.logger.error(f"크롤링용 HTML 가져오기 실패 (HTTP {e.response.status_code}): {url} - {str(e)}")
-            return None
-        except requests.exceptions.SSLError as e:
-            self.logger.error(f"크롤링용 HTML 가져오기 실패 (SSL 오류): {url} - {str(e)}")
+            self.url_health.note_failure(url, classify_failure(e.response.status_code), str(e))
             return None
         except Exception as e:
             self.logger.error(f"크롤링용 HTML 가져오기 실패 (기타 오류): {url} - {type(e).__name__}: {str(e)}")
+            self.url_health.note_failure(url, classify_failure(error=e), f"{type(e).__name__}: {e}")
             return None
 
-    def create_playwright_browser(self):
-        """Playwright 브라우저 인스턴스 생성"""
+    def _fetch_with_budget(self, url: str, headers: Dict[str, str]):
+        """적응형 제한 시간으로 요청하고, 초과하면 전체 제한 시간으로 한 번 더 요청합니다."""
+        timeout = self.host_latency.timeout_for(url, 'static')
+        self.rate_limiter.acquire(url)
+        start = time.time()
         try:
-            playwright = sync_playwright().start()
-            browser = playwright.chromium.launch(
-                headless=True,
-                args=[
-                    "--no-sandbox",
-                    "--disable-dev-shm-usage",
-                    "--disable-gpu",
-                    "--disable-web-security",
-                    "--disable-features=VizDisplayCompositor",
-                    "--ignore-certificate-errors",
-                    "--ignore-ssl-errors",
-                    "--ignore-certificate-errors-spki-list"
-                ]
-            )
-            self.logger.info("Playwright 브라우저 실행 성공")
-            return playwright, browser
-        except Exception as e:
-            self.logger.error(f"Playwright 브라우저 실행 실패: {e}")
-            return None, None
+            response, html = self.session_pool.fetch_text(url, headers=headers, timeout=timeout, verify=False)
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+            # 본문을 읽는 중의 시간 초과는 requests가 ConnectionError로 감싸서 올림
+            timed_out = isinstance(e, requests.exceptions.Timeout) or is_read_timeout(e)
+            if not timed_out or not self.host_latency.is_reduced(timeout):
+                raise
+            self.logger.warning(f"적응형 제한 시간({timeout:.1f}초) 초과, 전체 제한 시간으로 재시도: {url}")
+            self.host_latency.note_budget_timeout()
+            self.rate_limiter.acquire(url)
+            start = time.time()
+            response, html = self.session_pool.fetch_text(url, headers=headers, timeout=self.host_latency.ceiling, verify=False)
+        if html is not None:
+            self.host_latency.record(url, time.time() - start, 'static')
+        return response, html
+
+    def _crawling_headers(self, url: str) -> Dict[str, str]:
+        """크롤링용 요청 헤더 (더 현실적인 브라우저 헤더 사용)"""
+        return {
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
+            'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+            'Accept-Encoding': 'gzip, deflate, br',
+            'DNT': '1',
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1',
+            'Sec-Fetch-Dest': 'document',
+            'Sec-Fetch-Mode': 'navigate',
+            'Sec-Fetch-Site': 'none',
+            'Sec-Fetch-User': '?1',
+            'Cache-Control': 'max-age=0',
+            'Referer': url  # 리퍼러 추가로 자연스러운 브라우징 시뮬레이션
+        }
+
+    def _render_job_timeout(self, goto_timeout: float) -> float:
+        """브라우저 풀 작업 제한 시간: 페이지 로드 + 준비 대기 + 여유 (초)"""
+        return goto_timeout + self.readiness.max_wait_ms / 1000 + JOB_TIMEOUT_MARGIN_SECONDS
+
+    def _render_page(self, context, url: str, selector: Optional[str] = None, render_profile: Optional[str] = None, timeout_ms: int = 20000) -> str:
+        """대여받은 BrowserContext에서 페이지를 렌더링하고 HTML을 반환합니다."""
+        self.render_profiles.resolve(render_profile).apply(context)
+        page = context.new_page()
+        responses = self.api_capture.attach(page) if self.api_replay_enabled else None
+        self.rate_limiter.acquire(url)
+        goto_start = time.time()
+        page.goto(self.url_rewriter(url), timeout=timeout_ms)
+        self.host_latency.record(url, time.time() - goto_start, 'render')
+        self.readiness.wait(page, url, selector)
+        html = page.content()
+        if responses is not None:
+            self.api_capture.record(url, responses)
+        return html
 
     def load_existing_jobs(self) -> Dict[str, Set[str]]:
         if not os.path.exists(self.results_path):
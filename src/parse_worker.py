@@ -0,0 +1,217 @@
+import concurrent.futures
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, Iterable, List, Optional
+
+from bs4 import BeautifulSoup
+
+from analyze_titles import JobPostingSelectorAnalyzer
+from html_parser import ParsedPage, resolve_backend
+
+# 작업자 프로세스마다 한 번만 만드는 선택자 분석기 (키워드/정규식 준비 비용을 작업마다 반복하지 않음)
+_analyzer: Optional[JobPostingSelectorAnalyzer] = None
+
+
+def _get_analyzer() -> JobPostingSelectorAnalyzer:
+    global _analyzer
+    if _analyzer is None:
+        _analyzer = JobPostingSelectorAnalyzer()
+    return _analyzer
+
+
+def default_processes() -> int:
+    """기본 파싱 프로세스 수 (코어가 하나뿐이면 프로세스 간 전송 비용만 늘어나므로 사용하지 않음)"""
+    cores = os.cpu_count() or 1
+    return cores if cores > 1 else 0
+
+
+def is_specific_enough_selector(selector: str) -> bool:
+    """선택자가 충분히 구체적인지 판단합니다."""
+    selector = selector.strip()
+    if not selector:
+        return False
+
+    parts = selector.split()
+
+    if len(parts) == 1:
+        part = parts[0].lower()
+        if '.' in part or '#' in part:
+            return True
+        if '[' in part and ']' in part:
+            if part == 'a[href]' or part.endswith('[href]'):
+                return False
+            return True
+        if ':' in part:
+            return True
+        return False
+
+    return len(parts) >= 2
+
+
+def normalize_titles(texts: Iterable) -> List[str]:
+    """추출한 텍스트를 공고 제목 목록으로 정리합니다.
+
+    선택자, 임베디드 JSON, 채용공고 API 중 어느 경로로 수집해도 같은 공고 목록이 되도록 모든 경로가 이 규칙을 사용합니다.
+    """
+    job_titles = [text.strip() for text in texts if isinstance(text, str) and text.strip()]
+    job_titles = [title for title in job_titles if len(title) > 2 and len(title) < 200]
+    return list(set(job_titles))  # 중복 제거
+
+
+def select_job_titles(page: ParsedPage, selector: str) -> Optional[List[str]]:
+    """선택자로 채용공고 제목을 추출합니다. 일치하는 요소가 없으면 None을 반환합니다."""
+    postings = page.select_texts(selector)
+    if not postings:
+        return None
+    return normalize_titles(postings)
+
+
+def try_existing_selectors(page: ParsedPage, existing_selectors: List[str], is_job_posting: Callable[[str], bool]) -> Optional[Dict]:
+    """기존 선택자들을 순서대로 시도해서 유효한 첫 선택자와 검증 내용을 반환합니다."""
+    # 20자 이상의 선택자만 재활용 시도
+    valid_selectors = [s for s in existing_selectors if len(s) >= 20 and is_specific_enough_selector(s)]
+
+    for i, selector in enumerate(valid_selectors):
+        try:
+            titles = page.select_texts(selector)
+            if not titles:
+                continue
+
+            valid_titles = [title for title in titles if title and len(title) > 3]
+            if not valid_titles:
+                continue
+
+            job_related_titles = [title for title in valid_titles if is_job_posting(title)]
+            if not job_related_titles:
+                continue
+
+            quality_score = len(job_related_titles) / len(valid_titles)
+            if len(valid_titles) > 50:
+                if quality_score < 0.8:
+                    continue
+            elif len(valid_titles) > 20:
+                if quality_score < 0.6:
+                    continue
+            elif len(valid_titles) > 5:
+                if quality_score < 0.4:
+                    continue
+
+            return {
+                'selector': selector,
+                'category': "기존" if i < 10 else "확장" if i < 50 else "패턴",
+                'job_count': len(job_related_titles),
+                'valid_count': len(valid_titles),
+                'quality': quality_score,
+                'examples': valid_titles[:3] if len(valid_titles) <= 5 else [],
+            }
+
+        except Exception:
+            continue
+
+    return None
+
+
+def _extract(page: ParsedPage, selector: str, existing_selectors: List[str], analyzer: JobPostingSelectorAnalyzer) -> Dict:
+    source, match = 'sheet', None
+    if not selector or selector.strip() == '':
+        match = try_existing_selectors(page, existing_selectors, analyzer._is_potential_job_posting)
+        if match:
+            selector, source = match['selector'], 'existing'
+        else:
+            best_selector, _ = analyzer.find_best_selector(page.soup)
+            if not best_selector:
+                return {'selector': None, 'titles': None, 'source': None, 'match': None}
+            selector, source = best_selector, 'new'
+
+    return {'selector': selector, 'titles': select_job_titles(page, selector), 'source': source, 'match': match}
+
+
+def extract_jobs(html: str, selector: str, existing_selectors: List[str], analyzer: Optional[JobPostingSelectorAnalyzer] = None,
+                 soup: Optional[BeautifulSoup] = None, backend: Optional[str] = None, compat: bool = False,
+                 targeted: bool = False) -> Dict:
+    """HTML을 파싱해 공고 제목을 추출합니다 (선택자가 없으면 기존 선택자 재사용 → 새 선택자 탐색 순).
+
+    반환값: selector(사용한 선택자, 찾지 못하면 None), titles(일치 요소가 없으면 None),
+    source('sheet'/'existing'/'new'), match(기존 선택자 검증 내용)
+    targeted이면 선택자가 있는 페이지는 선택자와 관련된 하위 트리만 파싱합니다.
+    compat이면 html.parser 전체 파싱으로도 추출해 비교하고(다른 백엔드 또는 대상 파싱일 때),
+    결과가 다르면 html.parser 전체 파싱 결과와 함께 mismatch를 반환합니다.
+    """
+    analyzer = analyzer or _get_analyzer()
+    target = selector if targeted and selector and selector.strip() else None
+    result = _extract(ParsedPage(html, backend, soup, target=target), selector, existing_selectors, analyzer)
+    if not compat or (resolve_backend(backend) == 'html.parser' and target is None):
+        return result
+
+    reference = _extract(ParsedPage(html, 'html.parser'), selector, existing_selectors, analyzer)
+    if result['selector'] == reference['selector'] and set(result['titles'] or []) == set(reference['titles'] or []):
+        return result
+    return dict(reference, mismatch={
+        'backend': resolve_backend(backend) + (' (대상 파싱)' if target else ''),
+        'selector': result['selector'],
+        'missing': sorted(set(reference['titles'] or []) - set(result['titles'] or []))[:5],
+        'extra': sorted(set(result['titles'] or []) - set(reference['titles'] or []))[:5],
+    })
+
+
+class ParseWorkerPool:
+    """HTML 파싱과 공고 추출을 별도 프로세스에서 실행하는 풀
+
+    BeautifulSoup 파싱, 선택자 평가, 제목 필터링은 순수 파이썬 CPU 작업이라 수집 스레드 안에서는 GIL로 직렬화됩니다.
+    작업자에는 HTML과 선택자만 보내고 추출된 제목과 선택자만 돌려받으므로, 수집 스레드는 I/O 대기에 머물고
+    파싱은 모든 코어로 나뉩니다. 프로세스는 첫 작업 시 시작하며(spawn), 풀이 비정상 종료되면 스레드 안에서 처리합니다.
+    """
+
+    def __init__(self, processes: int, backend: Optional[str] = None, compat: bool = False, targeted: bool = False):
+        self.processes = processes
+        self.backend = backend
+        self.compat = compat
+        self.targeted = targeted
+        self.logger = logging.getLogger(__name__)
+        self._executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._broken = False
+
+    @property
+    def enabled(self) -> bool:
+        return self.processes > 0 and not self._broken
+
+    def extract(self, html: str, selector: str, existing_selectors: List[str]) -> Dict:
+        """작업자 프로세스에서 extract_jobs를 실행하고 결과를 반환합니다."""
+        if self.enabled:
+            try:
+                # 프로세스 시작/작업 제출 실패(OSError, 데몬 프로세스 안에서의 AssertionError 등)는 모두 풀 문제로 처리
+                future = self._ensure_started().submit(extract_jobs, html, selector, existing_selectors,
+                                                       backend=self.backend, compat=self.compat, targeted=self.targeted)
+            except Exception as e:
+                self._mark_broken(e)
+            else:
+                try:
+                    return future.result()
+                except BrokenProcessPool as e:
+                    self._mark_broken(e)
+        return extract_jobs(html, selector, existing_selectors, backend=self.backend, compat=self.compat, targeted=self.targeted)
+
+    def _mark_broken(self, error: BaseException):
+        with self._lock:
+            if not self._broken:
+                self._broken = True
+                self.logger.warning(f"파싱 프로세스 풀 중단, 이후 파싱은 작업 스레드에서 처리: {type(error).__name__}: {error}")
+
+    def _ensure_started(self) -> concurrent.futures.ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # 수집 스레드가 도는 중에 fork하면 잠금 상태가 복제될 수 있으므로 spawn으로 시작
+                self._executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.processes, mp_context=multiprocessing.get_context('spawn'))
+                self.logger.info(f"파싱 프로세스 풀 시작: {self.processes}개")
+            return self._executor
+
+    def close(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,106 @@
+import asyncio
+import logging
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """버스트를 허용하는 토큰 버킷 (예약 방식: 대기 시간을 돌려주고 토큰을 미리 차감)"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated_at = time.monotonic()
+
+    def reserve(self, now: float) -> float:
+        """토큰 하나를 예약하고, 사용 가능해질 때까지 기다려야 하는 시간을 반환합니다."""
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+
+class HostRateLimiter:
+    """전역 + 호스트별 토큰 버킷으로 모든 요청의 속도를 제한합니다.
+
+    예약 시점에 대기 시간이 정해지므로, 한 호스트의 요청이 대기하는 동안에도
+    다른 호스트로 향하는 요청은 바로 진행됩니다.
+    """
+
+    def __init__(self, global_rate: float = 20.0, global_burst: int = 40, host_rate: float = 2.0, host_burst: int = 4,
+                 shared_hosts: Optional[Dict[str, Tuple[float, int]]] = None):
+        self.host_rate = host_rate
+        self.host_burst = host_burst
+        # 여러 회사가 서브도메인으로 공유하는 호스트 (접미사 -> (초당 요청 수, 버스트))
+        self.shared_hosts = shared_hosts or {}
+        self.logger = logging.getLogger(__name__)
+
+        self._global = TokenBucket(global_rate, global_burst)
+        self._hosts: Dict[str, TokenBucket] = {}
+        self._waited: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, env) -> 'HostRateLimiter':
+        """환경변수 설정으로 생성합니다. (RATE_LIMIT_SHARED_HOSTS 형식: 'greetinghr.com=2:4,...')"""
+        shared_hosts = {}
+        for item in env.get('RATE_LIMIT_SHARED_HOSTS', 'greetinghr.com=2:4').split(','):
+            if '=' not in item:
+                continue
+            suffix, spec = item.strip().split('=', 1)
+            rate, _, burst = spec.partition(':')
+            shared_hosts[suffix.strip().lower()] = (float(rate), int(burst or 1))
+
+        return cls(
+            global_rate=float(env.get('RATE_LIMIT_GLOBAL_RPS', '20')),
+            global_burst=int(env.get('RATE_LIMIT_GLOBAL_BURST', '40')),
+            host_rate=float(env.get('RATE_LIMIT_HOST_RPS', '2')),
+            host_burst=int(env.get('RATE_LIMIT_HOST_BURST', '4')),
+            shared_hosts=shared_hosts,
+        )
+
+    def host_key(self, url: str) -> str:
+        host = (urlparse(url).hostname or '').lower()
+        for suffix in self.shared_hosts:
+            if host == suffix or host.endswith('.' + suffix):
+                return suffix
+        return host
+
+    def reserve(self, url: str) -> float:
+        """요청 하나를 예약하고 대기해야 할 시간을 반환합니다."""
+        key = self.host_key(url)
+        with self._lock:
+            bucket = self._hosts.get(key)
+            if bucket is None:
+                rate, burst = self.shared_hosts.get(key, (self.host_rate, self.host_burst))
+                bucket = self._hosts[key] = TokenBucket(rate, burst)
+            now = time.monotonic()
+            wait = max(self._global.reserve(now), bucket.reserve(now))
+            if wait > 0:
+                self._waited[key] = self._waited.get(key, 0.0) + wait
+            return wait
+
+    def acquire(self, url: str):
+        """동기 요청 전에 호출합니다."""
+        wait = self.reserve(url)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, url: str):
+        """비동기 요청 전에 호출합니다."""
+        wait = self.reserve(url)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def log_summary(self):
+        with self._lock:
+            waited = sorted(self._waited.items(), key=lambda x: x[1], reverse=True)
+        if waited:
+            total = sum(w for _, w in waited)
+            top = ', '.join(f"{host} {w:.1f}초" for host, w in waited[:3])
+            self.logger.info(f"속도 제한 대기 합계 {total:.1f}초 (상위 호스트: {top})")
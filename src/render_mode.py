@@ -0,0 +1,83 @@
+import logging
+import time
+from typing import Optional
+
+from state_store import JsonStateStore
+
+# URL별로 보관할 최근 결정 기록 수
+MAX_HISTORY = 20
+
+# 정적 재시험이 실패할 때마다 다음 재시험까지의 간격을 두 배로 늘리는 최대 횟수
+MAX_BACKOFF_STEPS = 4
+
+
+class RenderModeManager:
+    """URL별 렌더링 방식(selenium_required 0/1)을 실행 결과로부터 학습합니다.
+
+    - 정적 수집에서 선택자가 공고를 찾지 못하면 렌더링으로 올립니다 (escalate).
+    - 렌더링 대상은 주기적으로 정적 HTML로 다시 시험하고, 연속으로 이전 결과와 같은 공고를 얻으면
+      정적 수집으로 내립니다 (demote). 재시험이 실패할수록 다음 재시험까지의 간격이 늘어납니다.
+
+    결정 기록은 data/render_mode_history.json에 저장되며, 시트의 selenium_required 열에 반영됩니다.
+    """
+
+    def __init__(self, path: str, demote_after: int = 3, retest_days: float = 7):
+        self.store = JsonStateStore(path)
+        self.demote_after = demote_after
+        self.retest_days = retest_days
+        self.logger = logging.getLogger(__name__)
+
+    def mode(self, url: str) -> Optional[int]:
+        entry = self.store.get(url)
+        return entry['mode'] if entry else None
+
+    def observe(self, url: str, sheet_value):
+        """시트의 값을 기록합니다. 처음 보는 URL이거나 시트가 직접 수정된 경우 시트 값을 따릅니다."""
+        if sheet_value not in (0, 1):
+            return
+        entry = self.store.get(url)
+        if entry and entry['mode'] == sheet_value:
+            return
+        self._change(url, int(sheet_value), 'sheet', static_streak=0, backoff=0,
+                     next_retest_at=time.time() + self.retest_days * 86400)
+
+    def due_for_retest(self, url: str) -> bool:
+        entry = self.store.get(url)
+        return bool(entry) and entry['mode'] == 1 and time.time() >= entry.get('next_retest_at', 0)
+
+    def record_retest(self, url: str, success: bool) -> bool:
+        """정적 재시험 결과를 기록하고, 정적 수집으로 내렸으면 True를 반환합니다."""
+        entry = self.store.get(url) or {}
+        if success:
+            streak = entry.get('static_streak', 0) + 1
+            if streak >= self.demote_after:
+                self._change(url, 0, 'demote', static_streak=0)
+                self.logger.info(f"  - 정적 수집 {streak}회 연속 성공, 렌더링 생략으로 전환: {url}")
+                return True
+            # 연속 성공을 확인하기 위해 다음 실행에서도 다시 시험
+            self.store.update(url, static_streak=streak, next_retest_at=time.time())
+            return False
+
+        backoff = min(entry.get('backoff', 0) + 1, MAX_BACKOFF_STEPS)
+        self.store.update(url, static_streak=0, backoff=backoff,
+                          next_retest_at=time.time() + self.retest_days * 86400 * 2 ** (backoff - 1))
+        return False
+
+    def record_escalation(self, url: str):
+        """정적 수집에서 공고를 찾지 못해 렌더링으로 성공한 URL을 렌더링 대상으로 올립니다."""
+        entry = self.store.get(url) or {}
+        # 정적으로 내렸다가 다시 올라온 URL은 재시험 간격을 늘려 방식이 자주 바뀌지 않게 함
+        backoff = min(entry.get('backoff', 0) + (1 if entry.get('mode') == 0 else 0), MAX_BACKOFF_STEPS)
+        self._change(url, 1, 'escalate', static_streak=0, backoff=backoff,
+                     next_retest_at=time.time() + self.retest_days * 86400 * 2 ** backoff)
+        self.logger.info(f"  - 정적 HTML에서 공고를 찾지 못해 렌더링 대상으로 전환: {url}")
+
+    def _change(self, url: str, mode: int, reason: str, **fields):
+        entry = dict(self.store.get(url) or {})
+        history = list(entry.get('history') or [])
+        history.append({'at': time.strftime('%Y-%m-%d %H:%M:%S'), 'mode': mode, 'reason': reason})
+        entry.update(fields, mode=mode, history=history[-MAX_HISTORY:])
+        self.store.set(url, entry)
+
+    def save(self):
+        self.store.save()
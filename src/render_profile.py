@@ -0,0 +1,113 @@
+import logging
+import threading
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlparse
+
+# 채용공고 목록과 무관한 분석/광고/위젯 도메인
+TRACKER_DOMAINS = [
+    'google-analytics.com', 'googletagmanager.com', 'doubleclick.net', 'googlesyndication.com',
+    'googleadservices.com', 'adservice.google.com', 'facebook.net', 'facebook.com/tr',
+    'connect.facebook.net', 'analytics.tiktok.com', 'hotjar.com', 'clarity.ms', 'criteo.com',
+    'criteo.net', 'mixpanel.com', 'amplitude.com', 'segment.io', 'segment.com', 'sentry.io',
+    'wcs.naver.net', 'kakao.com/pixel', 'channel.io', 'beusable.net', 'ads-twitter.com',
+    'linkedin.com/px', 'snap.licdn.com', 'bat.bing.com',
+]
+
+# 프로필별 차단 리소스 유형 (full: 차단 없음)
+PROFILE_RESOURCE_TYPES = {
+    'full': set(),
+    'lite': {'image', 'media', 'font'},
+    'strict': {'image', 'media', 'font', 'stylesheet'},
+}
+
+
+class ResourceBlockingProfile:
+    """Playwright 라우트 가로채기로 불필요한 리소스 요청을 차단하는 렌더링 프로필"""
+
+    def __init__(self, name: str, resource_types: Iterable[str], block_trackers: bool = True, tracker_domains: Optional[Iterable[str]] = None):
+        self.name = name
+        self.resource_types = set(resource_types)
+        self.block_trackers = block_trackers
+        self.tracker_domains = list(tracker_domains or TRACKER_DOMAINS)
+        self._lock = threading.Lock()
+        self.blocked = 0
+        self.allowed = 0
+
+    @property
+    def is_passthrough(self) -> bool:
+        return not self.resource_types and not self.block_trackers
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        if resource_type in self.resource_types:
+            return True
+        if self.block_trackers:
+            parsed = urlparse(url)
+            target = f"{parsed.hostname or ''}{parsed.path}"
+            return any(domain in target for domain in self.tracker_domains)
+        return False
+
+    def apply(self, context):
+        """sync BrowserContext(또는 Page)에 라우트 핸들러를 설치합니다."""
+        if self.is_passthrough:
+            return
+
+        def handle(route):
+            if self._record(self.should_block(route.request.resource_type, route.request.url)):
+                route.abort()
+            else:
+                route.continue_()
+
+        context.route("**/*", handle)
+
+    async def apply_async(self, context):
+        """async BrowserContext(또는 Page)에 라우트 핸들러를 설치합니다."""
+        if self.is_passthrough:
+            return
+
+        async def handle(route):
+            if self._record(self.should_block(route.request.resource_type, route.request.url)):
+                await route.abort()
+            else:
+                await route.continue_()
+
+        await context.route("**/*", handle)
+
+    def _record(self, blocked: bool) -> bool:
+        with self._lock:
+            if blocked:
+                self.blocked += 1
+            else:
+                self.allowed += 1
+        return blocked
+
+
+def build_render_profiles() -> Dict[str, ResourceBlockingProfile]:
+    """사용 가능한 렌더링 프로필들을 생성합니다."""
+    return {
+        name: ResourceBlockingProfile(name, resource_types, block_trackers=(name != 'full'))
+        for name, resource_types in PROFILE_RESOURCE_TYPES.items()
+    }
+
+
+class RenderProfileRegistry:
+    """기본 프로필과 회사별 재정의(시트의 render_profile 열)를 해석합니다."""
+
+    def __init__(self, default_profile: str = 'lite'):
+        self.profiles = build_render_profiles()
+        self.default_profile = default_profile if default_profile in self.profiles else 'lite'
+        self.logger = logging.getLogger(__name__)
+
+    def resolve(self, name: Optional[str] = None) -> ResourceBlockingProfile:
+        key = str(name).strip().lower() if name is not None else ''
+        if key in ('', 'nan', 'none'):
+            return self.profiles[self.default_profile]
+        if key not in self.profiles:
+            self.logger.warning(f"알 수 없는 렌더링 프로필 '{name}' -> 기본값 '{self.default_profile}' 사용")
+            return self.profiles[self.default_profile]
+        return self.profiles[key]
+
+    def log_summary(self):
+        for profile in self.profiles.values():
+            total = profile.blocked + profile.allowed
+            if total:
+                self.logger.info(f"렌더링 프로필 '{profile.name}': 요청 {total}개 중 {profile.blocked}개 차단 ({profile.blocked / total:.1%})")
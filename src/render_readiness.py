@@ -0,0 +1,149 @@
+import logging
+import threading
+import time
+from typing import Optional
+
+from state_store import JsonStateStore
+
+# DOM 변경이 quietMs 동안 없거나 maxMs가 지나면 끝나는 MutationObserver 대기 스크립트
+DOM_QUIET_SCRIPT = """
+([quietMs, maxMs]) => new Promise(resolve => {
+    const start = performance.now();
+    let quietTimer = null;
+    let capTimer = null;
+    const observer = new MutationObserver(() => {
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(finish, quietMs);
+    });
+    function finish() {
+        observer.disconnect();
+        clearTimeout(quietTimer);
+        clearTimeout(capTimer);
+        resolve(performance.now() - start);
+    }
+    observer.observe(document.documentElement || document, {childList: true, subtree: true, characterData: true});
+    quietTimer = setTimeout(finish, quietMs);
+    capTimer = setTimeout(finish, maxMs);
+})
+"""
+
+# 기존 방식의 고정 대기 시간 (선택자 발견 후 3초, 선택자 없을 때 5초, 선택자 대기 실패 시 0초)
+FIXED_SLEEP_WITH_SELECTOR = 3.0
+FIXED_SLEEP_WITHOUT_SELECTOR = 5.0
+
+
+class RenderReadinessDetector:
+    """page.goto 이후 목록이 안정되는 즉시 반환하는 렌더링 완료 감지기
+
+    선택자 대기 -> 네트워크 유휴 -> DOM 변경 정지 구간 순서로 확인하며,
+    전체 대기 시간은 max_wait_ms를 넘지 않습니다. 선택자를 찾았으면 네트워크 유휴는 기다리지 않고,
+    분석/폴링 요청 때문에 유휴 상태가 되지 않는 페이지를 위해 네트워크 유휴 대기는 network_idle_ms로 따로 제한합니다.
+    """
+
+    def __init__(self, max_wait_ms: int = 20000, quiet_ms: int = 500, recorder: Optional['ReadinessRecorder'] = None,
+                 network_idle_ms: int = 2500):
+        self.max_wait_ms = max_wait_ms
+        self.quiet_ms = quiet_ms
+        self.network_idle_ms = network_idle_ms
+        self.recorder = recorder
+        self.logger = logging.getLogger(__name__)
+
+    def wait(self, page, url: str, selector: Optional[str] = None) -> float:
+        """렌더링이 안정될 때까지 기다리고 걸린 시간(초)을 반환합니다."""
+        start = time.monotonic()
+        selector_found = False
+
+        if selector:
+            try:
+                page.wait_for_selector(selector, timeout=self._remaining_ms(start))
+                selector_found = True
+            except Exception:
+                self.logger.warning(f"선택자 '{selector}' 요소를 기다리는 데 실패했습니다.")
+        settle_start = time.monotonic()
+
+        network_idle_ms = 0 if selector_found else min(self.network_idle_ms, self._remaining_ms(start))
+        if network_idle_ms > 0:
+            try:
+                page.wait_for_load_state('networkidle', timeout=network_idle_ms)
+            except Exception:
+                pass  # 폴링/롱폴링 페이지는 유휴 상태가 되지 않으므로 DOM 정지 구간으로 판단
+
+        remaining = self._remaining_ms(start)
+        if remaining > 0:
+            try:
+                page.evaluate(DOM_QUIET_SCRIPT, [self.quiet_ms, remaining])
+            except Exception:
+                pass
+
+        self._record(url, start, settle_start, selector, selector_found)
+        return time.monotonic() - start
+
+    async def wait_async(self, page, url: str, selector: Optional[str] = None) -> float:
+        """wait()의 async Playwright 버전입니다."""
+        start = time.monotonic()
+        selector_found = False
+
+        if selector:
+            try:
+                await page.wait_for_selector(selector, timeout=self._remaining_ms(start))
+                selector_found = True
+            except Exception:
+                self.logger.warning(f"선택자 '{selector}' 요소를 기다리는 데 실패했습니다.")
+        settle_start = time.monotonic()
+
+        network_idle_ms = 0 if selector_found else min(self.network_idle_ms, self._remaining_ms(start))
+        if network_idle_ms > 0:
+            try:
+                await page.wait_for_load_state('networkidle', timeout=network_idle_ms)
+            except Exception:
+                pass
+
+        remaining = self._remaining_ms(start)
+        if remaining > 0:
+            try:
+                await page.evaluate(DOM_QUIET_SCRIPT, [self.quiet_ms, remaining])
+            except Exception:
+                pass
+
+        self._record(url, start, settle_start, selector, selector_found)
+        return time.monotonic() - start
+
+    def _remaining_ms(self, start: float) -> int:
+        return max(0, int(self.max_wait_ms - (time.monotonic() - start) * 1000))
+
+    def _record(self, url: str, start: float, settle_start: float, selector: Optional[str], selector_found: bool):
+        if self.recorder:
+            now = time.monotonic()
+            if selector:
+                baseline = FIXED_SLEEP_WITH_SELECTOR if selector_found else 0.0
+            else:
+                baseline = FIXED_SLEEP_WITHOUT_SELECTOR
+            self.recorder.record(url, total=now - start, settle=now - settle_start, baseline=baseline)
+
+
+class ReadinessRecorder:
+    """URL(회사)별 렌더링 준비 시간을 기록하고 기존 고정 대기와 비교합니다."""
+
+    def __init__(self, path: str):
+        self.store = JsonStateStore(path)
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._pages = 0
+        self._settle_total = 0.0
+        self._baseline_total = 0.0
+
+    def record(self, url: str, total: float, settle: float, baseline: float):
+        with self._lock:
+            self._pages += 1
+            self._settle_total += settle
+            self._baseline_total += baseline
+        self.store.update(url, ready_seconds=round(total, 2), settle_seconds=round(settle, 2),
+                          fixed_sleep_seconds=baseline, updated_at=time.strftime('%Y-%m-%d %H:%M:%S'))
+
+    def log_summary(self):
+        with self._lock:
+            pages, settle, baseline = self._pages, self._settle_total, self._baseline_total
+        if pages:
+            self.logger.info(f"렌더링 준비 감지: {pages}개 페이지, 안정화 대기 평균 {settle / pages:.1f}초 "
+                             f"(기존 고정 대기 평균 {baseline / pages:.1f}초, 총 {baseline - settle:.0f}초 절약)")
+        self.store.save()
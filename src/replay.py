@@ -0,0 +1,244 @@
+import argparse
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from analyze_titles import JobPostingSelectorAnalyzer
+from job_monitoring_logic import JobMonitoringDAG
+from parse_worker import ParseWorkerPool
+from snapshot_store import SnapshotStore
+
+# 5000대_기업 시트는 운영 DAG와 같은 크기의 청크로 나누어 처리 (기존 선택자 목록이 청크 단위로 만들어짐)
+CHUNKED_WORKSHEETS = {'5000대_기업': 100}
+
+
+class StageTimer:
+    """단계별 누적 소요 시간과 호출 횟수 (워커 스레드 시간의 합계)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.totals: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+
+    @contextmanager
+    def measure(self, stage: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.totals[stage] = self.totals.get(stage, 0.0) + elapsed
+                self.counts[stage] = self.counts.get(stage, 0) + 1
+
+    def wrap(self, stage: str, fn):
+        def timed(*args, **kwargs):
+            with self.measure(stage):
+                return fn(*args, **kwargs)
+        return timed
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {stage: {'seconds': round(total, 3), 'calls': self.counts[stage]} for stage, total in self.totals.items()}
+
+
+class ReplayJobMonitoringDAG(JobMonitoringDAG):
+    """저장된 스냅샷과 시트 사본으로 네트워크 없이 통합 처리를 재실행하는 DAG
+
+    HTML은 스냅샷 저장소에서만 읽으며, 조건부 요청/본문 지문 재사용은 끄고
+    매번 선택자 탐색과 공고 추출을 실제로 수행합니다. 상태 파일은 임시 디렉터리에 씁니다.
+    """
+
+    def __init__(self, snapshots: SnapshotStore, manifest: Dict, work_dir: str):
+        super().__init__(work_dir, worksheet_name=manifest.get('worksheet') or '[등록]채용홈페이지 모음')
+        self.snapshots = snapshots
+        self.manifest = manifest
+        self.snapshot_store = None  # 재실행 결과는 기록하지 않음
+        self.content_hash_mode = 'off'
+        self.fetch_engine = 'thread'
+        self.render_backend = 'pool'
+        self.api_replay_enabled = False  # API 직접 호출은 네트워크가 필요함
+        self.render_mode_enabled = False  # 렌더링 방식 학습은 실제 수집 결과가 필요함
+        self.url_health_enabled = False  # 실패 기록과 재시도 일정은 운영 실행에서만 갱신
+        self.parse_pool = ParseWorkerPool(0)  # 단계별 시간은 작업 스레드 안에서 측정
+        self.missing_snapshots: List[str] = []
+
+        self.timer = StageTimer()
+        self.selector_analyzer = JobPostingSelectorAnalyzer()
+        self.selector_analyzer.find_best_selector = self.timer.wrap('find_best_selector', self.selector_analyzer.find_best_selector)
+        self.selector_analyzer._is_potential_job_posting = self.timer.wrap('title_filter', self.selector_analyzer._is_potential_job_posting)
+
+    def _get_crawl_html(self, url: str, use_selenium, selector: Optional[str] = None, render_profile: Optional[str] = None):
+        with self.timer.measure('load_snapshot'):
+            entry = self.manifest['entries'].get(url) or {}
+            html = self.snapshots.get(entry['hash']) if entry.get('hash') else None
+        if html is None and entry.get('status') != 'failed':
+            self.missing_snapshots.append(url)
+        return html
+
+    def _fetch_static_html(self, urls: List[str]) -> Dict[str, str]:
+        pages = {}
+        for url in urls:
+            html = self._get_crawl_html(url, False)
+            if html is not None:
+                pages[url] = html
+        return pages
+
+    def _process_url_with_companies(self, args):
+        with self.timer.measure('process_url'):
+            return super()._process_url_with_companies(args)
+
+    def _extract_jobs(self, html, soup, selector, existing_selectors):
+        with self.timer.measure('extract_jobs'):
+            return super()._extract_jobs(html, soup, selector, existing_selectors)
+
+    def stabilize_selectors(self, df: pd.DataFrame) -> pd.DataFrame:
+        with self.timer.measure('stabilize_selectors'):
+            return super().stabilize_selectors(df)
+
+    def _fill_missing_selenium_required(self, df: pd.DataFrame, mask: pd.Series, reprobe: Optional[pd.Series] = None):
+        # 판별 요청을 보내지 않음 (재실행에서는 HTML 출처가 스냅샷 하나뿐이므로 값은 결과에 영향 없음)
+        missing = mask & ~df['selenium_required'].isin([0, 1, -1, -2])
+        if reprobe is not None:
+            missing |= reprobe
+        df.loc[missing, 'selenium_required'] = 0
+
+    def replay(self, df_config: pd.DataFrame) -> Dict[str, Dict]:
+        """시트 사본을 운영과 같은 방식으로 처리하고 URL별 결과를 반환합니다."""
+        chunk_size = CHUNKED_WORKSHEETS.get(self.worksheet_name)
+        if chunk_size:
+            df_to_process = df_config[df_config['job_posting_url'].notna() & (df_config['job_posting_url'].str.strip() != '')].copy()
+            chunks = [df_to_process.iloc[i:i + chunk_size] for i in range(0, len(df_to_process), chunk_size)]
+        else:
+            chunks = [df_config]
+
+        results = {}
+        for df_chunk in chunks:
+            _, current_jobs, failed_companies = self.process_companies_integrated(df_chunk.copy())
+            for company, titles in current_jobs.items():
+                results[self.company_urls.get(company)] = {'job_titles': sorted(titles)}
+            for failure in failed_companies:
+                results.setdefault(failure['url'], {'error': failure['reason']})
+        return results
+
+
+def load_sheet_copy(path: str) -> pd.DataFrame:
+    """시트 사본 CSV를 Google Sheets에서 읽은 것과 같은 형태(빈 칸은 '', 숫자는 int)로 읽습니다."""
+    df = pd.read_csv(path, encoding='utf-8-sig', dtype=str, keep_default_na=False)
+
+    def to_int(value: str):
+        try:
+            return int(float(value))
+        except ValueError:
+            return value
+
+    if 'selenium_required' in df.columns:
+        df['selenium_required'] = df['selenium_required'].map(to_int)
+    return df
+
+
+def compare_with_manifest(manifest: Dict, replayed: Dict[str, Dict]) -> Dict:
+    """재실행 결과를 기록된 실행과 URL 단위로 비교합니다."""
+    report = {'equal': 0, 'titles_differ': [], 'error_differ': [], 'not_replayed': [], 'skipped': 0}
+    for url, entry in manifest['entries'].items():
+        if entry['status'] != 'failed' and not entry.get('hash'):
+            report['skipped'] += 1  # 기록된 본문이 없어 비교할 수 없음
+            continue
+        result = replayed.get(url)
+        if result is None:
+            report['not_replayed'].append(url)
+        elif entry.get('error') != result.get('error'):
+            report['error_differ'].append({'url': url, 'recorded': entry.get('error'), 'replayed': result.get('error')})
+        elif set(entry.get('job_titles') or []) != set(result.get('job_titles') or []):
+            recorded, replayed_titles = set(entry.get('job_titles') or []), set(result.get('job_titles') or [])
+            report['titles_differ'].append({
+                'url': url,
+                'missing': sorted(recorded - replayed_titles),
+                'extra': sorted(replayed_titles - recorded),
+            })
+        else:
+            report['equal'] += 1
+    return report
+
+
+def run_replay(snapshot_root: str, run_id: Optional[str] = None, sheet_path: Optional[str] = None, workers: Optional[int] = None) -> Optional[Dict]:
+    logger = logging.getLogger(__name__)
+    snapshots = SnapshotStore(snapshot_root)
+    manifest = snapshots.load_manifest(run_id)
+    if not manifest:
+        logger.error(f"재실행할 매니페스트가 없습니다: {snapshot_root} (run={run_id})")
+        return None
+
+    sheet_path = sheet_path or snapshots.sheet_path(manifest['run_id'])
+    if not os.path.exists(sheet_path):
+        logger.error(f"시트 사본이 없습니다: {sheet_path}")
+        return None
+    df_config = load_sheet_copy(sheet_path)
+
+    with tempfile.TemporaryDirectory(prefix='job-monitoring-replay-') as work_dir:
+        dag = ReplayJobMonitoringDAG(snapshots, manifest, work_dir)
+        if workers:
+            dag.max_workers = dag.static_workers = dag.render_workers = workers
+        logger.info(f"오프라인 재실행 시작: run={manifest['run_id']}, 시트 {len(df_config)}행, 작업자 {dag.max_workers}개")
+
+        start = time.perf_counter()
+        replayed = dag.replay(df_config)
+        wall_time = time.perf_counter() - start
+
+    report = {
+        'run_id': manifest['run_id'],
+        'worksheet': manifest.get('worksheet'),
+        'wall_seconds': round(wall_time, 3),
+        'workers': dag.max_workers,
+        'stages': dag.timer.summary(),
+        'missing_snapshots': dag.missing_snapshots,
+        'equivalence': compare_with_manifest(manifest, replayed),
+    }
+    return report
+
+
+def log_report(report: Dict):
+    logger = logging.getLogger(__name__)
+    equivalence = report['equivalence']
+    logger.info(f"재실행 완료: {report['wall_seconds']:.2f}초 (작업자 {report['workers']}개)")
+    for stage, stat in sorted(report['stages'].items(), key=lambda x: x[1]['seconds'], reverse=True):
+        logger.info(f"  - {stage}: {stat['seconds']:.2f}초 / {stat['calls']}회")
+    logger.info(f"결과 비교: 동일 {equivalence['equal']}개, 공고 다름 {len(equivalence['titles_differ'])}개, "
+                f"성공/실패 다름 {len(equivalence['error_differ'])}개, 미처리 {len(equivalence['not_replayed'])}개, "
+                f"비교 불가 {equivalence['skipped']}개")
+    for diff in equivalence['titles_differ'][:10]:
+        logger.info(f"  - {diff['url']}: 누락 {len(diff['missing'])}개, 추가 {len(diff['extra'])}개")
+    if report['missing_snapshots']:
+        logger.warning(f"스냅샷 본문이 없는 URL {len(report['missing_snapshots'])}개")
+
+
+def main():
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parser = argparse.ArgumentParser(description='저장된 스냅샷으로 JobMonitoringDAG 통합 처리를 오프라인 재실행')
+    parser.add_argument('--root', default=os.path.join(base_dir, 'data', 'snapshots'), help='스냅샷 저장소 경로')
+    parser.add_argument('--run', default=None, help='실행 ID (기본값: 가장 최근 실행)')
+    parser.add_argument('--sheet', default=None, help='시트 CSV 경로 (기본값: 실행 시 저장된 시트 사본)')
+    parser.add_argument('--workers', type=int, default=None, help='작업자 수 (기본값: MAX_WORKERS)')
+    parser.add_argument('--report', default=None, help='결과 보고서를 저장할 JSON 경로')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    report = run_replay(args.root, args.run, args.sheet, args.workers)
+    if report is None:
+        raise SystemExit(1)
+
+    log_report(report)
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,358 @@
+import argparse
+import hashlib
+import logging
+import math
+import os
+import random
+import tempfile
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+
+from snapshot_store import SnapshotStore
+
+SAMPLE_TITLES = [
+    '백엔드 개발자 (Java/Spring)', '프론트엔드 개발자 (React)', '데이터 엔지니어', 'iOS 개발자', 'Android 개발자',
+    '프로덕트 디자이너', '서비스 기획자', 'DevOps 엔지니어', '머신러닝 엔지니어', 'QA 엔지니어',
+    '인사 담당자', '재무회계 담당자', '마케팅 매니저', '영업 관리 신입', '보안 엔지니어 경력',
+]
+
+
+def parse_latency(spec: str):
+    """지연 시간 분포 설정을 (밀리초를 반환하는 함수)로 변환합니다.
+
+    fixed:200 / uniform:50:500 / lognormal:200:0.8 (중앙값, 시그마)
+    """
+    kind, *params = spec.split(':')
+    values = [float(p) for p in params]
+    if kind == 'fixed':
+        return lambda rng: values[0]
+    if kind == 'uniform':
+        return lambda rng: rng.uniform(values[0], values[1])
+    if kind == 'lognormal':
+        mu = math.log(max(values[0], 1))
+        return lambda rng: rng.lognormvariate(mu, values[1])
+    raise ValueError(f"알 수 없는 지연 시간 분포: {spec}")
+
+
+class SimulatorSettings:
+    """시뮬레이터 응답 특성 (비율은 0~1)"""
+
+    def __init__(self, latency: str = 'lognormal:150:0.6', error_rate: float = 0.01, throttle_rate: float = 0.01,
+                 redirect_rate: float = 0.05, slow_drip_rate: float = 0.01, slow_drip_seconds: float = 5.0,
+                 page_kb: int = 60, seed: int = 42, etag: bool = True, volatile_tokens: bool = False):
+        self.latency_spec = latency
+        self.latency = parse_latency(latency)
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.redirect_rate = redirect_rate
+        self.slow_drip_rate = slow_drip_rate
+        self.slow_drip_seconds = slow_drip_seconds
+        self.page_kb = page_kb
+        self.seed = seed
+        self.etag = etag  # False면 검증자를 보내지 않고 조건부 요청도 무시 (본문 지문 비교 경로 시험용)
+        self.volatile_tokens = volatile_tokens  # 요청마다 바뀌는 CSRF 토큰/nonce/빌드 ID를 본문에 삽입
+
+
+def synthetic_page(key: str, page_kb: int) -> str:
+    """URL마다 항상 같은 내용이 나오는 가상 채용 페이지를 만듭니다."""
+    rng = random.Random(hashlib.sha256(key.encode('utf-8')).hexdigest())
+    titles = [f"{rng.choice(SAMPLE_TITLES)} #{rng.randint(1, 999)}" for _ in range(rng.randint(3, 40))]
+    items = '\n'.join(
+        f'<li class="job-item"><a class="job-title-link" href="/jobs/{i}">{title}</a><span class="job-meta">서울 · 정규직</span></li>'
+        for i, title in enumerate(titles)
+    )
+    filler_size = max(0, page_kb * 1024 - len(items) * 3)
+    filler = f'<script>window.__APP_STATE__ = "{"x" * filler_size}";</script>'
+    return (f'<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8"><title>{key} 채용</title></head>'
+            f'<body><header><nav><a href="/">홈</a><a href="/about">회사소개</a></nav></header>'
+            f'<main><h1>채용 공고</h1><ul class="job-list">{items}</ul></main>{filler}<footer>© {key}</footer></body></html>')
+
+
+class _SimulatorHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def handle_error(self, request, client_address):
+        pass  # 클라이언트가 먼저 끊은 연결(타임아웃, 본문 크기 제한 등)은 무시
+
+
+class CareerSiteSimulator:
+    """수천 개의 채용 페이지를 흉내내는 로컬 HTTP 서버
+
+    GET /page?url=<원래 URL>  - 원래 URL에 해당하는 페이지 (스냅샷이 있으면 기록된 본문, 없으면 가상 페이지)
+    GET /stats               - 지금까지의 응답 통계
+
+    지연 시간, 오류(500), 속도 제한(429), 리다이렉트(302), 느린 응답(slow-drip)을 설정한 비율로 섞어 보내며
+    ETag/If-None-Match를 지원하여 조건부 요청 경로도 시험할 수 있고, 검증자를 무시하며 요청마다 휘발성 토큰이
+    바뀌는 서버도 흉내낼 수 있습니다 (본문 지문 비교 경로).
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 8900, settings: Optional[SimulatorSettings] = None, snapshot_root: Optional[str] = None):
+        self.settings = settings or SimulatorSettings()
+        self.snapshots = None
+        if snapshot_root:
+            self.snapshots = SnapshotStore(snapshot_root)
+        self.logger = logging.getLogger(__name__)
+
+        self._rng = random.Random(self.settings.seed)
+        self._rng_lock = threading.Lock()
+        self._stats: Dict[str, int] = {}
+        self._stats_lock = threading.Lock()
+
+        self.server = _SimulatorHTTPServer((host, port), self._handler_class())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def rewrite_template(self) -> str:
+        """CRAWL_URL_REWRITE에 넣을 템플릿"""
+        return f"{self.base_url}/page?url={{url}}"
+
+    def start(self) -> 'CareerSiteSimulator':
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def stats(self) -> Dict[str, int]:
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def _count(self, key: str):
+        with self._stats_lock:
+            self._stats[key] = self._stats.get(key, 0) + 1
+
+    def _roll(self) -> Tuple[float, float]:
+        with self._rng_lock:
+            return self._rng.random(), self.settings.latency(self._rng)
+
+    def _page_body(self, url: str) -> str:
+        if self.snapshots:
+            digest = self.snapshots.index.get(url)
+            html = self.snapshots.get(digest) if digest else None
+            if html is not None:
+                return html
+        return synthetic_page(urlparse(url).netloc or url, self.settings.page_kb)
+
+    @staticmethod
+    def _with_volatile_tokens(html: str) -> str:
+        token = uuid.uuid4().hex
+        html = html.replace('<head>', f'<head><meta name="csrf-token" content="{token}">', 1)
+        return html.replace('</body>', f'<script nonce="{token}">window.__BUILD_ID__ = "{token}";</script></body>', 1)
+
+    def _handler_class(self):
+        simulator = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                if parsed.path == '/stats':
+                    return self._send(200, str(simulator.stats()).encode('utf-8'), 'text/plain; charset=utf-8')
+                if parsed.path != '/page':
+                    return self._send(404, b'not found', 'text/plain')
+
+                query = parse_qs(parsed.query)
+                url = query.get('url', [''])[0]
+                roll, latency_ms = simulator._roll()
+                time.sleep(latency_ms / 1000)
+
+                settings = simulator.settings
+                threshold = settings.error_rate
+                if roll < threshold:
+                    simulator._count('500')
+                    return self._send(500, b'internal error', 'text/plain')
+                threshold += settings.throttle_rate
+                if roll < threshold:
+                    simulator._count('429')
+                    return self._send(429, b'too many requests', 'text/plain', {'Retry-After': '1'})
+                threshold += settings.redirect_rate
+                if roll < threshold and 'hop' not in query:
+                    simulator._count('302')
+                    return self._send(302, b'', 'text/plain', {'Location': f"{self.path}&hop=1"})
+
+                html = simulator._page_body(url)
+                if settings.volatile_tokens:
+                    html = simulator._with_volatile_tokens(html)
+                body = html.encode('utf-8')
+                validators = {}
+                if settings.etag:
+                    validators['ETag'] = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+                    if self.headers.get('If-None-Match') == validators['ETag']:
+                        simulator._count('304')
+                        return self._send(304, b'', None, validators)
+
+                threshold += settings.slow_drip_rate
+                if roll < threshold:
+                    simulator._count('200-slow')
+                    return self._send(200, body, 'text/html; charset=utf-8', validators, drip_seconds=settings.slow_drip_seconds)
+                simulator._count('200')
+                return self._send(200, body, 'text/html; charset=utf-8', validators)
+
+            def _send(self, status: int, body: bytes, content_type: Optional[str], headers: Optional[Dict[str, str]] = None, drip_seconds: float = 0.0):
+                try:
+                    self.send_response(status)
+                    if content_type:
+                        self.send_header('Content-Type', content_type)
+                    for name, value in (headers or {}).items():
+                        self.send_header(name, value)
+                    self.send_header('Content-Length', str(len(body)))
+                    self.end_headers()
+                    if not drip_seconds:
+                        self.wfile.write(body)
+                        return
+                    # 본문을 20조각으로 나누어 천천히 전송
+                    step = max(1, len(body) // 20)
+                    for i in range(0, len(body), step):
+                        self.wfile.write(body[i:i + step])
+                        self.wfile.flush()
+                        time.sleep(drip_seconds / 20)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+        return Handler
+
+
+def synthetic_companies(count: int) -> pd.DataFrame:
+    """시뮬레이터로 보낼 가상 회사 목록 (시트와 같은 열 구성)"""
+    return pd.DataFrame([{
+        '회사_한글_이름': f'가상회사{i:05d}',
+        'job_posting_url': f'https://career-{i:05d}.sim.test/jobs',
+        'selector': 'a.job-title-link',
+        'original_selector': '',
+        'selenium_required': 0,
+    } for i in range(count)])
+
+
+def run_benchmark(counts: List[int], rewrite_template: str, rounds: int = 1, rate_limit: bool = False) -> List[Dict]:
+    """가상 회사 수별로 JobMonitoringDAG의 정적 수집 경로 처리량을 측정합니다.
+
+    rate_limit이 False면 요청 속도 제한(전역/호스트별 토큰 버킷)을 사실상 끄고 수집/파싱 경로 자체를 측정합니다.
+    """
+    from analyze_titles import JobPostingSelectorAnalyzer
+    from job_monitoring_logic import JobMonitoringDAG
+    from utils import SeleniumRequirementChecker
+
+    os.environ['CRAWL_URL_REWRITE'] = rewrite_template
+    # 모든 요청이 시뮬레이터 한 곳으로 가므로 비동기 엔진의 호스트별 연결 제한은 끔 (속도 제한은 원래 호스트 기준으로 유지)
+    os.environ.setdefault('ASYNC_FETCH_PER_HOST', '0')
+    if not rate_limit:
+        # 전역 20rps 버킷이 그대로면 처리량이 속도 제한 설정값으로 수렴함
+        os.environ.update({'RATE_LIMIT_GLOBAL_RPS': '1000000', 'RATE_LIMIT_GLOBAL_BURST': '1000000',
+                           'RATE_LIMIT_HOST_RPS': '1000000', 'RATE_LIMIT_HOST_BURST': '1000000', 'RATE_LIMIT_SHARED_HOSTS': ''})
+    results = []
+    for count in counts:
+        df = synthetic_companies(count)
+        with tempfile.TemporaryDirectory(prefix='job-monitoring-bench-') as work_dir:
+            dag = JobMonitoringDAG(work_dir)
+            try:
+                dag.snapshot_store = None
+                dag.selector_analyzer = JobPostingSelectorAnalyzer()
+                dag.selenium_checker = SeleniumRequirementChecker(validator_cache=dag.validator_cache, rate_limiter=dag.rate_limiter,
+                                                                  session_pool=dag.session_pool, on_probe=dag._remember_probe,
+                                                                  parser_backend=dag.parser_backend, parser_compat=dag.parser_compat)
+                dag.logger.setLevel(logging.WARNING)
+
+                for round_no in range(1, rounds + 1):
+                    start = time.perf_counter()
+                    _, current_jobs, failed = dag.process_companies_integrated(df.copy())
+                    elapsed = time.perf_counter() - start
+                    results.append({
+                        'companies': count,
+                        'round': round_no,
+                        'seconds': round(elapsed, 2),
+                        'companies_per_second': round(count / elapsed, 1) if elapsed else None,
+                        'succeeded': len(current_jobs),
+                        'failed': len(failed),
+                    })
+            finally:
+                # 회사 수마다 새 DAG를 만드므로 파싱 프로세스/브라우저가 다음 측정으로 넘어가지 않도록 모두 종료
+                dag.browser_pool.close()
+                dag.parse_pool.close()
+                dag.session_pool.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='채용 페이지 시뮬레이터 (부하/확장성 측정용)')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    def add_server_options(p):
+        p.add_argument('--host', default='127.0.0.1')
+        p.add_argument('--port', type=int, default=8900)
+        p.add_argument('--latency', default='lognormal:150:0.6', help='fixed:MS / uniform:MIN:MAX / lognormal:MEDIAN:SIGMA')
+        p.add_argument('--error-rate', type=float, default=0.01)
+        p.add_argument('--throttle-rate', type=float, default=0.01)
+        p.add_argument('--redirect-rate', type=float, default=0.05)
+        p.add_argument('--slow-drip-rate', type=float, default=0.01)
+        p.add_argument('--slow-drip-seconds', type=float, default=5.0)
+        p.add_argument('--page-kb', type=int, default=60)
+        p.add_argument('--snapshots', default=None, help='기록된 본문을 제공할 스냅샷 저장소 경로')
+        p.add_argument('--no-etag', action='store_true', help='ETag를 보내지 않고 조건부 요청을 무시')
+        p.add_argument('--volatile-tokens', action='store_true', help='요청마다 바뀌는 CSRF 토큰/nonce를 본문에 삽입')
+
+    add_server_options(sub.add_parser('serve', help='시뮬레이터 서버 실행'))
+    bench = sub.add_parser('bench', help='시뮬레이터를 띄우고 회사 수별 처리량 측정')
+    add_server_options(bench)
+    bench.add_argument('--companies', default='1000,5000,20000')
+    bench.add_argument('--rounds', type=int, default=1, help='같은 목록 반복 횟수 (2회차부터 조건부 요청 경로)')
+    bench.add_argument('--server', default=None, help='이미 실행 중인 시뮬레이터 주소 (예: http://10.0.0.5:8900)')
+    bench.add_argument('--rate-limit', action='store_true', help='요청 속도 제한(RATE_LIMIT_*)을 운영 설정대로 적용')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    settings = SimulatorSettings(
+        latency=args.latency, error_rate=args.error_rate, throttle_rate=args.throttle_rate,
+        redirect_rate=args.redirect_rate, slow_drip_rate=args.slow_drip_rate,
+        slow_drip_seconds=args.slow_drip_seconds, page_kb=args.page_kb,
+        etag=not args.no_etag, volatile_tokens=args.volatile_tokens,
+    )
+
+    if args.command == 'serve':
+        simulator = CareerSiteSimulator(args.host, args.port, settings, args.snapshots)
+        print(f"시뮬레이터 실행 중: {simulator.base_url}")
+        print(f"CRAWL_URL_REWRITE={simulator.rewrite_template}")
+        try:
+            simulator.server.serve_forever()
+        except KeyboardInterrupt:
+            simulator.stop()
+        return
+
+    simulator = None
+    if args.server:
+        template = f"{args.server.rstrip('/')}/page?url={{url}}"
+    else:
+        simulator = CareerSiteSimulator(args.host, args.port, settings, args.snapshots).start()
+        template = simulator.rewrite_template
+
+    try:
+        results = run_benchmark([int(c) for c in args.companies.split(',')], template, args.rounds, args.rate_limit)
+    finally:
+        if simulator:
+            print(f"시뮬레이터 응답 통계: {simulator.stats()}")
+            simulator.stop()
+
+    print(f"{'회사 수':>8} {'회차':>4} {'소요(초)':>10} {'회사/초':>10} {'성공':>8} {'실패':>6}")
+    for r in results:
+        print(f"{r['companies']:>8} {r['round']:>4} {r['seconds']:>10} {r['companies_per_second']:>10} {r['succeeded']:>8} {r['failed']:>6}")
+
+
+if __name__ == "__main__":
+    main()
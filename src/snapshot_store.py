@@ -0,0 +1,396 @@
+import argparse
+import contextlib
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional
+
+from state_store import JsonStateStore
+
+try:
+    import zstandard
+except ImportError:  # zstandard가 없으면 gzip으로 저장
+    zstandard = None
+
+try:
+    import fcntl
+except ImportError:  # fcntl이 없는 환경(Windows)에서는 프로세스 간 잠금 없이 동작
+    fcntl = None
+
+ZSTD_LEVEL = 10
+
+# 실행 중 표시가 이 시간보다 오래되면 비정상 종료된 실행으로 보고 무시
+STALE_RUN_HOURS = 12
+
+
+def _atomic_write(path: str, data: bytes):
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class SnapshotStore:
+    """수집한 HTML을 내용 해시 기준으로 압축 저장하는 스냅샷 저장소
+
+    구조:
+        objects/ab/<sha256>.html.zst  - 본문 (zstandard가 없으면 .html.gz)
+        manifests/<run_id>.json       - 실행별 URL/회사 -> 스냅샷 매핑
+        sheets/<run_id>.csv           - 실행 시작 시점의 시트 사본 (오프라인 재실행 입력)
+        index.json                    - URL별 마지막 스냅샷 해시 (304/본문 동일 시 참조)
+        running/<run_id>              - 진행 중인 실행 표시
+
+    같은 본문은 한 번만 저장되며, 보존 기간이 지난 매니페스트를 지운 뒤
+    어떤 매니페스트에서도 참조하지 않는 객체를 정리(compaction)합니다.
+    여러 DAG가 같은 저장소를 쓰므로 매니페스트/인덱스 갱신과 정리는 파일 잠금(.lock)으로 직렬화하고,
+    다른 실행이 진행 중이면(아직 매니페스트에 없는 객체가 있을 수 있으므로) 객체 정리를 건너뜁니다.
+    """
+
+    def __init__(self, root: str, keep_runs: int = 30, max_age_days: float = 14):
+        self.root = root
+        self.objects_dir = os.path.join(root, 'objects')
+        self.manifests_dir = os.path.join(root, 'manifests')
+        self.sheets_dir = os.path.join(root, 'sheets')
+        self.running_dir = os.path.join(root, 'running')
+        self.keep_runs = keep_runs
+        self.max_age_days = max_age_days
+        self.index = JsonStateStore(os.path.join(root, 'index.json'))
+        self.logger = logging.getLogger(__name__)
+
+        self._lock = threading.Lock()
+        self._run_id: Optional[str] = None
+        self._worksheet: Optional[str] = None
+        self._started_at: Optional[str] = None
+        self._staged: Dict[str, str] = {}
+        self._entries: Dict[str, Dict] = {}
+        self._index_updates: Dict[str, str] = {}
+        self._raw_bytes = 0
+        self._stored_bytes = 0
+
+    @contextlib.contextmanager
+    def _exclusive(self):
+        """같은 저장소를 쓰는 다른 프로세스와 매니페스트/인덱스 갱신 및 정리를 직렬화합니다."""
+        os.makedirs(self.root, exist_ok=True)
+        with open(os.path.join(self.root, '.lock'), 'a') as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    # ---- 객체 ----
+
+    def _object_path(self, digest: str, ext: str) -> str:
+        return os.path.join(self.objects_dir, digest[:2], f"{digest}{ext}")
+
+    def put(self, html: str) -> str:
+        """본문을 저장하고 해시를 반환합니다. 이미 있는 본문은 다시 쓰지 않습니다."""
+        raw = html.encode('utf-8')
+        digest = hashlib.sha256(raw).hexdigest()
+        if self._find_object(digest):
+            return digest
+
+        if zstandard is not None:
+            path, data = self._object_path(digest, '.html.zst'), zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(raw)
+        else:
+            path, data = self._object_path(digest, '.html.gz'), gzip.compress(raw)
+        _atomic_write(path, data)
+
+        with self._lock:
+            self._raw_bytes += len(raw)
+            self._stored_bytes += len(data)
+        return digest
+
+    def get(self, digest: str) -> Optional[str]:
+        """해시에 해당하는 본문을 반환합니다."""
+        path = self._find_object(digest)
+        if not path:
+            return None
+        with open(path, 'rb') as f:
+            data = f.read()
+        if path.endswith('.zst'):
+            if zstandard is None:
+                self.logger.error(f"zstandard 패키지가 없어 스냅샷을 읽을 수 없습니다: {path}")
+                return None
+            raw = zstandard.ZstdDecompressor().decompress(data)
+        else:
+            raw = gzip.decompress(data)
+        return raw.decode('utf-8')
+
+    def _find_object(self, digest: str) -> Optional[str]:
+        for ext in ('.html.zst', '.html.gz'):
+            path = self._object_path(digest, ext)
+            if os.path.exists(path):
+                return path
+        return None
+
+    # ---- 실행 매니페스트 ----
+
+    def start_run(self, run_id: Optional[str] = None, worksheet: Optional[str] = None):
+        with self._lock:
+            self._run_id = run_id or time.strftime('%Y%m%d-%H%M%S')
+            self._worksheet = worksheet
+            self._started_at = time.strftime('%Y-%m-%d %H:%M:%S')
+            self._staged = {}
+            self._entries = {}
+            self._index_updates = {}
+            self._raw_bytes = 0
+            self._stored_bytes = 0
+            run_id = self._run_id
+        # 정리 중인 다른 프로세스가 끝난 뒤에 표시하므로, 이후 저장하는 객체는 다른 실행의 정리 대상이 되지 않음
+        with self._exclusive():
+            _atomic_write(os.path.join(self.running_dir, run_id), str(os.getpid()).encode('utf-8'))
+
+    def save_sheet(self, df):
+        """이번 실행의 입력 시트를 CSV로 저장합니다."""
+        with self._lock:
+            run_id = self._run_id
+        if not run_id:
+            return
+        try:
+            os.makedirs(self.sheets_dir, exist_ok=True)
+            df.to_csv(self.sheet_path(run_id), index=False, encoding='utf-8-sig')
+        except Exception as e:
+            self.logger.warning(f"시트 사본 저장 실패: {e}")
+
+    def sheet_path(self, run_id: str) -> str:
+        return os.path.join(self.sheets_dir, f"{run_id}.csv")
+
+    def stage(self, url: str, html: str) -> Optional[str]:
+        """이번 실행에서 URL로 받은 본문을 저장합니다."""
+        try:
+            digest = self.put(html)
+        except Exception as e:
+            self.logger.warning(f"스냅샷 저장 실패: {url} - {e}")
+            return None
+        with self._lock:
+            self._staged[url] = digest
+        return digest
+
+    def record(self, url: str, companies: List[str], selector: Optional[str], job_titles: List[str], error: Optional[str] = None):
+        """URL 처리 결과를 매니페스트에 기록합니다.
+
+        이번에 본문을 받지 않은 URL(304/본문 동일)은 마지막 스냅샷을 가리킵니다.
+        """
+        with self._lock:
+            digest = self._staged.pop(url, None)
+        if digest:
+            status = 'fetched'
+            self.index.set(url, digest)
+            with self._lock:
+                self._index_updates[url] = digest
+        elif error:
+            status = 'failed'
+        else:
+            status = 'reused'
+            digest = self.index.get(url)
+
+        entry = {
+            'companies': companies,
+            'hash': digest,
+            'status': status,
+            'selector': selector,
+            'job_titles': job_titles,
+        }
+        if error:
+            entry['error'] = error
+        with self._lock:
+            self._entries[url] = entry
+
+    def finish_run(self) -> Optional[str]:
+        """매니페스트를 저장하고 보존 정책을 적용합니다. 매니페스트 경로를 반환합니다."""
+        with self._lock:
+            run_id, self._run_id = self._run_id, None
+            if not run_id:
+                return None
+            manifest = {
+                'run_id': run_id,
+                'worksheet': self._worksheet,
+                'started_at': self._started_at,
+                'finished_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'entries': self._entries,
+            }
+            raw_bytes, stored_bytes = self._raw_bytes, self._stored_bytes
+            index_updates = dict(self._index_updates)
+
+        path = os.path.join(self.manifests_dir, f"{run_id}.json")
+        with self._exclusive():
+            try:
+                if not manifest['entries']:
+                    return None
+                _atomic_write(path, json.dumps(manifest, ensure_ascii=False).encode('utf-8'))
+                self._merge_index(index_updates)
+            except Exception as e:
+                self.logger.error(f"스냅샷 매니페스트 저장 실패: {path} - {e}")
+                return None
+            finally:
+                self._clear_running(run_id)
+
+            ratio = f", 압축률 {stored_bytes / raw_bytes:.1%}" if raw_bytes else ''
+            self.logger.info(f"스냅샷 저장: URL {len(manifest['entries'])}개, 새 본문 {raw_bytes / 1024:.0f}KB -> {stored_bytes / 1024:.0f}KB{ratio}")
+            self._apply_retention()
+        return path
+
+    def _merge_index(self, updates: Dict[str, str]):
+        """다른 프로세스가 그사이 저장한 인덱스를 다시 읽고 이번 실행의 변경만 반영해 저장합니다."""
+        index = JsonStateStore(self.index.path)
+        for url, digest in updates.items():
+            index.set(url, digest)
+        if not index.save():
+            raise OSError(f"인덱스 저장 실패: {index.path}")
+        self.index = index
+
+    def _clear_running(self, run_id: str):
+        try:
+            os.remove(os.path.join(self.running_dir, run_id))
+        except FileNotFoundError:
+            pass
+
+    def _active_runs(self) -> List[str]:
+        """진행 중인 다른 실행 ID (오래된 표시는 비정상 종료로 보고 제외)"""
+        if not os.path.isdir(self.running_dir):
+            return []
+        cutoff = time.time() - STALE_RUN_HOURS * 3600
+        active = []
+        for name in os.listdir(self.running_dir):
+            try:
+                if os.path.getmtime(os.path.join(self.running_dir, name)) >= cutoff:
+                    active.append(name)
+            except FileNotFoundError:
+                continue
+        return sorted(active)
+
+    def list_runs(self) -> List[str]:
+        """저장된 실행 ID를 오래된 순으로 반환합니다."""
+        if not os.path.isdir(self.manifests_dir):
+            return []
+        return sorted(name[:-5] for name in os.listdir(self.manifests_dir) if name.endswith('.json'))
+
+    def load_manifest(self, run_id: Optional[str] = None) -> Optional[Dict]:
+        """실행 매니페스트를 읽습니다. run_id가 없으면 가장 최근 실행을 사용합니다."""
+        runs = self.list_runs()
+        if run_id is None:
+            run_id = runs[-1] if runs else None
+        if not run_id or run_id not in runs:
+            return None
+        with open(os.path.join(self.manifests_dir, f"{run_id}.json"), 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    # ---- 보존 및 정리 ----
+
+    def apply_retention(self):
+        """오래된 매니페스트를 지우고 참조되지 않는 객체를 정리합니다."""
+        with self._exclusive():
+            self._apply_retention()
+
+    def _apply_retention(self):
+        runs = self.list_runs()
+        expired = set(runs[:-self.keep_runs]) if self.keep_runs > 0 and len(runs) > self.keep_runs else set()
+        if self.max_age_days > 0:
+            cutoff = time.time() - self.max_age_days * 86400
+            for run_id in runs[:-1]:  # 가장 최근 실행은 항상 보존
+                if os.path.getmtime(os.path.join(self.manifests_dir, f"{run_id}.json")) < cutoff:
+                    expired.add(run_id)
+
+        for run_id in expired:
+            os.remove(os.path.join(self.manifests_dir, f"{run_id}.json"))
+            if os.path.exists(self.sheet_path(run_id)):
+                os.remove(self.sheet_path(run_id))
+        if expired:
+            self.logger.info(f"스냅샷 매니페스트 {len(expired)}개 만료")
+        self._compact()
+
+    def compact(self) -> int:
+        """어떤 매니페스트나 인덱스에서도 참조하지 않는 객체를 삭제하고 삭제 수를 반환합니다."""
+        with self._exclusive():
+            return self._compact()
+
+    def _compact(self) -> int:
+        active = self._active_runs()
+        if active:
+            # 진행 중인 실행이 저장했지만 아직 매니페스트에 없는 객체를 지우지 않도록 다음 정리로 미룸
+            self.logger.info(f"다른 실행 진행 중({', '.join(active)}), 스냅샷 객체 정리 생략")
+            return 0
+
+        referenced = {digest for _, digest in JsonStateStore(self.index.path).items()}
+        for run_id in self.list_runs():
+            manifest = self.load_manifest(run_id) or {}
+            referenced.update(entry.get('hash') for entry in manifest.get('entries', {}).values())
+
+        removed = 0
+        freed = 0
+        if not os.path.isdir(self.objects_dir):
+            return 0
+        for prefix in os.listdir(self.objects_dir):
+            directory = os.path.join(self.objects_dir, prefix)
+            for name in os.listdir(directory):
+                digest = name.split('.', 1)[0]
+                if digest not in referenced:
+                    path = os.path.join(directory, name)
+                    freed += os.path.getsize(path)
+                    os.remove(path)
+                    removed += 1
+            if not os.listdir(directory):
+                os.rmdir(directory)
+
+        if removed:
+            self.logger.info(f"스냅샷 객체 {removed}개 정리 ({freed / 1024:.0f}KB 확보)")
+        return removed
+
+    # ---- 내보내기 ----
+
+    def export_html(self, html_dir: str, run_id: Optional[str] = None) -> int:
+        """매니페스트의 회사별 본문을 ConfigManager가 읽는 {회사명}.html 파일로 내보냅니다."""
+        manifest = self.load_manifest(run_id)
+        if not manifest:
+            self.logger.error("내보낼 스냅샷 매니페스트가 없습니다.")
+            return 0
+
+        os.makedirs(html_dir, exist_ok=True)
+        exported = 0
+        for url, entry in manifest['entries'].items():
+            html = self.get(entry['hash']) if entry.get('hash') else None
+            if html is None:
+                continue
+            for company in entry['companies']:
+                filename = re.sub(r'[\\/:*?"<>|]', '_', company)
+                with open(os.path.join(html_dir, f"{filename}.html"), 'w', encoding='utf-8') as f:
+                    f.write(html)
+                exported += 1
+        return exported
+
+
+def main():
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parser = argparse.ArgumentParser(description='채용공고 HTML 스냅샷 저장소 관리')
+    parser.add_argument('command', choices=['runs', 'export', 'compact'])
+    parser.add_argument('--root', default=os.path.join(base_dir, 'data', 'snapshots'))
+    parser.add_argument('--run', default=None, help='실행 ID (기본값: 가장 최근 실행)')
+    parser.add_argument('--html-dir', default=os.path.join(base_dir, 'html'))
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    store = SnapshotStore(args.root)
+
+    if args.command == 'runs':
+        for run_id in store.list_runs():
+            manifest = store.load_manifest(run_id)
+            print(f"{run_id}: URL {len(manifest['entries'])}개")
+    elif args.command == 'export':
+        print(f"{store.export_html(args.html_dir, args.run)}개 HTML 파일을 '{args.html_dir}'에 내보냈습니다.")
+    else:
+        print(f"객체 {store.compact()}개를 정리했습니다.")
+
+
+if __name__ == "__main__":
+    main()
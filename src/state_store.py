@@ -0,0 +1,78 @@
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import Any, Dict, Iterator, Tuple
+
+
+class JsonStateStore:
+    """data/ 아래 JSON 파일로 유지되는 키별 상태 저장소 (스레드 안전)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._data = self._load()
+
+    def _load(self) -> Dict[str, Any]:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except Exception as e:
+            self.logger.warning(f"상태 파일 로드 실패, 빈 상태로 시작합니다: {self.path} - {e}")
+            return {}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            return self._data.get(key, default)
+
+    def set(self, key: str, value: Any):
+        with self._lock:
+            self._data[key] = value
+            self._dirty = True
+
+    def update(self, key: str, **fields) -> Dict[str, Any]:
+        """키에 해당하는 dict 항목의 일부 필드만 갱신합니다."""
+        with self._lock:
+            entry = dict(self._data.get(key) or {})
+            entry.update(fields)
+            self._data[key] = entry
+            self._dirty = True
+            return entry
+
+    def delete(self, key: str):
+        with self._lock:
+            if key in self._data:
+                del self._data[key]
+                self._dirty = True
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        with self._lock:
+            return iter(list(self._data.items()))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def save(self) -> bool:
+        """변경 사항이 있을 때만 임시 파일에 쓴 뒤 교체하여 저장합니다."""
+        with self._lock:
+            if not self._dirty:
+                return True
+            try:
+                directory = os.path.dirname(self.path) or '.'
+                os.makedirs(directory, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(self._data, f, ensure_ascii=False)
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+                return True
+            except Exception as e:
+                self.logger.error(f"상태 파일 저장 실패: {self.path} - {e}")
+                return False
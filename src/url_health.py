@@ -0,0 +1,122 @@
+import hashlib
+import logging
+import re
+import threading
+import time
+from typing import Dict, Optional, Union
+
+from state_store import JsonStateStore
+
+# 다시 시도해도 결과가 같을 가능성이 높은 실패 (첫 재시도까지 오래 기다림)
+PERMANENT_FAILURES = {'dns', 'tls', 'http_4xx', 'selector_miss'}
+
+# 실패 종류별 첫 재시도까지의 대기 일수 (연속 실패마다 두 배, max_days까지)
+BASE_DELAY_DAYS = {
+    'dns': 3,
+    'tls': 3,
+    'http_4xx': 3,
+    'selector_miss': 3,
+    'timeout': 0.5,
+    'http_5xx': 0.5,
+    'throttled': 0.5,
+    'connection': 0.5,
+    'other': 1,
+}
+
+# 오류 메시지로 실패 종류를 구분하는 패턴 (requests/aiohttp/Playwright 공통, 위에서부터 우선)
+_ERROR_PATTERNS = [
+    ('dns', re.compile(r'NameResolution|Failed to resolve|Name or service not known|nodename nor servname|getaddrinfo|'
+                       r'No address associated|ERR_NAME_NOT_RESOLVED|DNS', re.IGNORECASE)),
+    ('tls', re.compile(r'SSLError|SSL:|CERTIFICATE_VERIFY_FAILED|ERR_CERT_|ERR_SSL_|certificate', re.IGNORECASE)),
+    ('timeout', re.compile(r'timeout|timed out', re.IGNORECASE)),
+    ('connection', re.compile(r'ConnectionError|Connection refused|Connection reset|ERR_CONNECTION|Cannot connect|연결 오류', re.IGNORECASE)),
+]
+
+
+def classify_failure(status: Optional[int] = None, error: Union[BaseException, str, None] = None) -> str:
+    """HTTP 상태 코드나 예외/오류 메시지로 실패 종류를 구분합니다."""
+    if status and status >= 400:
+        if status == 429:
+            return 'throttled'
+        if status == 408:
+            return 'timeout'
+        return 'http_5xx' if status >= 500 else 'http_4xx'
+    if error is None:
+        return 'other'
+    message = f"{type(error).__name__}: {error}" if isinstance(error, BaseException) else str(error)
+    for kind, pattern in _ERROR_PATTERNS:
+        if pattern.search(message):
+            return kind
+    return 'other'
+
+
+class UrlHealthTracker:
+    """실패한 URL(selenium_required -1/-2)의 실패 기록과 재시도 일정을 실행 간에 유지합니다.
+
+    실패하면 종류별 대기 시간 뒤에만 다시 시도하고(서킷 브레이커), 연속 실패마다 대기 시간을 두 배로 늘립니다.
+    다시 성공한 URL은 기록을 지우고 정상 대상으로 돌아갑니다. 기록은 data/url_health.json에 저장됩니다.
+    """
+
+    def __init__(self, path: str, max_days: float = 30):
+        self.store = JsonStateStore(path)
+        self.max_days = max_days
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._noted: Dict[str, Dict[str, str]] = {}  # 이번 실행에서 관찰한 URL별 실패 종류
+
+    def note_failure(self, url: str, kind: str, detail: str = ''):
+        """수집 단계에서 관찰한 실패 종류를 결과가 확정될 때까지 보관합니다."""
+        with self._lock:
+            self._noted[url] = {'kind': kind, 'detail': detail[:200]}
+
+    def is_due(self, url: str) -> bool:
+        """실패 상태인 URL을 이번 실행에서 다시 시도할지 확인합니다."""
+        entry = self.store.get(url)
+        if not entry:
+            # 기록 없이 실패 상태인 URL(이전 버전에서 설정됨)은 일주일 안에 고르게 나누어 재시도
+            spread = int(hashlib.sha1(url.encode('utf-8')).hexdigest()[:8], 16) % 7
+            self.store.set(url, {'kind': 'unknown', 'failures': 1, 'next_probe_at': time.time() + spread * 86400, 'history': []})
+            return spread == 0
+        return time.time() >= entry.get('next_probe_at', 0)
+
+    def record_failure(self, url: str, selenium_status: int) -> Dict:
+        """실패를 기록하고 다음 재시도 시각을 정합니다."""
+        with self._lock:
+            noted = self._noted.pop(url, None)
+        if selenium_status == -2:
+            noted = {'kind': 'selector_miss', 'detail': ''}
+        noted = noted or {'kind': 'other', 'detail': ''}
+
+        entry = dict(self.store.get(url) or {})
+        failures = entry.get('failures', 0) + 1
+        delay_days = min(BASE_DELAY_DAYS.get(noted['kind'], 1) * 2 ** (failures - 1), self.max_days)
+        history = list(entry.get('history') or [])
+        history.append({'at': time.strftime('%Y-%m-%d %H:%M:%S'), 'kind': noted['kind'], 'detail': noted['detail']})
+        entry.update(
+            kind=noted['kind'],
+            permanent=noted['kind'] in PERMANENT_FAILURES,
+            failures=failures,
+            next_probe_at=time.time() + delay_days * 86400,
+            history=history[-10:],
+        )
+        self.store.set(url, entry)
+        return entry
+
+    def record_success(self, url: str):
+        with self._lock:
+            self._noted.pop(url, None)
+        entry = self.store.get(url)
+        if entry:
+            self.logger.info(f"  - 실패했던 URL 복구 ({entry.get('kind')}, 연속 실패 {entry.get('failures')}회 후): {url}")
+            self.store.delete(url)
+
+    def summary(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for _, entry in self.store.items():
+            counts[entry.get('kind', 'unknown')] = counts.get(entry.get('kind', 'unknown'), 0) + 1
+        return counts
+
+    def save(self):
+        with self._lock:
+            self._noted.clear()
+        self.store.save()
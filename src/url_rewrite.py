@@ -0,0 +1,29 @@
+from typing import Optional
+from urllib.parse import quote, urlparse
+
+
+class UrlRewriter:
+    """실제 요청을 보내기 직전에 URL을 다른 주소로 바꾸는 훅
+
+    템플릿 예: 'http://127.0.0.1:8900/page?url={url}'
+        {url}  - 퍼센트 인코딩된 원래 URL
+        {host} - 원래 호스트
+        {path} - 원래 경로와 쿼리
+
+    결과 저장, 속도 제한, 캐시 키에는 항상 원래 URL이 쓰이고 네트워크 요청만 바뀝니다.
+    템플릿이 비어 있으면 URL을 그대로 반환합니다.
+    """
+
+    def __init__(self, template: Optional[str] = None):
+        self.template = (template or '').strip()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.template)
+
+    def __call__(self, url: str) -> str:
+        if not self.template:
+            return url
+        parsed = urlparse(url)
+        path = parsed.path + (f"?{parsed.query}" if parsed.query else '')
+        return self.template.format(url=quote(url, safe=''), host=parsed.netloc, path=path)
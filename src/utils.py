@@ -1,9 +1,12 @@
 import re
+import logging
 import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 import time
-from typing import Optional
+from typing import Any, Callable, Optional
+
+from html_parser import css_select_one, make_soup, resolve_backend
 
 def stabilize_selector(selector, conservative=True):
     """선택자를 안정적인 형태로 변환합니다."""
@@ -44,9 +47,18 @@ def stabilize_selector(selector, conservative=True):
 class SeleniumRequirementChecker:
     """채용공고 URL에 대해 Selenium 필요 여부를 판별하는 클래스"""
     
-    def __init__(self, timeout: int = 15, delay: float = 0.5):
+    def __init__(self, timeout: int = 15, delay: float = 0.5, validator_cache=None, rate_limiter=None, session_pool=None,
+                 on_probe: Optional[Callable[[str, Any, str, BeautifulSoup], None]] = None,
+                 parser_backend: Optional[str] = None, parser_compat: bool = False):
         self.timeout = timeout
-        self.delay = delay
+        self.delay = delay  # rate_limiter가 없을 때만 사용하는 고정 대기 시간
+        self.validator_cache = validator_cache  # HttpValidatorCache (선택)
+        self.rate_limiter = rate_limiter  # HostRateLimiter (선택)
+        self.session_pool = session_pool  # SessionPool (선택, 없으면 매번 새 연결)
+        self.on_probe = on_probe  # 판별에 사용한 응답을 넘겨받는 콜백 (선택, 크롤링 단계에서 재사용)
+        self.parser_backend = parser_backend  # HTML 파서 백엔드 (html_parser.BACKENDS)
+        self.parser_compat = parser_compat  # html.parser 판별 결과와 비교해 다르면 html.parser 결과 사용
+        self.logger = logging.getLogger(__name__)
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
@@ -67,40 +79,69 @@ class SeleniumRequirementChecker:
         URL과 CSS 선택자를 기준으로 Selenium 필요 여부를 판별
         """
         try:
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
+            headers = dict(self.headers)
+            cached = self.validator_cache.lookup(url, scope='probe') if self.validator_cache else None
+            if cached:
+                headers.update(self.validator_cache.conditional_headers(url, scope='probe'))
+
+            if self.rate_limiter:
+                self.rate_limiter.acquire(url)
+            if self.session_pool:
+                response, html = self.session_pool.fetch_text(url, headers=headers, timeout=self.timeout)
+            else:
+                response = requests.get(url, headers=headers, timeout=self.timeout)
+                html = response.text
             response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            if "greetinghr.com" in url:
-                return self._check_greetinghr(url, soup)
-            
-            return self._check_general_selector(url, selector, soup)
+
+            # 변경되지 않은 페이지는 이전 판별 결과를 재사용
+            if response.status_code == 304 and cached:
+                return cached['selenium_required']
+
+            soup = make_soup(html, self.parser_backend)
+            if self.on_probe:
+                self.on_probe(url, response, html, soup)
+
+            result = self._evaluate(url, selector, soup, html)
+            if self.parser_compat and resolve_backend(self.parser_backend) != 'html.parser':
+                reference = self._evaluate(url, selector, BeautifulSoup(html, 'html.parser'), html)
+                if reference != result:
+                    self.logger.warning(f"파서 호환성 불일치 (Selenium 판별, {resolve_backend(self.parser_backend)}): {url} - html.parser 결과 사용")
+                    result = reference
+
+            if self.validator_cache:
+                self.validator_cache.store_probe(url, response.headers, result)
+            return result
             
         except requests.exceptions.RequestException:
             return True
         except Exception:
             return True
         finally:
-            time.sleep(self.delay)
+            if not self.rate_limiter:
+                time.sleep(self.delay)
     
+    def _evaluate(self, url: str, selector: Optional[str], soup: BeautifulSoup, html: Optional[str] = None) -> bool:
+        if "greetinghr.com" in url:
+            return self._check_greetinghr(url, soup)
+        return self._check_general_selector(url, selector, soup, html)
+
     def _check_greetinghr(self, _: str, soup: BeautifulSoup) -> bool:
-        link_element = soup.select_one('a[href^="/ko/o/"]')
+        link_element = css_select_one(soup, 'a[href^="/ko/o/"]')
         return False if link_element else True
 
-    def _check_general_selector(self, _: str, selector: Optional[str], soup: BeautifulSoup) -> bool:
+    def _check_general_selector(self, _: str, selector: Optional[str], soup: BeautifulSoup, html: Optional[str] = None) -> bool:
         # SPA/JavaScript 앱 감지
-        if self._is_spa_site(soup):
+        if self._is_spa_site(soup, html):
             return True
             
         if pd.isna(selector) or not selector:
             return True
         
-        element = soup.select_one(selector)
+        element = css_select_one(soup, selector)
         return False if element else True
     
-    def _is_spa_site(self, soup: BeautifulSoup) -> bool:
-        """SPA(Single Page Application) 사이트인지 감지"""
+    def _is_spa_site(self, soup: BeautifulSoup, html: Optional[str] = None) -> bool:
+        """SPA(Single Page Application) 사이트인지 감지 (원본 html이 있으면 soup을 다시 직렬화하지 않음)"""
         
         body = soup.find('body')
         body_text = body.get_text(strip=True) if body else ""
@@ -113,7 +154,7 @@ class SeleniumRequirementChecker:
             'ng-app', 'ng-version'                # Angular
         ]
         
-        html_content = str(soup).lower()
+        html_content = (html if html is not None else str(soup)).lower()
         strong_indicators_found = [ind for ind in strong_spa_indicators if ind in html_content]
         
         # 강력한 지표가 있으면서 body 텍스트가 적으면 SPA
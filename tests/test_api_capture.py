@@ -0,0 +1,33 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from api_capture import ApiEndpointCapture, find_matching_path  # noqa: E402
+
+RENDERED = {'Backend Engineer', 'Data Engineer', 'Product Designer', 'iOS Engineer', 'Android Engineer'}
+
+
+def test_matching_path_requires_exact_titles():
+    jobs = [' Backend Engineer ', 'Data Engineer', 'Product Designer', 'iOS Engineer', 'Android Engineer', 'Data Engineer']
+    payload = {'data': {'list': [{'id': i, 'name': name} for i, name in enumerate(jobs)]}}
+    assert find_matching_path(payload, RENDERED) == 'data.list.*.name'
+
+    # 제목 하나만 달라도(자카드 0.83) 학습하지 않음
+    payload['data']['list'].append({'id': 9, 'name': 'Recruiting Coordinator'})
+    assert find_matching_path(payload, RENDERED) is None
+
+
+def test_verification_discards_endpoint_on_any_difference(tmp_path):
+    capture = ApiEndpointCapture(str(tmp_path / 'api_endpoints.json'))
+    url = 'https://careers.example.com'
+    capture.store.set(url, {'endpoint': {'method': 'GET', 'url': 'https://api.example.com/jobs'}, 'path': 'list.*.title',
+                            'verified_at': 0, 'failures': 0})
+
+    capture.expect_verification(url, sorted(RENDERED))
+    capture.learn(url, sorted(RENDERED))
+    assert capture.store.get(url)['verified_at'] > 0
+
+    capture.expect_verification(url, sorted(RENDERED | {'Recruiting Coordinator'}))
+    capture.learn(url, sorted(RENDERED))
+    assert capture.store.get(url) is None
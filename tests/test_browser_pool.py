@@ -0,0 +1,98 @@
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from browser_pool import PlaywrightBrowserPool, _BrowserSlot  # noqa: E402
+
+
+class _FakeBrowser:
+    """강제 종료되면 연결이 끊어지는 브라우저"""
+
+    def __init__(self, slot_ref):
+        self.slot_ref = slot_ref
+
+    def new_context(self):
+        return _FakeContext()
+
+    def is_connected(self):
+        return not self.slot_ref[0].killed
+
+    def close(self):
+        pass
+
+
+class _FakeContext:
+    def close(self):
+        pass
+
+
+class _FakePlaywright:
+    def stop(self):
+        pass
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    pool = PlaywrightBrowserPool(size=1)
+    launched = []
+
+    def launch():
+        ref = []
+        slot = _BrowserSlot(_FakePlaywright(), _FakeBrowser(ref), set())
+        ref.append(slot)
+        launched.append(slot)
+        return slot
+
+    monkeypatch.setattr(pool, '_launch', launch)
+    pool.launched = launched
+    yield pool
+    pool.close()
+
+
+def test_hung_job_times_out_and_browser_is_recycled(pool):
+    release = threading.Event()
+
+    def hang(context):
+        # 드라이버가 종료되면 멈춘 sync 호출이 예외로 끝나는 상황을 흉내 냄
+        release.wait(5)
+        raise RuntimeError('Target closed')
+
+    original_kill = pool._kill
+
+    def kill(slot):
+        original_kill(slot)
+        release.set()
+
+    pool._kill = kill
+
+    with pytest.raises(TimeoutError):
+        pool.run(hang, timeout=0.2)
+
+    # 같은 스레드가 새 브라우저로 다음 작업을 처리
+    assert pool.run(lambda context: 'ok', timeout=5) == 'ok'
+    assert len(pool.launched) == 2 and pool.launched[0].killed
+    assert pool.stats()['timeouts'] == 1
+
+
+def test_queue_wait_does_not_count_toward_timeout(pool):
+    started = threading.Event()
+    release = threading.Event()
+
+    def busy(context):
+        started.set()
+        release.wait(5)
+        return 'first'
+
+    worker = threading.Thread(target=lambda: pool.run(busy))
+    worker.start()
+    started.wait(5)
+    threading.Timer(0.3, release.set).start()
+
+    # 앞 작업이 끝날 때까지 대기열에서 기다린 시간은 제한 시간에 포함되지 않음
+    assert pool.run(lambda context: 'second', timeout=0.2) == 'second'
+    worker.join()
+    assert len(pool.launched) == 1
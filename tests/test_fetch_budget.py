@@ -0,0 +1,63 @@
+import logging
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+import pytest
+import requests
+from urllib3.exceptions import ReadTimeoutError
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import host_latency  # noqa: E402
+from host_latency import HostLatencyTracker  # noqa: E402
+from http_session import SessionPool, is_read_timeout  # noqa: E402
+from job_monitoring_logic import JobMonitoringDAG  # noqa: E402
+from site_simulator import CareerSiteSimulator, SimulatorSettings  # noqa: E402
+from url_rewrite import UrlRewriter  # noqa: E402
+
+
+class _NoLimit:
+    def acquire(self, url):
+        pass
+
+
+@pytest.fixture
+def slow_simulator():
+    """모든 응답을 1.5초 뒤에 보내는 시뮬레이터 (오류/429/리다이렉트 없음)"""
+    settings = SimulatorSettings(latency='fixed:1500', error_rate=0, throttle_rate=0, redirect_rate=0, slow_drip_rate=0, page_kb=5)
+    simulator = CareerSiteSimulator(port=0, settings=settings).start()
+    yield simulator
+    simulator.stop()
+
+
+def test_budget_timeout_is_retried_at_ceiling(slow_simulator, tmp_path, monkeypatch):
+    monkeypatch.setitem(host_latency.MIN_TIMEOUT_SECONDS, 'static', 0.5)
+    url = 'https://careers.example.com/jobs'
+    latency = HostLatencyTracker(str(tmp_path / 'host_latency.json'), ceiling=5)
+    for _ in range(host_latency.MIN_SAMPLES):
+        latency.record(url, 0.05, 'static')
+    assert latency.timeout_for(url, 'static') == 0.5
+
+    session_pool = SessionPool(retries=3, backoff_factor=0, url_rewriter=UrlRewriter(slow_simulator.rewrite_template))
+    dag = SimpleNamespace(host_latency=latency, rate_limiter=_NoLimit(), session_pool=session_pool,
+                          logger=logging.getLogger(__name__))
+    try:
+        start = time.time()
+        response, html = JobMonitoringDAG._fetch_with_budget(dag, url, {})
+        elapsed = time.time() - start
+    finally:
+        session_pool.close()
+
+    assert response.status_code == 200 and html
+    # 적응형 제한 시간에서 한 번, 전체 제한 시간으로 한 번 (같은 제한 시간으로 반복하지 않음)
+    assert slow_simulator.stats().get('200', 0) <= 2
+    assert elapsed < 0.5 + 1.5 + 1.0
+    assert latency._budget_timeouts == 1
+
+
+def test_is_read_timeout_unwraps_connection_error():
+    wrapped = requests.exceptions.ConnectionError(ReadTimeoutError(None, 'http://x', 'Read timed out.'))
+    assert is_read_timeout(wrapped)
+    assert not is_read_timeout(requests.exceptions.ConnectionError('Connection refused'))
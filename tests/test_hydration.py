@@ -0,0 +1,39 @@
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from hydration import HydrationExtractor  # noqa: E402
+from parse_worker import extract_jobs  # noqa: E402
+
+LIST_HTML = ('<ul class="jobs">' + ''.join(f'<li><a class="t">{title}</a></li>' for title in
+             ['Backend Engineer', ' Data Engineer ', 'QA', 'Backend Engineer', 'Product Designer']) + '</ul>')
+
+
+def _next_data_page(titles):
+    payload = {'props': {'pageProps': {'jobs': [{'id': i, 'title': title} for i, title in enumerate(titles)]}}}
+    return f'<script id="__NEXT_DATA__" type="application/json">{json.dumps(payload)}</script>'
+
+
+def _extractor(tmp_path):
+    return HydrationExtractor(str(tmp_path / 'hydration_paths.json'), title_filter=lambda title: 'Engineer' in title or 'Designer' in title)
+
+
+def test_hydrated_titles_use_selector_normalization(tmp_path):
+    rendered = extract_jobs(LIST_HTML, 'ul.jobs a.t', [])['titles']
+    extractor = _extractor(tmp_path)
+    page = _next_data_page(['Backend Engineer', ' Data Engineer ', 'QA', 'Backend Engineer', 'Product Designer'])
+
+    assert extractor.extract('https://careers.example.com', page) is None  # 첫 실행은 렌더링으로 검증
+    assert sorted(extractor.candidate_titles('https://careers.example.com')) == sorted(rendered)
+    extractor.settle_candidate('https://careers.example.com', True)
+    assert sorted(extractor.extract('https://careers.example.com', page)) == sorted(rendered)
+
+
+def test_failure_keeps_existing_path(tmp_path):
+    extractor = _extractor(tmp_path)
+    extractor.store.set('https://careers.example.com', {'source': '__NEXT_DATA__', 'path': 'props.jobs.*.name', 'note': 'manual'})
+    assert extractor.extract('https://careers.example.com', '<html></html>') is None
+    entry = extractor.store.get('https://careers.example.com')
+    assert entry['path'] == 'props.jobs.*.name' and entry['note'] == 'manual' and entry['failed_at']
@@ -0,0 +1,153 @@
+import os
+import re
+import sys
+import time
+from urllib.parse import urlparse
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from analyze_titles import JobPostingSelectorAnalyzer  # noqa: E402
+from job_monitoring_logic import JobMonitoringDAG  # noqa: E402
+from render_mode import RenderModeManager  # noqa: E402
+from site_simulator import CareerSiteSimulator, SimulatorSettings, synthetic_companies, synthetic_page  # noqa: E402
+from utils import SeleniumRequirementChecker  # noqa: E402
+
+COMPANIES = 3
+PAGE_KB = 5
+JOB_LIST = re.compile(r'<ul class="job-list">.*?</ul>', re.DOTALL)
+
+
+class _FakeBrowserPool:
+    """브라우저 대신 렌더링이 끝난 페이지를 돌려주는 풀 (렌더링 횟수만 셈)"""
+
+    def __init__(self):
+        self.renders = 0
+
+    def run(self, fn, timeout=None):
+        self.renders += 1
+        return fn(None)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def simulator():
+    settings = SimulatorSettings(latency='fixed:0', error_rate=0, throttle_rate=0, redirect_rate=0, slow_drip_rate=0, page_kb=PAGE_KB)
+    simulator = CareerSiteSimulator(port=0, settings=settings).start()
+    yield simulator
+    simulator.stop()
+
+
+@pytest.fixture
+def client_rendered(simulator, monkeypatch):
+    """정적 응답에는 공고 목록이 비어 있고 스크립트가 렌더링해야 채워지는 사이트로 전환"""
+    page_body = simulator._page_body
+    monkeypatch.setattr(simulator, '_page_body', lambda url: JOB_LIST.sub('<ul class="job-list"></ul>', page_body(url)))
+
+
+@pytest.fixture
+def open_dag(simulator, tmp_path, monkeypatch):
+    monkeypatch.setenv('CRAWL_URL_REWRITE', simulator.rewrite_template)
+    for name in ('RATE_LIMIT_GLOBAL_RPS', 'RATE_LIMIT_GLOBAL_BURST', 'RATE_LIMIT_HOST_RPS', 'RATE_LIMIT_HOST_BURST'):
+        monkeypatch.setenv(name, '1000000')
+    monkeypatch.setenv('ASYNC_FETCH_PER_HOST', '0')
+    monkeypatch.setenv('SNAPSHOT_STORE', 'off')
+    monkeypatch.setenv('PARSE_PROCESSES', '0')
+    monkeypatch.setenv('RENDER_BACKEND', 'pool')
+    monkeypatch.setenv('RENDER_MODE_DEMOTE_AFTER', '2')
+    browser = _FakeBrowserPool()
+    dags = []
+
+    def open_dag():
+        dag = JobMonitoringDAG(str(tmp_path))
+        dag.selector_analyzer = JobPostingSelectorAnalyzer()
+        dag.selenium_checker = SeleniumRequirementChecker(validator_cache=dag.validator_cache, rate_limiter=dag.rate_limiter,
+                                                          session_pool=dag.session_pool, on_probe=dag._remember_probe)
+        dag.browser_pool = browser
+        dag._render_page = lambda context, url, *args, **kwargs: synthetic_page(urlparse(url).netloc, PAGE_KB)
+        dags.append(dag)
+        return dag
+
+    open_dag.browser = browser
+    open_dag.history = lambda: RenderModeManager(str(tmp_path / 'data' / 'render_mode_history.json'))
+    yield open_dag
+    for dag in dags:
+        dag.parse_pool.close()
+        dag.session_pool.close()
+
+
+def _make_due(open_dag):
+    """다음 실행에서 정적 재시험을 하도록 재시험 시각을 지난 시각으로 옮김"""
+    history = open_dag.history()
+    for url, _ in history.store.items():
+        history.store.update(url, next_retest_at=0)
+    history.save()
+
+
+def _days_until_retest(open_dag, url):
+    return (open_dag.history().store.get(url)['next_retest_at'] - time.time()) / 86400
+
+
+def test_static_miss_is_escalated_to_render(open_dag, client_rendered):
+    df, jobs, failed = open_dag().process_companies_integrated(synthetic_companies(COMPANIES))
+
+    # 정적 HTML에서 찾지 못한 URL만 렌더링으로 다시 수집하고 렌더링 대상으로 기록
+    assert not failed and len(jobs) == COMPANIES and all(jobs.values())
+    assert open_dag.browser.renders == COMPANIES
+    assert (df['selenium_required'] == 1).all()
+    history = open_dag.history()
+    for url in df['job_posting_url']:
+        assert history.mode(url) == 1
+        assert history.store.get(url)['history'][-1]['reason'] == 'escalate'
+
+    # 다음 실행은 정적 시도 없이 바로 렌더링
+    open_dag().process_companies_integrated(df)
+    assert open_dag.browser.renders == 2 * COMPANIES
+
+
+def test_static_success_does_not_escalate(open_dag):
+    df, jobs, failed = open_dag().process_companies_integrated(synthetic_companies(COMPANIES))
+    assert not failed and len(jobs) == COMPANIES
+    assert open_dag.browser.renders == 0
+    assert (df['selenium_required'] == 0).all()
+
+
+def test_render_target_is_demoted_after_consecutive_static_successes(open_dag):
+    df = synthetic_companies(COMPANIES)
+    df['selenium_required'] = 1
+    df, first_jobs, _ = open_dag().process_companies_integrated(df)
+    assert open_dag.browser.renders == COMPANIES
+
+    # 사이트가 서버 렌더링으로 바뀜: 정적 재시험이 이전 렌더링 결과와 같으면 렌더링을 생략하고
+    # RENDER_MODE_DEMOTE_AFTER(2)회 연속 성공하면 정적 수집으로 내림
+    _make_due(open_dag)
+    df, second_jobs, _ = open_dag().process_companies_integrated(df)
+    assert second_jobs == first_jobs
+    assert open_dag.browser.renders == COMPANIES
+    assert (df['selenium_required'] == 1).all()
+
+    df, third_jobs, _ = open_dag().process_companies_integrated(df)
+    assert third_jobs == first_jobs
+    assert open_dag.browser.renders == COMPANIES
+    assert (df['selenium_required'] == 0).all()
+    history = open_dag.history()
+    assert all(history.store.get(url)['history'][-1]['reason'] == 'demote' for url in df['job_posting_url'])
+
+
+def test_failed_static_retest_backs_off(open_dag, client_rendered):
+    df = synthetic_companies(COMPANIES)
+    df['selenium_required'] = 1
+    df, _, _ = open_dag().process_companies_integrated(df)
+    url = df['job_posting_url'].iloc[0]
+
+    # 정적 재시험이 실패할 때마다 다음 재시험까지 RENDER_MODE_RETEST_DAYS(7일)의 1배, 2배, 4배...
+    for expected_days in (7, 14, 28):
+        _make_due(open_dag)
+        df, jobs, failed = open_dag().process_companies_integrated(df)
+        assert not failed and all(jobs.values())
+        assert (df['selenium_required'] == 1).all()
+        assert _days_until_retest(open_dag, url) == pytest.approx(expected_days, abs=0.01)
+    assert open_dag.browser.renders == 4 * COMPANIES
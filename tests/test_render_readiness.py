@@ -0,0 +1,38 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from render_readiness import RenderReadinessDetector  # noqa: E402
+
+
+class _BusyPage:
+    """분석 비콘/폴링 때문에 네트워크 유휴 상태가 되지 않는 페이지"""
+
+    def __init__(self, selector_found=True):
+        self.selector_found = selector_found
+        self.calls = []
+
+    def wait_for_selector(self, selector, timeout):
+        self.calls.append(('selector', timeout))
+        if not self.selector_found:
+            raise TimeoutError(selector)
+
+    def wait_for_load_state(self, state, timeout):
+        self.calls.append((state, timeout))
+        raise TimeoutError(state)
+
+    def evaluate(self, script, args):
+        self.calls.append(('dom_quiet', args))
+
+
+def test_selector_found_skips_network_idle():
+    page = _BusyPage(selector_found=True)
+    RenderReadinessDetector(max_wait_ms=20000).wait(page, 'https://careers.example.com', '.job a')
+    assert [name for name, _ in page.calls] == ['selector', 'dom_quiet']
+
+
+def test_network_idle_has_its_own_cap():
+    page = _BusyPage(selector_found=False)
+    RenderReadinessDetector(max_wait_ms=20000, network_idle_ms=2500).wait(page, 'https://careers.example.com')
+    assert ('networkidle', 2500) in page.calls
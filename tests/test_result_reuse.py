@@ -0,0 +1,125 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from analyze_titles import JobPostingSelectorAnalyzer  # noqa: E402
+from job_monitoring_logic import JobMonitoringDAG  # noqa: E402
+from site_simulator import CareerSiteSimulator, SimulatorSettings, synthetic_companies  # noqa: E402
+from utils import SeleniumRequirementChecker  # noqa: E402
+
+COMPANIES = 5
+
+
+# 검증자를 무시하고 요청마다 CSRF 토큰/nonce가 바뀌는 서버
+NO_VALIDATORS = {'etag': False, 'volatile_tokens': True}
+
+
+@pytest.fixture
+def simulator(request):
+    """오류/429/리다이렉트 없는 시뮬레이터 (기본은 ETag 전송, indirect 파라미터로 설정 변경)"""
+    settings = SimulatorSettings(latency='fixed:0', error_rate=0, throttle_rate=0, redirect_rate=0, slow_drip_rate=0, page_kb=5,
+                                 **getattr(request, 'param', {}))
+    simulator = CareerSiteSimulator(port=0, settings=settings).start()
+    yield simulator
+    simulator.stop()
+
+
+@pytest.fixture
+def open_dag(simulator, tmp_path, monkeypatch):
+    """같은 작업 디렉터리를 쓰는 DAG를 실행마다 새로 만듦 (캐시는 data/ 아래 파일로만 이어짐)"""
+    monkeypatch.setenv('CRAWL_URL_REWRITE', simulator.rewrite_template)
+    for name in ('RATE_LIMIT_GLOBAL_RPS', 'RATE_LIMIT_GLOBAL_BURST', 'RATE_LIMIT_HOST_RPS', 'RATE_LIMIT_HOST_BURST'):
+        monkeypatch.setenv(name, '1000000')
+    monkeypatch.setenv('ASYNC_FETCH_PER_HOST', '0')
+    monkeypatch.setenv('SNAPSHOT_STORE', 'off')
+    monkeypatch.setenv('PARSE_PROCESSES', '0')
+    dags = []
+
+    def open_dag():
+        dag = JobMonitoringDAG(str(tmp_path))
+        dag.selector_analyzer = JobPostingSelectorAnalyzer()
+        dag.selenium_checker = SeleniumRequirementChecker(validator_cache=dag.validator_cache, rate_limiter=dag.rate_limiter,
+                                                          session_pool=dag.session_pool, on_probe=dag._remember_probe)
+        dags.append(dag)
+        return dag
+
+    yield open_dag
+    for dag in dags:
+        dag.browser_pool.close()
+        dag.parse_pool.close()
+        dag.session_pool.close()
+
+
+def _no_parse(*args, **kwargs):
+    raise AssertionError('변경 없는 페이지를 다시 파싱함')
+
+
+@pytest.mark.parametrize('engine', ['async', 'thread'])
+def test_not_modified_reuses_previous_titles_without_parsing(open_dag, simulator, monkeypatch, engine):
+    # async: 선수집 엔진의 304, thread: 작업 스레드의 get_html_content_for_crawling 304
+    monkeypatch.setenv('FETCH_ENGINE', engine)
+    _, first_jobs, failed = open_dag().process_companies_integrated(synthetic_companies(COMPANIES))
+    assert not failed and len(first_jobs) == COMPANIES
+    assert simulator.stats().get('304', 0) == 0
+
+    # 다음 실행: ETag로 조건부 요청 → 304 → 이전 결과를 파싱 없이 재사용
+    dag = open_dag()
+    monkeypatch.setattr(dag, '_extract_jobs', _no_parse)
+    _, second_jobs, failed = dag.process_companies_integrated(synthetic_companies(COMPANIES))
+    assert not failed
+    assert second_jobs == first_jobs
+    assert simulator.stats().get('304', 0) == COMPANIES
+
+
+def test_changed_selector_skips_conditional_request(open_dag, simulator):
+    open_dag().process_companies_integrated(synthetic_companies(COMPANIES))
+
+    # 선택자가 바뀌면 이전 결과를 쓸 수 없으므로 조건 없이 다시 받아 파싱
+    df = synthetic_companies(COMPANIES)
+    df['selector'] = 'ul.job-list a.job-title-link'
+    _, jobs, failed = open_dag().process_companies_integrated(df)
+    assert not failed and len(jobs) == COMPANIES
+    assert simulator.stats().get('304', 0) == 0
+
+
+@pytest.mark.parametrize('simulator', [NO_VALIDATORS], indirect=True)
+def test_same_content_hash_reuses_previous_titles_without_parsing(open_dag, simulator, monkeypatch):
+    _, first_jobs, _ = open_dag().process_companies_integrated(synthetic_companies(COMPANIES))
+    assert len(first_jobs) == COMPANIES
+
+    # 본문은 요청마다 토큰만 다름 → 휘발성 토큰을 제거한 지문이 같으므로 파싱 없이 재사용
+    dag = open_dag()
+    monkeypatch.setattr(dag, '_extract_jobs', _no_parse)
+    _, second_jobs, failed = dag.process_companies_integrated(synthetic_companies(COMPANIES))
+    assert not failed
+    assert second_jobs == first_jobs
+    assert simulator.stats().get('304', 0) == 0 and simulator.stats()['200'] == 2 * COMPANIES
+
+
+@pytest.mark.parametrize('simulator', [NO_VALIDATORS], indirect=True)
+def test_strict_content_hash_reparses_volatile_pages(open_dag, simulator, monkeypatch):
+    monkeypatch.setenv('CONTENT_HASH_MODE', 'strict')
+    open_dag().process_companies_integrated(synthetic_companies(COMPANIES))
+
+    dag = open_dag()
+    calls = []
+    extract_jobs = dag._extract_jobs
+    monkeypatch.setattr(dag, '_extract_jobs', lambda *args: calls.append(args[0]) or extract_jobs(*args))
+    _, jobs, failed = dag.process_companies_integrated(synthetic_companies(COMPANIES))
+    assert not failed and len(jobs) == COMPANIES
+    assert len(calls) == COMPANIES
+
+
+@pytest.mark.parametrize('simulator', [NO_VALIDATORS], indirect=True)
+def test_changed_content_is_parsed_again(open_dag, simulator, monkeypatch):
+    open_dag().process_companies_integrated(synthetic_companies(COMPANIES))
+
+    page_body = simulator._page_body
+    new_posting = '<li class="job-item"><a class="job-title-link" href="/jobs/new">신규 플랫폼 엔지니어</a></li></ul>'
+    monkeypatch.setattr(simulator, '_page_body', lambda url: page_body(url).replace('</ul>', new_posting, 1))
+    _, jobs, failed = open_dag().process_companies_integrated(synthetic_companies(COMPANIES))
+    assert not failed
+    assert all('신규 플랫폼 엔지니어' in titles for titles in jobs.values())
@@ -0,0 +1,48 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from snapshot_store import SnapshotStore  # noqa: E402
+
+
+def _run(store, run_id, pages):
+    store.start_run(run_id)
+    for url, html in pages.items():
+        store.stage(url, html)
+        store.record(url, companies=[url], selector='a.t', job_titles=['Backend Engineer'])
+    return store.finish_run()
+
+
+def test_compaction_keeps_objects_of_a_running_run(tmp_path):
+    # 두 DAG(프로세스)가 같은 저장소를 쓰는 상황: 각자 SnapshotStore를 가짐
+    morning = SnapshotStore(str(tmp_path), keep_runs=1, max_age_days=0)
+    evening = SnapshotStore(str(tmp_path), keep_runs=1, max_age_days=0)
+
+    _run(morning, '20260101-100000', {'https://a.example.com': '<p>old</p>'})
+    evening.start_run('20260101-190000')
+    digest = evening.stage('https://b.example.com', '<p>staged, not in any manifest yet</p>')
+
+    # 다른 실행이 끝나며 보존 정책/정리를 적용해도 진행 중인 실행의 객체는 남아야 함
+    _run(morning, '20260101-150000', {'https://a.example.com': '<p>new</p>'})
+    assert evening.get(digest) is not None
+
+    evening.record('https://b.example.com', companies=['b'], selector='a.t', job_titles=['Data Engineer'])
+    evening.finish_run()
+    assert evening.get(digest) is not None
+    assert not os.listdir(tmp_path / 'running')
+
+
+def test_index_updates_from_both_runs_are_kept(tmp_path):
+    first = SnapshotStore(str(tmp_path))
+    second = SnapshotStore(str(tmp_path))
+    first.start_run('20260101-100000')
+    second.start_run('20260101-100001')
+    for store, url in ((first, 'https://a.example.com'), (second, 'https://b.example.com')):
+        store.stage(url, f'<p>{url}</p>')
+        store.record(url, companies=[url], selector='a.t', job_titles=['Backend Engineer'])
+    first.finish_run()
+    second.finish_run()
+
+    index = SnapshotStore(str(tmp_path)).index
+    assert index.get('https://a.example.com') and index.get('https://b.example.com')
@@ -0,0 +1,68 @@
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from html_parser import BACKENDS, ParsedPage, resolve_backend  # noqa: E402
+from parse_worker import extract_jobs  # noqa: E402
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'career_pages')
+
+with open(os.path.join(FIXTURE_DIR, 'selectors.json'), encoding='utf-8') as f:
+    FIXTURE_SELECTORS = json.load(f)
+
+CASES = [(name, selector) for name, selectors in FIXTURE_SELECTORS.items() for selector in selectors]
+# 설치되지 않은 백엔드는 다른 백엔드로 대체되므로 실제로 쓰이는 백엔드만 비교
+INSTALLED_BACKENDS = [backend for backend in BACKENDS if resolve_backend(backend) == backend]
+
+
+def _load(name):
+    with open(os.path.join(FIXTURE_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+@pytest.mark.parametrize('backend', INSTALLED_BACKENDS)
+@pytest.mark.parametrize('name,selector', CASES)
+def test_targeted_parse_matches_full_parse(name, selector, backend):
+    html = _load(name)
+    full = extract_jobs(html, selector, [], backend=backend, targeted=False)
+    targeted = extract_jobs(html, selector, [], backend=backend, targeted=True)
+    assert full['titles'], f"{name}: '{selector}'가 전체 파싱에서 요소를 찾지 못함"
+    assert sorted(targeted['titles']) == sorted(full['titles'])
+
+
+@pytest.mark.parametrize('name,selector', CASES)
+def test_targeted_texts_match_element_by_element(name, selector):
+    html = _load(name)
+    # 제목 필터/중복 제거 전의 요소별 텍스트도 순서까지 같아야 함
+    assert ParsedPage(html, 'html.parser', target=selector).select_texts(selector) == ParsedPage(html, 'html.parser').select_texts(selector)
+
+
+@pytest.mark.parametrize('label', ['<svg><title>new</title></svg>', '<svg><text>HOT</text></svg>'])
+def test_inline_svg_text_is_kept(label):
+    html = f'<div><a class="t" href="/1">{label}Backend Engineer</a><a class="t" href="/2">Data Engineer</a></div>'
+    full = extract_jobs(html, 'a.t', [], targeted=False)
+    targeted = extract_jobs(html, 'a.t', [], targeted=True)
+    assert sorted(targeted['titles']) == sorted(full['titles'])
+
+
+def test_compat_compares_targeted_parse_with_full_parse():
+    html = _load('board_icons.html')
+    result = extract_jobs(html, '.opening a.t', [], compat=True, targeted=True)
+    assert 'mismatch' not in result
+    assert sorted(result['titles']) == sorted(extract_jobs(html, '.opening a.t', [], targeted=False)['titles'])
+
+
+@pytest.mark.parametrize('name,selector,expected', [
+    ('nested_postings.html', '.posting h5[data-qa=\'posting-name\']', True),
+    ('nested_postings.html', '#job-list li .job-name', True),
+    ('recruit_list.html', 'ul.recruit-list li a.tit', False),  # 스크립트 문자열의 닫는 태그로 수가 맞지 않으면 보수적으로 전체 파싱
+    ('board_icons.html', '.opening a.t', False),  # template 안의 공고는 전체 파싱에서 텍스트가 제외됨
+    ('table_unclosed.html', 'td.title a', False),  # 닫히지 않은 td가 뒤따르는 요소를 삼킴
+])
+def test_subtree_parse_is_used_only_when_safe(name, selector, expected):
+    page = ParsedPage(_load(name), 'html.parser', target=selector)
+    assert (page._strainer is not None) is expected
@@ -0,0 +1,149 @@
+import os
+import sys
+import time
+
+import pytest
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from analyze_titles import JobPostingSelectorAnalyzer  # noqa: E402
+from job_monitoring_logic import JobMonitoringDAG  # noqa: E402
+from site_simulator import CareerSiteSimulator, SimulatorSettings, synthetic_companies  # noqa: E402
+from url_health import BASE_DELAY_DAYS, UrlHealthTracker, classify_failure  # noqa: E402
+from utils import SeleniumRequirementChecker  # noqa: E402
+
+COMPANIES = 2
+
+
+class _SimulatorBrowserPool:
+    """브라우저 대신 시뮬레이터 응답을 그대로 돌려주는 풀 (실패하는 사이트는 렌더링도 실패)"""
+
+    def run(self, fn, timeout=None):
+        return fn(None)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def simulator():
+    """모든 페이지 요청에 500을 보내는 시뮬레이터 (settings.error_rate로 복구 가능)"""
+    settings = SimulatorSettings(latency='fixed:0', error_rate=1, throttle_rate=0, redirect_rate=0, slow_drip_rate=0, page_kb=5)
+    simulator = CareerSiteSimulator(port=0, settings=settings).start()
+    yield simulator
+    simulator.stop()
+
+
+@pytest.fixture
+def open_dag(simulator, tmp_path, monkeypatch):
+    monkeypatch.setenv('CRAWL_URL_REWRITE', simulator.rewrite_template)
+    for name in ('RATE_LIMIT_GLOBAL_RPS', 'RATE_LIMIT_GLOBAL_BURST', 'RATE_LIMIT_HOST_RPS', 'RATE_LIMIT_HOST_BURST'):
+        monkeypatch.setenv(name, '1000000')
+    monkeypatch.setenv('ASYNC_FETCH_PER_HOST', '0')
+    monkeypatch.setenv('SNAPSHOT_STORE', 'off')
+    monkeypatch.setenv('PARSE_PROCESSES', '0')
+    monkeypatch.setenv('RENDER_BACKEND', 'pool')
+    monkeypatch.setenv('URL_REPROBE_MAX_DAYS', '2')
+    dags = []
+
+    def open_dag():
+        dag = JobMonitoringDAG(str(tmp_path))
+        dag.session_pool.backoff_factor = 0  # 5xx 재시도 사이에 기다리지 않음
+        dag.selector_analyzer = JobPostingSelectorAnalyzer()
+        dag.selenium_checker = SeleniumRequirementChecker(validator_cache=dag.validator_cache, rate_limiter=dag.rate_limiter,
+                                                          session_pool=dag.session_pool, on_probe=dag._remember_probe)
+        dag.browser_pool = _SimulatorBrowserPool()
+        dag._render_page = lambda context, url, *args, **kwargs: _render(dag, url)
+        dags.append(dag)
+        return dag
+
+    open_dag.health = lambda: UrlHealthTracker(str(tmp_path / 'data' / 'url_health.json'))
+    yield open_dag
+    for dag in dags:
+        dag.browser_pool.close()
+        dag.parse_pool.close()
+        dag.session_pool.close()
+
+
+def _render(dag, url):
+    response = requests.get(dag.url_rewriter(url), timeout=5)
+    response.raise_for_status()
+    return response.text
+
+
+def _make_due(open_dag):
+    """다음 실행에서 다시 시도하도록 재시도 시각을 지난 시각으로 옮김"""
+    health = open_dag.health()
+    for url, _ in health.store.items():
+        health.store.update(url, next_probe_at=0)
+    health.save()
+
+
+def _page_requests(simulator):
+    return sum(simulator.stats().values())
+
+
+def test_failing_url_waits_for_its_backoff_schedule(open_dag, simulator):
+    df, jobs, failed = open_dag().process_companies_integrated(synthetic_companies(COMPANIES))
+    assert not jobs and len(failed) == COMPANIES
+    assert (df['selenium_required'] == -1).all()
+    url = df['job_posting_url'].iloc[0]
+
+    # 5xx는 일시적 실패: 0.5일 뒤부터, 연속 실패마다 두 배, URL_REPROBE_MAX_DAYS(2일)까지
+    schedule = []
+    for _ in range(4):
+        entry = open_dag.health().store.get(url)
+        assert entry['kind'] == 'http_5xx' and not entry['permanent']
+        schedule.append(round((entry['next_probe_at'] - time.time()) / 86400, 2))
+
+        # 재시도 시각 전에는 요청하지 않음
+        requests_before = _page_requests(simulator)
+        df, jobs, failed = open_dag().process_companies_integrated(df)
+        assert _page_requests(simulator) == requests_before
+        assert not jobs and not failed
+
+        _make_due(open_dag)
+        df, _, _ = open_dag().process_companies_integrated(df)
+        assert _page_requests(simulator) > requests_before
+        assert (df['selenium_required'] == -1).all()
+
+    assert schedule == [0.5, 1, 2, 2]
+    assert open_dag.health().store.get(url)['failures'] == 5
+
+
+def test_recovered_url_returns_to_normal(open_dag, simulator):
+    df, _, _ = open_dag().process_companies_integrated(synthetic_companies(COMPANIES))
+    assert (df['selenium_required'] == -1).all()
+
+    simulator.settings.error_rate = 0
+    _make_due(open_dag)
+    df, jobs, failed = open_dag().process_companies_integrated(df)
+    assert not failed and len(jobs) == COMPANIES and all(jobs.values())
+    assert df['selenium_required'].isin([0, 1]).all()
+    assert not list(open_dag.health().store.items())
+
+
+@pytest.mark.parametrize('status,error,kind', [
+    (404, None, 'http_4xx'),
+    (503, None, 'http_5xx'),
+    (429, None, 'throttled'),
+    (None, 'HTTPSConnectionPool: Max retries exceeded (Caused by NameResolutionError)', 'dns'),
+    (None, 'SSLError: CERTIFICATE_VERIFY_FAILED', 'tls'),
+    (None, 'Page.goto: Timeout 20000ms exceeded.', 'timeout'),
+])
+def test_classify_failure(status, error, kind):
+    assert classify_failure(status, error) == kind
+
+
+def test_permanent_failure_waits_longer(tmp_path):
+    health = UrlHealthTracker(str(tmp_path / 'url_health.json'))
+    health.note_failure('https://a.example.com', 'dns')
+    health.note_failure('https://b.example.com', 'timeout')
+    dns = health.record_failure('https://a.example.com', -1)
+    timeout = health.record_failure('https://b.example.com', -1)
+    selector_miss = health.record_failure('https://c.example.com', -2)
+
+    assert dns['permanent'] and selector_miss['permanent'] and not timeout['permanent']
+    assert dns['next_probe_at'] - time.time() == pytest.approx(BASE_DELAY_DAYS['dns'] * 86400, abs=60)
+    assert timeout['next_probe_at'] - time.time() == pytest.approx(BASE_DELAY_DAYS['timeout'] * 86400, abs=60)